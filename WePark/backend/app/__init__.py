@@ -23,25 +23,14 @@ def app_creator(MyConfig):
     jwt.init_app(app)
     mail.init_app(app)
     cache.init_app(app)
-    CORS(app,  supports_credentials=True)
+    CORS(app,  supports_credentials=True, expose_headers=["X-Next-Cursor"])
     
-    from .models import Admin,User,Lot,Spot,Reservation, Notification
+    # Registers the models on db.metadata. Startup does no database I/O:
+    # tables and the admin account come from `flask init-db` and
+    # `flask create-admin`, and spot availability loads lazily per lot
+    from .models import Admin,User,Lot,Spot,Reservation, Notification, DailyLotUsage
 
-    with app.app_context():
-        db.create_all()
-
-        if not Admin.query.filter_by(username="admin").first():
-            admin = Admin(username = "admin", email="admin@wepark.com")
-            admin.hash_password("admin123")
-            db.session.add(admin)
-            db.session.commit()
-
-        
-    
-        
-
-
-    from .api import  SignupApi, LoginApi, LotApi, SpotApi, ReservationApi, UserApi, PaymentApi, StatsApi, NotificationApi, ExportApi
+    from .api import  SignupApi, LoginApi, LotApi, SpotApi, ReservationApi, UserApi, PaymentApi, StatsApi, NotificationApi, ExportApi, ReservationExportApi
     
     api.add_resource(SignupApi, "/api/signup")
     api.add_resource(LoginApi, "/api/login")
@@ -52,8 +41,17 @@ def app_creator(MyConfig):
     api.add_resource(PaymentApi, "/api/payment")
     api.add_resource(StatsApi, "/api/stats")
     api.add_resource(NotificationApi, "/api/notification")
-    api.add_resource(ExportApi, "/api/export")
+    api.add_resource(ExportApi, "/api/export", "/api/export/<string:action>")
+    api.add_resource(ReservationExportApi, "/api/export/reservations")
+    
+    from .commands import register_commands
+    register_commands(app)
     
+    from .utils.metrics import init_metrics
+    from .utils.query_budget import init_query_budgets
+    init_metrics(app)
+    init_query_budgets(app)
+
     @app.route('/')
     def index():
         return {"message": "WePark API is running", "version": "1.0.0"}
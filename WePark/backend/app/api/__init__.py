@@ -7,4 +7,4 @@ from .reservation import ReservationApi
 from .payment import PaymentApi
 from .stats import StatsApi
 from .notification import NotificationApi
-from .export import ExportApi
\ No newline at end of file
+from .export import ExportApi, ReservationExportApi
\ No newline at end of file
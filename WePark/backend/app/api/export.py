@@ -1,17 +1,89 @@
+from datetime import timedelta
+from flask import Response, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from ..utils.decorators import role_required
-from ..utils.task import export_user_usage_csv
+from ..utils.current_user import get_current_user
+from ..utils.datetime_helpers import parse_date
+from ..utils.task import export_user_usage_csv, export_reservations
+from ..services.export_service import ExportService
+from ..utils.query_budget import query_budget
 from flask_restful import Resource
-from ..models import User
+from ..models import Admin
 
 class ExportApi(Resource):
     @jwt_required()
     @role_required("user")
-    def get(self):
-        username = get_jwt_identity()
-        user = User.query.filter_by(username=username).first()
+    @query_budget(max_statements=3)
+    def get(self, action=None):
+        user = get_current_user()
+        if not user:
+            return {"message": "User not found"}, 404
+        
+        if action == "download":
+            # Same generator as the emailed export, streamed straight to the client
+            chunks = ExportService().iter_user_usage_csv(user.user_id)
+            return Response(
+                stream_with_context(chunks),
+                mimetype="text/csv",
+                headers={"Content-Disposition": "attachment; filename=reservation_records.csv"}
+            )
+        if action is not None:
+            return {"message": "Unknown export action"}, 404
+        
         result = export_user_usage_csv.delay(user.user_id, user.email)
         return {"message":"CSV will be send Soon", "result_id":result.id}, 200
+
+
+class ReservationExportApi(Resource):
+    @jwt_required()
+    @role_required("admin")
+    @query_budget(max_statements=3)
+    def get(self):
+        """
+        Export reservations across all users
+        
+        Query params: format (csv|ndjson), from/to (YYYY-MM-DD, inclusive,
+        on parking time), lot_id, and email=true to have a Celery worker
+        mail the file instead of streaming it.
         
+        Returns:
+            200: Streamed export, or the queued task ID
+            400: Invalid parameters
+        """
+        export_format = request.args.get("format", "csv")
+        if export_format not in ExportService.FORMATS:
+            return {"message": f"format must be one of {', '.join(ExportService.FORMATS)}"}, 400
+        try:
+            start = parse_date(request.args.get("from"))
+            end = parse_date(request.args.get("to"))
+        except ValueError:
+            return {"message": "from and to must be YYYY-MM-DD dates"}, 400
+        if end is not None:
+            end += timedelta(days=1)
+        lot_id = request.args.get("lot_id")
+        if lot_id is not None:
+            if not lot_id.isdigit():
+                return {"message": "lot_id must be an integer"}, 400
+            lot_id = int(lot_id)
         
-        
\ No newline at end of file
+        if request.args.get("email", "false").lower() == "true":
+            admin = Admin.query.filter_by(username=get_jwt_identity()).first()
+            result = export_reservations.delay(
+                admin.email, export_format,
+                start.isoformat() if start else None, end.isoformat() if end else None, lot_id
+            )
+            return {"message": "Export will be sent soon", "result_id": result.id}, 200
+        
+        export_service = ExportService()
+        chunks = export_service.iter_reservations(export_format, start=start, end=end, lot_id=lot_id)
+        extension, content_type = ExportService.FORMATS[export_format]
+        if export_format == "csv":
+            # CSV is sent gzipped; NDJSON stays line-readable while it streams
+            chunks = export_service.iter_gzip(chunks)
+            extension, content_type = f"{extension}.gz", "application/gzip"
+        return Response(
+            stream_with_context(chunks),
+            mimetype=content_type,
+            headers={"Content-Disposition": f"attachment; filename=reservations.{extension}"}
+        )
+
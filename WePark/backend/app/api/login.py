@@ -4,7 +4,8 @@ from flask_restful import Resource
 from flask import request, jsonify, make_response
 from flask_jwt_extended import set_access_cookies
 from ..services.auth_service import AuthService
-from ..utils.validators import check_email_format
+from ..utils.passwords import PasswordPoolBusy
+from ..utils.query_budget import query_budget
 
 
 class LoginApi(Resource):
@@ -13,6 +14,7 @@ class LoginApi(Resource):
     def __init__(self):
         self.auth_service = AuthService()
     
+    @query_budget(max_statements=3)
     def post(self):
         """
         Authenticate user or admin
@@ -25,6 +27,7 @@ class LoginApi(Resource):
             200: Login successful with JWT cookie
             401: Invalid credentials
             400: Missing required fields
+            503: Password hashing queue is full
         """
         data = request.get_json()
         user_or_mail = data.get("user_or_mail")
@@ -38,36 +41,14 @@ class LoginApi(Resource):
         
         user_or_mail = user_or_mail.lower()
         
-        # Determine if input is email or username
-        is_email = check_email_format(user_or_mail)
+        # One lookup across admins and users (admins win on a clash)
+        try:
+            result = self.auth_service.login(user_or_mail, password)
+        except PasswordPoolBusy:
+            return {'message': 'Too many logins in progress, please try again'}, 503, {'Retry-After': '1'}
+        if result['success']:
+            return self._create_response(result)
         
-        # Try admin login first, then user login
-        if is_email:
-            # For email, we need to get username first for token identity
-            # Try admin by email
-            admin_details = self.auth_service.get_admin_by_username(user_or_mail) if not is_email else None
-            if not admin_details and is_email:
-                # Get admin by email - need to check both
-                result = self.auth_service.login_admin(user_or_mail, password)
-                if result['success']:
-                    return self._create_response(result)
-            
-            # Try user by email
-            result = self.auth_service.login_user(user_or_mail, password)
-            if result['success']:
-                return self._create_response(result)
-        else:
-            # Try admin login by username
-            result = self.auth_service.login_admin(user_or_mail, password)
-            if result['success']:
-                return self._create_response(result)
-            
-            # Try user login by username
-            result = self.auth_service.login_user(user_or_mail, password)
-            if result['success']:
-                return self._create_response(result)
-        
-        # If we get here, login failed
         return {'message': 'Invalid username or password'}, 401
     
     def _create_response(self, auth_result: dict):
@@ -5,7 +5,17 @@ from flask import request
 from flask_jwt_extended import jwt_required
 from ..services.lot_service import LotService
 from ..utils.decorators import role_required
-from .. import cache
+from ..utils.cache_helpers import tagged_cached, invalidate_lot, lot_tag, LOTS_TAG
+from ..utils.query_budget import query_budget
+
+
+def _lot_key_tags(lot_id=None):
+    return [LOTS_TAG] if lot_id is None else [lot_tag(lot_id)]
+
+
+def _lot_data_tags(data):
+    lots = data if isinstance(data, list) else [data]
+    return [lot_tag(lot['lot_id']) for lot in lots]
 
 
 class LotApi(Resource):
@@ -16,6 +26,7 @@ class LotApi(Resource):
     
     @jwt_required()
     @role_required("admin")
+    @query_budget(max_statements=6)
     def post(self):
         """
         Create a new parking lot
@@ -32,7 +43,6 @@ class LotApi(Resource):
             400: Validation error
             500: Server error
         """
-        cache.clear()
         data = request.get_json()
         
         # Extract and validate fields
@@ -64,12 +74,14 @@ class LotApi(Resource):
         )
         
         if result['success']:
+            invalidate_lot()
             return {"message": result['message']}, 201
         else:
             return {"message": result['message']}, 500
     
     @jwt_required()
-    @cache.cached(timeout=60, query_string=True)
+    @tagged_cached(timeout=60, key_tags=_lot_key_tags, data_tags=_lot_data_tags)
+    @query_budget(max_statements=4)
     def get(self, lot_id=None):
         """
         Get parking lot(s)
@@ -113,6 +125,7 @@ class LotApi(Resource):
 
     @jwt_required()
     @role_required("admin")
+    @query_budget(max_statements=10)
     def put(self, lot_id):
         """
         Update parking lot details
@@ -131,7 +144,6 @@ class LotApi(Resource):
             404: Lot not found
             500: Server error
         """
-        cache.clear()
         data = request.get_json()
         
         # Update lot using service
@@ -140,6 +152,7 @@ class LotApi(Resource):
         #result = self.lot_service.update_lot(lot_id, **data)
         
         if result['success']:
+            invalidate_lot(lot_id)
             return {"message": result['message']}, 200
         else:
             status_code = 404 if 'not found' in result['message'].lower() else 500
@@ -147,6 +160,7 @@ class LotApi(Resource):
 
     @jwt_required()
     @role_required("admin")
+    @query_budget(max_statements=10)
     def delete(self, lot_id):
         """
         Delete a parking lot
@@ -159,12 +173,11 @@ class LotApi(Resource):
             400: Cannot delete (spots occupied) or lot not found
             500: Server error
         """
-        cache.clear()
-        
         # Delete lot using service
         result = self.lot_service.delete_lot(lot_id)
         
         if result['success']:
+            invalidate_lot(lot_id, result['spot_ids'])
             return {"message": result['message']}, 200
         else:
             return {"message": result['message']}, 400
\ No newline at end of file
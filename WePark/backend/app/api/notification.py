@@ -2,8 +2,11 @@
 
 from flask_restful import Resource
 from flask import request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from ..services.notification_service import NotificationService
+from ..utils.current_user import get_current_user
+from ..utils.pagination import get_page_args, next_cursor_headers
+from ..utils.query_budget import query_budget
 
 
 class NotificationApi(Resource):
@@ -13,20 +16,27 @@ class NotificationApi(Resource):
         self.notification_service = NotificationService()
     
     @jwt_required()
+    @query_budget(max_statements=3)
     def get(self):
         """
         Get user's notifications
         
         Query Parameters:
             unread: If true, return only unread notifications
+            limit: Optional page size
+            after: notification_id of the last row of the previous page
             
         Returns:
-            200: List of notifications
+            200: List of notifications, newest first (X-Next-Cursor header if more pages)
+            400: Invalid pagination parameters
         """
+        try:
+            limit, after = get_page_args()
+        except ValueError as e:
+            return {"message": str(e)}, 400
+        
         # Get user from JWT
-        identity = get_jwt_identity()
-        from ..models import User
-        user = User.query.filter_by(username=identity).first()
+        user = get_current_user()
         
         if not user:
             return {"message": "User not found"}, 404
@@ -36,12 +46,15 @@ class NotificationApi(Resource):
         
         notifications = self.notification_service.get_user_notifications(
             user_id=user.user_id,
-            unread_only=unread_only
+            unread_only=unread_only,
+            limit=limit,
+            after=after
         )
         
-        return notifications, 200
+        return notifications, 200, next_cursor_headers(notifications, 'notification_id', limit)
     
     @jwt_required()
+    @query_budget(max_statements=4)
     def post(self):
         """
         Mark notification(s) as read
@@ -59,9 +72,7 @@ class NotificationApi(Resource):
         mark_all = data.get("mark_all", False)
         
         # Get user from JWT
-        identity = get_jwt_identity()
-        from ..models import User
-        user = User.query.filter_by(username=identity).first()
+        user = get_current_user()
         
         if not user:
             return {"message": "User not found"}, 404
@@ -79,6 +90,7 @@ class NotificationApi(Resource):
             return {"message": result['message']}, 400
     
     @jwt_required()
+    @query_budget(max_statements=3)
     def delete(self, notification_id):
         """
         Delete a notification
@@ -4,6 +4,7 @@ from flask import request
 from flask_restful import Resource
 from flask_jwt_extended import jwt_required
 from ..services.payment_service import PaymentService
+from ..utils.query_budget import query_budget
 from datetime import datetime
 
 
@@ -14,6 +15,7 @@ class PaymentApi(Resource):
         self.payment_service = PaymentService()
     
     @jwt_required()
+    @query_budget(max_statements=6)
     def post(self):
         """
         Process a payment
@@ -68,6 +70,7 @@ class PaymentApi(Resource):
             return {"message": result['message']}, 400
     
     @jwt_required()
+    @query_budget(max_statements=4)
     def get(self):
         """
         Verify a payment OR Get payment details for reservation
@@ -2,10 +2,13 @@
 
 from flask_restful import Resource
 from flask import request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt
 from ..services.reservation_service import ReservationService
 from ..services.payment_service import PaymentService
-from .. import cache
+from ..utils.cache_helpers import invalidate_spot, invalidate_user
+from ..utils.current_user import get_current_user
+from ..utils.pagination import get_page_args, next_cursor_headers
+from ..utils.query_budget import query_budget
 from .. import db
 
 
@@ -17,38 +20,41 @@ class ReservationApi(Resource):
         self.payment_service = PaymentService()
     
     @jwt_required()
+    @query_budget(max_statements=4)
     def get(self):
         """
         Get user's reservations
         
         Query Parameters:
             active: If true, return only active reservations
+            limit: Page size (empty for API_PAGE_SIZE_DEFAULT)
+            after: reservation_id of the last row of the previous page
             
         Returns:
-            200: List of reservations
+            200: List of reservations (X-Next-Cursor header if more pages)
+            400: Invalid pagination parameters
         """
-        # Get user from JWT
-        identity = get_jwt_identity()
-        from ..models import User
-        from flask_jwt_extended import get_jwt
-        
         claims = get_jwt()
         role = claims.get('role')
         
+        try:
+            limit, after = get_page_args()
+        except ValueError as e:
+            return {"message": str(e)}, 400
+        
         if role == 'admin':
             # Admin can see all reservations
             # If payment_status filter is present
             payment_status = request.args.get('payment_status')
-            if payment_status:
-                is_paid = payment_status.lower() == 'true'
-                reservations = self.reservation_service.reservation_repo.find_by_payment_status(is_paid)
-            else:
-                reservations = self.reservation_service.reservation_repo.get_all()
+            is_paid = payment_status.lower() == 'true' if payment_status else None
+            reservations = self.reservation_service.reservation_repo.find_all_with_users(
+                is_paid, limit=limit, after=after
+            )
             
             # Serialize reservations with user details for admin
             serialized = []
             for res in reservations:
-                user = self.reservation_service.user_repo.get_by_id(res.user_id)
+                user = res.user
                 serialized.append({
                     'reservation_id': res.reservation_id,
                     'user_id': res.user_id,
@@ -61,9 +67,9 @@ class ReservationApi(Resource):
                     'vehicle_number': res.vehicle_number,
                     'payment_status': res.payment_status
                 })
-            return serialized, 200
+            return serialized, 200, next_cursor_headers(serialized, 'reservation_id', limit)
             
-        user = User.query.filter_by(username=identity).first()
+        user = get_current_user()
         
         if not user:
             return {"message": "User not found"}, 404
@@ -73,12 +79,15 @@ class ReservationApi(Resource):
         
         reservations = self.reservation_service.get_user_reservations(
             user_id=user.user_id,
-            active_only=active_only
+            active_only=active_only,
+            limit=limit,
+            after=after
         )
         
-        return reservations, 200
+        return reservations, 200, next_cursor_headers(reservations, 'reservation_id', limit)
     
     @jwt_required()
+    @query_budget(max_statements=16)
     def post(self, spot_id=None):
         """
         Book a parking spot OR Release a parking spot
@@ -90,15 +99,11 @@ class ReservationApi(Resource):
             200: Success
             400: Error
         """
-        cache.clear()
-        
         # Get request data
         data = request.get_json() or {}
         
         # Get user identity
-        identity = get_jwt_identity()
-        from ..models import User
-        user = User.query.filter_by(username=identity).first()
+        user = get_current_user()
         
         if not user:
             return {"message": "User not found"}, 404
@@ -115,6 +120,8 @@ class ReservationApi(Resource):
             )
             
             if result['success']:
+                invalidate_spot(result['lot_id'], result['spot_id'])
+                invalidate_user(user.user_id)
                 return result, 200
             else:
                 return {"message": result['message']}, 400
@@ -124,24 +131,16 @@ class ReservationApi(Resource):
         if lot_id:
             vehicle_number = data.get("vehicle_number", "Unknown")
             
-            # Find first available spot in the lot
-            from ..models import Spot
-            available_spot = Spot.query.filter_by(
-                lot_id=lot_id,
-                status=True
-            ).first()
-            
-            if not available_spot:
-                return {"message": "No available spots in this parking lot"}, 400
-            
             # Create reservation with auto-allocated spot
-            result = self.reservation_service.create_reservation(
+            result = self.reservation_service.create_reservation_in_lot(
                 user_id=user.user_id,
-                spot_id=available_spot.spot_id,
+                lot_id=lot_id,
                 vehicle_number=vehicle_number
             )
             
             if result['success']:
+                invalidate_spot(result['lot_id'], result['spot_id'])
+                invalidate_user(user.user_id)
                 return result, 200
             else:
                 return {"message": result['message']}, 400
@@ -157,6 +156,9 @@ class ReservationApi(Resource):
         result = self.reservation_service.complete_reservation(reservation_id)
         
         if result['success']:
+            invalidate_spot(result['lot_id'], result['spot_id'])
+            invalidate_user(result['user_id'])
+            
             # Process payment if payment_id provided
             if payment_id:
                 payment_result = self.payment_service.process_mock_payment(
@@ -182,6 +184,7 @@ class ReservationApi(Resource):
             return {"message": result['message']}, 400
 
     @jwt_required()
+    @query_budget(max_statements=5)
     def put(self, reservation_id=None):
         """
         Update reservation (e.g. mark as parked)
@@ -190,17 +193,11 @@ class ReservationApi(Resource):
             return {"message": "reservation_id is required"}, 400
             
         # Handle "Occupy" action - set parking_timestamp
-        from datetime import datetime
-        from ..models import Reservation
+        result = self.reservation_service.occupy_reservation(reservation_id)
+        if not result['success']:
+            status_code = 404 if 'not found' in result['message'].lower() else 400
+            return {"message": result['message']}, status_code
         
-        reservation = Reservation.query.get(reservation_id)
-        if not reservation:
-            return {"message": "Reservation not found"}, 404
-            
-        if reservation.parking_timestamp:
-            return {"message": "Spot already occupied"}, 400
-            
-        reservation.parking_timestamp = datetime.now()
-        db.session.commit()
+        invalidate_user(result['user_id'])
         
-        return {"message": "Spot occupied successfully", "parking_time": reservation.parking_timestamp.isoformat()}, 200
\ No newline at end of file
+        return {"message": result['message'], "parking_time": result['parking_time'].isoformat()}, 200
\ No newline at end of file
@@ -3,7 +3,9 @@
 from flask_restful import Resource
 from flask import request
 from ..services.auth_service import AuthService
+from ..utils.passwords import PasswordPoolBusy
 from ..utils.validators import check_email_format, check_username_format
+from ..utils.query_budget import query_budget
 
 
 class SignupApi(Resource):
@@ -12,6 +14,7 @@ class SignupApi(Resource):
     def __init__(self):
         self.auth_service = AuthService()
     
+    @query_budget(max_statements=6)
     def post(self):
         """
         Register a new user
@@ -28,6 +31,7 @@ class SignupApi(Resource):
             200: Registration successful
             400: Validation error
             500: Server error
+            503: Password hashing queue is full
         """
         data = request.get_json()
         email = data.get("email")
@@ -68,13 +72,16 @@ class SignupApi(Resource):
             return {'message': 'Password and Confirm Password must be same!'}, 400
 
         # Register user using service
-        result = self.auth_service.register_user(
-            username=username,
-            email=email,
-            password=password,
-            address=address,
-            pincode=pincode
-        )
+        try:
+            result = self.auth_service.register_user(
+                username=username,
+                email=email,
+                password=password,
+                address=address,
+                pincode=pincode
+            )
+        except PasswordPoolBusy:
+            return {'message': 'Too many signups in progress, please try again'}, 503, {'Retry-After': '1'}
         
         if result['success']:
             return {'message': result['message']}, 200
@@ -2,11 +2,13 @@
 
 from flask_restful import Resource
 from flask import request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from ..services.spot_service import SpotService
 from ..services.reservation_service import ReservationService
 from ..utils.decorators import role_required
-from .. import cache
+from ..utils.cache_helpers import tagged_cached, invalidate_spot, invalidate_user, spot_tag
+from ..utils.current_user import get_current_user
+from ..utils.query_budget import query_budget
 
 
 class SpotApi(Resource):
@@ -17,6 +19,7 @@ class SpotApi(Resource):
         self.reservation_service = ReservationService()
     
     @jwt_required()
+    @query_budget(max_statements=12)
     def post(self):
         """
         Book a parking spot
@@ -29,7 +32,6 @@ class SpotApi(Resource):
             400: Validation error or spot unavailable
             500: Server error
         """
-        cache.clear()
         data = request.get_json()
         spot_id = data.get("spot_id")
         
@@ -37,9 +39,7 @@ class SpotApi(Resource):
             return {"message": "spot_id is required!"}, 400
         
         # Get user ID from JWT
-        identity = get_jwt_identity()
-        from ..models import User
-        user = User.query.filter_by(username=identity).first()
+        user = get_current_user()
         
         if not user:
             return {"message": "User not found"}, 404
@@ -51,12 +51,15 @@ class SpotApi(Resource):
         )
         
         if result['success']:
+            invalidate_spot(result['lot_id'], result['spot_id'])
+            invalidate_user(user.user_id)
             return {"message": result['message']}, 200
         else:
             return {"message": result['message']}, 400
     
     @jwt_required()
-    @cache.cached(timeout=120, query_string=True)  # Cache for 2 minutes
+    @tagged_cached(timeout=120, key_tags=lambda spot_id=None: [spot_tag(spot_id)])  # Cache for 2 minutes
+    @query_budget(max_statements=2)
     def get(self, spot_id=None):
         """
         Get spot details or availability
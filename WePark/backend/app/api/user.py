@@ -5,6 +5,8 @@ from flask import request
 from flask_jwt_extended import jwt_required
 from ..services.user_service import UserService
 from ..utils.decorators import role_required
+from ..utils.pagination import get_page_args, next_cursor_headers
+from ..utils.query_budget import query_budget
 
 
 class UserApi(Resource):
@@ -14,6 +16,7 @@ class UserApi(Resource):
         self.user_service = UserService()
     
     @jwt_required()
+    @query_budget(max_statements=3)
     def get(self, user_id=None):
         """
         Get user(s) information
@@ -21,8 +24,13 @@ class UserApi(Resource):
         Args:
             user_id: Optional user ID for specific user
             
+        Query Parameters:
+            limit: Page size for the admin user list (empty for API_PAGE_SIZE_DEFAULT)
+            after: user_id of the last row of the previous page
+            
         Returns:
-            200: User details
+            200: User details (X-Next-Cursor header if more pages)
+            400: Invalid pagination parameters
             403: Forbidden (user trying to access another user's profile)
             404: User not found
         """
@@ -42,8 +50,12 @@ class UserApi(Resource):
                     return {"message": "User not found"}, 404
             else:
                 # Get all users
-                users = self.user_service.get_all_users()
-                return users, 200
+                try:
+                    limit, after = get_page_args()
+                except ValueError as e:
+                    return {"message": str(e)}, 400
+                users = self.user_service.get_all_users(limit=limit, after=after)
+                return users, 200, next_cursor_headers(users, 'user_id', limit)
         
         # Regular user can only view their own profile
         if user_id:
@@ -66,6 +78,7 @@ class UserApi(Resource):
     
     @jwt_required()
     @role_required("admin")
+    @query_budget(max_statements=11)
     def delete(self, user_id):
         """
         Delete a user
@@ -87,6 +100,7 @@ class UserApi(Resource):
             return {"message": result['message']}, status_code
     
     @jwt_required()
+    @query_budget(max_statements=4)
     def put(self, user_id):
         """
         Update user profile
@@ -0,0 +1,173 @@
+# WePark/backend/app/commands.py
+"""
+CLI Commands - Database maintenance
+Registered on the Flask app, run with `flask --app run <command>`
+"""
+
+import click
+import random
+import time
+from datetime import timedelta
+from flask import Flask
+from flask.cli import with_appcontext
+from sqlalchemy import inspect, text
+from . import db
+
+
+def _add_missing_columns(inspector, table) -> int:
+    existing = {column['name'] for column in inspector.get_columns(table.name)}
+    added = 0
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        definition = f"{column.name} {column.type.compile(db.engine.dialect)}"
+        if column.server_default is not None:
+            definition += f" NOT NULL DEFAULT {column.server_default.arg}" if not column.nullable \
+                else f" DEFAULT {column.server_default.arg}"
+        db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {definition}"))
+        click.echo(f"Added column {table.name}.{column.name}")
+        added += 1
+    return added
+
+
+def _add_missing_indexes(inspector, table) -> int:
+    existing = {index['name'] for index in inspector.get_indexes(table.name)}
+    added = 0
+    for index in table.indexes:
+        if index.name in existing:
+            continue
+        index.create(db.session.connection())
+        click.echo(f"Created index {index.name} on {table.name}")
+        added += 1
+    return added
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db_command() -> None:
+    """Create the database tables that do not exist yet"""
+    db.create_all()
+    click.echo("Database tables created")
+
+
+@click.command("create-admin")
+@with_appcontext
+@click.option("--username", default="admin", show_default=True)
+@click.option("--email", default="admin@wepark.com", show_default=True)
+@click.option("--password", default="admin123", show_default=True, help="Change it outside development")
+def create_admin_command(username: str, email: str, password: str) -> None:
+    """Create an admin account unless it already exists"""
+    from .services.auth_service import AuthService
+
+    result = AuthService().register_admin(username, email, password)
+    if result['success']:
+        click.echo(f"Admin {username} created")
+    elif 'error' in result:
+        raise click.ClickException(result['error'])
+    else:
+        click.echo(f"Admin {username} already exists")
+
+
+@click.command("upgrade-db")
+@with_appcontext
+def upgrade_db_command() -> None:
+    """Add model columns and indexes missing from an existing database"""
+    db.create_all()
+    inspector = inspect(db.engine)
+    added = 0
+
+    for table in db.metadata.sorted_tables:
+        added += _add_missing_columns(inspector, table)
+        added += _add_missing_indexes(inspector, table)
+    db.session.commit()
+
+    click.echo(f"{added} change(s) applied")
+
+
+@click.command("repair-lot-counts")
+@with_appcontext
+@click.option("--dry-run", is_flag=True, help="Only report drift, do not fix it")
+def repair_lot_counts_command(dry_run: bool) -> None:
+    """Recompute lot spot counters from the spots table"""
+    from .services.lot_service import LotService
+
+    drifted = LotService().repair_spot_counts(dry_run=dry_run)
+    for lot in drifted:
+        click.echo(f"Lot {lot['lot_id']}: stored {lot['stored']} actual {lot['actual']}")
+    verb = "found" if dry_run else "repaired"
+    click.echo(f"{len(drifted)} lot(s) with drifted counters {verb}")
+
+
+@click.command("backfill-lot-usage")
+@with_appcontext
+@click.option("--from", "start", default=None, help="First day to rebuild (YYYY-MM-DD)")
+@click.option("--to", "end", default=None, help="Last day to rebuild, inclusive (YYYY-MM-DD)")
+def backfill_lot_usage_command(start: str, end: str) -> None:
+    """Rebuild the daily lot usage rollup from reservations"""
+    from .repositories.daily_lot_usage_repository import DailyLotUsageRepository
+    from .utils.datetime_helpers import parse_date
+
+    try:
+        start_day = parse_date(start)
+        end_day = parse_date(end)
+    except ValueError:
+        raise click.BadParameter("dates must be YYYY-MM-DD")
+
+    repo = DailyLotUsageRepository()
+    written = repo.rebuild(start=start_day.date() if start_day else None,
+                           end=(end_day + timedelta(days=1)).date() if end_day else None)
+    repo.commit()
+    click.echo(f"{written} daily usage row(s) written")
+
+
+@click.command("seed")
+@with_appcontext
+@click.option("--lots", default=50, show_default=True, help="Lots to create")
+@click.option("--spots-per-lot", default=100, show_default=True, help="Spots in each lot")
+@click.option("--users", default=10_000, show_default=True, help="Users to create")
+@click.option("--reservations", default=1_000_000, show_default=True, help="Past reservations to create")
+@click.option("--years", default=2.0, show_default=True, help="Years of reservation history")
+@click.option("--pincodes", default=20, show_default=True, help="Distinct pincodes for lots and users")
+@click.option("--password", default="password123", show_default=True, help="Password of every generated user")
+@click.option("--chunk-size", default=10_000, show_default=True, help="Rows per insert and transaction")
+@click.option("--seed", "seed_value", type=int, default=None, help="Random seed for repeatable data")
+def seed_command(lots: int, spots_per_lot: int, users: int, reservations: int, years: float,
+                 pincodes: int, password: str, chunk_size: int, seed_value: int) -> None:
+    """Append synthetic lots, users and reservation history"""
+    from .services.seed_service import SeedService
+    from .utils.cache_helpers import invalidate_lot
+
+    started = time.perf_counter()
+
+    def progress(table: str, rows: int) -> None:
+        if table != "reservations" or rows == reservations or rows % (10 * chunk_size) == 0:
+            click.echo(f"{table}: {rows} row(s) ({time.perf_counter() - started:.1f}s)")
+
+    result = SeedService(random.Random(seed_value), progress).seed(
+        lots=lots, spots_per_lot=spots_per_lot, users=users, reservations=reservations,
+        years=years, pincodes=pincodes, password=password, chunk_size=chunk_size
+    )
+    if not result['success']:
+        raise click.ClickException(result.get('error', result['message']))
+    # New lots must show up in cached lot lists
+    invalidate_lot()
+
+    seconds = time.perf_counter() - started
+    rows = result['lots'] + result['spots'] + result['users'] + result['reservations'] + result['usage_rows']
+    click.echo(f"{rows} row(s) written in {seconds:.1f}s ({rows / seconds * 60:,.0f} rows/min), "
+               f"{result['usage_rows']} of them daily usage rows")
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Register CLI commands on the application
+
+    Args:
+        app: Flask application
+    """
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(create_admin_command)
+    app.cli.add_command(upgrade_db_command)
+    app.cli.add_command(repair_lot_counts_command)
+    app.cli.add_command(backfill_lot_usage_command)
+    app.cli.add_command(seed_command)
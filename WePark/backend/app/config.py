@@ -42,6 +42,9 @@ class BaseConfig:
     MAIL_USE_TLS: bool = os.getenv("MAIL_USE_TLS", "False").lower() == "true"
     MAIL_USE_SSL: bool = os.getenv("MAIL_USE_SSL", "False").lower() == "true"
     MAIL_DEFAULT_SENDER: str = os.getenv("MAIL_DEFAULT_SENDER", "noreply@wepark.com")
+    MAIL_MAX_PER_CONNECTION: int = int(os.getenv("MAIL_MAX_PER_CONNECTION", "100"))  # Batch sends
+    MAIL_SEND_RETRIES: int = 3
+    MAIL_RETRY_BACKOFF: float = 0.5  # Seconds, doubled on each retry
     
     # Celery Configuration (Redis broker)
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
@@ -60,6 +63,41 @@ class BaseConfig:
     CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
     CACHE_DEFAULT_TIMEOUT: int = 300  # 5 minutes
     
+    # Seconds an unknown login identifier is remembered (skips the lookup)
+    LOGIN_NEGATIVE_CACHE_TTL: int = 30
+    
+    # Password hashing (werkzeug method string; stored hashes are upgraded on login)
+    PASSWORD_HASH_METHOD: str = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_POOL_WORKERS: int = int(os.getenv("PASSWORD_POOL_WORKERS", "2"))  # 0 hashes in-thread
+    PASSWORD_POOL_QUEUE_LIMIT: int = int(os.getenv("PASSWORD_POOL_QUEUE_LIMIT", "32"))  # Beyond this, 503
+    PASSWORD_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a queued hash
+    
+    # Signed-in user lookups kept per process for reads. Off (0) by default, so every
+    # authenticated call runs one primary-key user SELECT; a TTL removes it from reads
+    # only, and edits made by other workers then show up on reads after up to the TTL
+    CURRENT_USER_CACHE_TTL: int = int(os.getenv("CURRENT_USER_CACHE_TTL", "0"))
+    CURRENT_USER_CACHE_SIZE: int = 1024
+    
+    # Observability (Prometheus text at /api/metrics; share of passed role checks logged)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")  # Bearer token for scrapers; admins can always read
+    AUTH_LOG_SAMPLE_RATE: float = float(os.getenv("AUTH_LOG_SAMPLE_RATE", "0.01"))
+    
+    # Per-request SQL budgets (see utils/query_budget.py), enforced in testing
+    QUERY_BUDGETS_ENABLED: bool = False
+    QUERY_REPEAT_LIMIT: int = 10  # Runs of one SELECT per request before it counts as N+1
+    
+    # Pagination (keyset, via ?limit=&after=)
+    API_PAGE_SIZE_DEFAULT: int = 100  # Page size for a bare ?limit=
+    API_PAGE_SIZE_MAX: int = 1000
+    
+    # Exports (streamed in batches, gzip spooled to disk past the memory limit)
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_SPOOL_MAX_BYTES: int = 8 * 1024 * 1024
+    
+    # Scheduled notifications (rows per commit / emails per Celery subtask)
+    NOTIFICATION_CHUNK_SIZE: int = 500
+    
     # Frontend Configuration
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:5173")
     
@@ -109,6 +147,12 @@ class TestingConfig(BaseConfig):
     
     # Shorter JWT expiry for tests
     JWT_ACCESS_TOKEN_EXPIRES: timedelta = timedelta(minutes=15)
+    
+    # Hash in the request thread (no worker processes)
+    PASSWORD_POOL_WORKERS: int = 0
+    
+    # Raise on requests over their query budget or with N+1 lazy loads
+    QUERY_BUDGETS_ENABLED: bool = True
 
 
 # Configuration dictionary
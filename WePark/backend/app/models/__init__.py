@@ -3,4 +3,5 @@ from .user import User
 from .lot import Lot
 from .spot import Spot
 from .reservation import Reservation
-from .notification import Notification
\ No newline at end of file
+from .notification import Notification
+from .daily_lot_usage import DailyLotUsage
@@ -1,5 +1,5 @@
 from .. import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from ..utils.passwords import hash_password, verify_password
 
 class Admin(db.Model):
     __tablename__ = "admin"
@@ -9,7 +9,7 @@ class Admin(db.Model):
     password = db.Column(db.String(300), nullable=False)
 
     def hash_password(self,password):
-        hashed_password = generate_password_hash(password)
+        hashed_password = hash_password(password)
         self.password = hashed_password
     def check_password(self,password):
-        return check_password_hash(self.password,password)
\ No newline at end of file
+        return verify_password(self.password,password)
\ No newline at end of file
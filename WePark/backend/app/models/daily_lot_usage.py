@@ -0,0 +1,13 @@
+from .. import db
+
+class DailyLotUsage(db.Model):
+    __tablename__ = "daily_lot_usage"
+    # Rollup of reservations per lot and day, maintained by ReservationService
+    lot_id = db.Column(db.Integer, db.ForeignKey("lots.lot_id"), primary_key=True, nullable=False)
+    usage_date = db.Column(db.Date, primary_key=True, nullable=False)
+    bookings = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    completed = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    revenue = db.Column(db.Float, nullable=False, default=0, server_default="0")
+    occupied_hours = db.Column(db.Float, nullable=False, default=0, server_default="0")
+
+    lot = db.relationship("Lot", back_populates="usage", uselist=False)
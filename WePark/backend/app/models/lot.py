@@ -9,7 +9,11 @@ class Lot(db.Model):
     address = db.Column(db.String(300), nullable=False)
     pincode = db.Column(db.Integer, nullable=False)
     no_of_spots = db.Column(db.Integer, nullable=False)
+    # Denormalized from spots.status, updated in the same transaction
+    available_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    occupied_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     created_at = db.Column(db.DateTime, default=get_ist_time())
     
     spots = db.relationship("Spot", back_populates="lot", cascade="all, delete-orphan")
+    usage = db.relationship("DailyLotUsage", back_populates="lot", cascade="all, delete-orphan")
 
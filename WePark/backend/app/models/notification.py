@@ -2,6 +2,9 @@ from .. import db
 
 class Notification(db.Model):
     __tablename__="notification"
+    __table_args__ = (
+        db.Index("ix_notification_user_id_notification_id", "user_id", "notification_id"),
+    )
     notification_id = db.Column(db.Integer, primary_key=True, nullable=False, unique=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
     title = db.Column(db.String(30), nullable=False)
@@ -1,7 +1,17 @@
+from sqlalchemy import and_, case, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from .. import db
 
+# Costs above this on rows from before cost_in_rupees are paise amounts
+LEGACY_PAISE_THRESHOLD = 1000
+
 class Reservation(db.Model):
     __tablename__ = "reservations"
+    __table_args__ = (
+        db.Index("ix_reservations_user_id_leaving_timestamp", "user_id", "leaving_timestamp"),
+        db.Index("ix_reservations_spot_id_leaving_timestamp", "spot_id", "leaving_timestamp"),
+        db.Index("ix_reservations_payment_status", "payment_status"),
+    )
     reservation_id = db.Column(db.Integer, primary_key=True, nullable=False, unique=True)
     spot_id = db.Column(db.Integer, db.ForeignKey("spots.spot_id"), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
@@ -10,6 +20,22 @@ class Reservation(db.Model):
     parking_cost = db.Column(db.Float, nullable=True)
     vehicle_number = db.Column(db.String(20), nullable=False)
     payment_status = db.Column(db.Boolean, nullable=True)  
+    # False only on rows that existed before this column; their cost may be in paise
+    cost_in_rupees = db.Column(db.Boolean, nullable=False, default=True, server_default="0")
     
     user = db.relationship("User", back_populates="reservations", uselist=False)
-    spot = db.relationship("Spot", back_populates="reservation", uselist=False)
\ No newline at end of file
+    spot = db.relationship("Spot", back_populates="reservation", uselist=False)
+
+    @hybrid_property
+    def revenue(self) -> float:
+        """parking_cost in rupees, 0 when not charged yet"""
+        cost = self.parking_cost or 0
+        if self.cost_in_rupees is False and cost > LEGACY_PAISE_THRESHOLD:
+            return cost / 100
+        return cost
+
+    @revenue.expression
+    def revenue(cls):
+        cost = func.coalesce(cls.parking_cost, 0)
+        return case((and_(cls.cost_in_rupees == False, cost > LEGACY_PAISE_THRESHOLD), cost / 100),
+                    else_=cost)
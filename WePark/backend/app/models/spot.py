@@ -2,6 +2,9 @@ from .. import db
 
 class Spot(db.Model):
     __tablename__ = "spots"
+    __table_args__ = (
+        db.Index("ix_spots_lot_id_status", "lot_id", "status"),
+    )
     spot_id = db.Column(db.Integer, primary_key=True, nullable=False, unique=True)
     lot_id = db.Column(db.Integer, db.ForeignKey("lots.lot_id"), nullable=False)
     status = db.Column(db.Boolean, default=True)
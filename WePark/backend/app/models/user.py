@@ -1,9 +1,12 @@
 from collections import UserList
 from .. import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from ..utils.passwords import hash_password, verify_password
 
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index("ix_users_pincode", "pincode"),
+    )
     user_id = db.Column(db.Integer, nullable=False, primary_key=True, unique=True)
     username = db.Column(db.String(30), nullable=False, unique=True)
     email = db.Column(db.String(30), nullable=False, unique=True)
@@ -15,8 +18,8 @@ class User(db.Model):
     notifications = db.relationship("Notification", back_populates="user", cascade="all, delete-orphan" )
     
     def hash_password(self,password):
-        hashed_password = generate_password_hash(password)
+        hashed_password = hash_password(password)
         self.password = hashed_password
 
     def check_password(self,password):
-        return check_password_hash(self.password,password)
\ No newline at end of file
+        return verify_password(self.password,password)
\ No newline at end of file
@@ -11,6 +11,9 @@ from .reservation_repository import ReservationRepository
 from .user_repository import UserRepository
 from .admin_repository import AdminRepository
 from .notification_repository import NotificationRepository
+from .daily_lot_usage_repository import DailyLotUsageRepository
+from .principal_repository import Principal, PrincipalRepository
+from .spot_availability_index import SpotAvailabilityIndex, spot_availability_index
 
 __all__ = [
     'BaseRepository',
@@ -20,4 +23,9 @@ __all__ = [
     'UserRepository',
     'AdminRepository',
     'NotificationRepository',
+    'DailyLotUsageRepository',
+    'Principal',
+    'PrincipalRepository',
+    'SpotAvailabilityIndex',
+    'spot_availability_index',
 ]
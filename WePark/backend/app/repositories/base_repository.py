@@ -4,8 +4,10 @@ Base Repository - Common CRUD Operations
 Provides reusable database operations for all repositories
 """
 
-from typing import TypeVar, Generic, List, Optional, Type, Dict, Any
-from sqlalchemy.orm import Session
+from contextlib import contextmanager
+from typing import TypeVar, Generic, List, Optional, Type, Dict, Any, Iterable, Iterator
+from sqlalchemy import func, insert, inspect
+from sqlalchemy.orm import Query, Session
 from .. import db
 
 ModelType = TypeVar('ModelType')
@@ -38,6 +40,67 @@ class BaseRepository(Generic[ModelType]):
         self.session.add(instance)
         return instance
     
+    def bulk_create(self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000,
+                    commit: bool = False) -> int:
+        """
+        Insert many records with one executemany per chunk
+        
+        Skips building ORM instances (a Core insert on the table, not the
+        ORM bulk path), so the inserted rows are not added to the session and
+        defaults must be expressible at the column level.
+        
+        Args:
+            rows: Iterable of field:value dictionaries
+            chunk_size: Number of rows sent per executemany
+            commit: If True, commit after every chunk so each chunk is its
+                    own transaction (for loads too large for one)
+            
+        Returns:
+            Number of rows inserted
+        """
+        statement = insert(self.model.__table__)
+        inserted = 0
+        chunk: List[Dict[str, Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self.session.execute(statement, chunk)
+                inserted += len(chunk)
+                chunk = []
+                if commit:
+                    self.session.commit()
+        if chunk:
+            self.session.execute(statement, chunk)
+            inserted += len(chunk)
+            if commit:
+                self.session.commit()
+        return inserted
+    
+    @contextmanager
+    def deferred_indexes(self) -> Iterator[None]:
+        """
+        Drop the table's secondary indexes for a bulk load, rebuilding them after
+        
+        Building an index once over the loaded rows is cheaper than updating
+        it on every insert. The indexes are rebuilt even if the load fails,
+        after rolling back whatever was left uncommitted.
+        
+        Usage:
+            with repo.deferred_indexes():
+                repo.bulk_create(rows, commit=True)
+        """
+        indexes = list(self.model.__table__.indexes)
+        for index in indexes:
+            index.drop(self.session.connection(), checkfirst=True)
+        self.session.commit()
+        try:
+            yield
+        finally:
+            self.session.rollback()
+            for index in indexes:
+                index.create(self.session.connection(), checkfirst=True)
+            self.session.commit()
+    
     def get_by_id(self, id_value: Any) -> Optional[ModelType]:
         """
         Get record by primary key
@@ -63,12 +126,15 @@ class BaseRepository(Generic[ModelType]):
         """
         return self.model.query.filter_by(**{field_name: value}).first()
     
-    def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[ModelType]:
+    def get_all(self, filters: Optional[Dict[str, Any]] = None,
+                limit: Optional[int] = None, after: Optional[Any] = None) -> List[ModelType]:
         """
-        Get all records, optionally filtered
+        Get all records, optionally filtered and paginated
         
         Args:
             filters: Optional dictionary of field:value filters
+            limit: Optional maximum number of records (one page)
+            after: Optional primary key of the last record of the previous page
             
         Returns:
             List of model instances
@@ -76,7 +142,33 @@ class BaseRepository(Generic[ModelType]):
         query = self.model.query
         if filters:
             query = query.filter_by(**filters)
-        return query.all()
+        return self.paginate(query, limit=limit, after=after).all()
+    
+    def paginate(self, query: Query, limit: Optional[int] = None, after: Optional[Any] = None,
+                 descending: bool = False) -> Query:
+        """
+        Apply keyset pagination on the primary key to a query
+        
+        Pages are selected with `pk > after` (or `pk < after` when descending)
+        instead of OFFSET, so every page costs the same regardless of depth.
+        Without a limit the query is only ordered.
+        
+        Args:
+            query: Query over this repository's model
+            limit: Optional page size
+            after: Optional primary key of the last record of the previous page
+            descending: If True, walk from newest to oldest
+            
+        Returns:
+            Ordered (and limited) query
+        """
+        primary_key = inspect(self.model).primary_key[0]
+        if after is not None:
+            query = query.filter(primary_key < after if descending else primary_key > after)
+        query = query.order_by(primary_key.desc() if descending else primary_key)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
     
     def update(self, instance: ModelType, **kwargs) -> ModelType:
         """
@@ -115,6 +207,16 @@ class BaseRepository(Generic[ModelType]):
         """Flush pending changes"""
         self.session.flush()
     
+    def last_id(self) -> int:
+        """
+        Get the highest primary key in the table
+        
+        Returns:
+            Largest primary key value, or 0 if the table is empty
+        """
+        primary_key = inspect(self.model).primary_key[0]
+        return self.session.query(func.max(primary_key)).scalar() or 0
+    
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count records
@@ -0,0 +1,215 @@
+# WePark/backend/app/repositories/daily_lot_usage_repository.py
+"""
+Daily Lot Usage Repository - Usage Rollup Data Access
+Handles the per-lot, per-day reservation rollup used by analytics
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import date, datetime
+from sqlalchemy import and_, delete, func, or_, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from .base_repository import BaseRepository
+from ..models.daily_lot_usage import DailyLotUsage
+from ..models.reservation import Reservation
+from ..models.spot import Spot
+from ..models.lot import Lot
+
+
+class DailyLotUsageRepository(BaseRepository[DailyLotUsage]):
+    """Repository for daily lot usage rollup operations"""
+
+    COUNTERS = ('bookings', 'completed', 'revenue', 'occupied_hours')
+
+    # Dialects supporting INSERT ... ON CONFLICT DO UPDATE
+    _UPSERT_INSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+
+    def __init__(self):
+        super().__init__(DailyLotUsage)
+
+    def increment(self, lot_id: int, usage_date: date, bookings: int = 0, completed: int = 0,
+                  revenue: float = 0, occupied_hours: float = 0) -> None:
+        """
+        Add to a lot's counters for one day in the current transaction
+
+        Uses an atomic upsert so concurrent bookings never lose an increment.
+
+        Args:
+            lot_id: Lot ID
+            usage_date: Day the usage is attributed to
+            bookings: Bookings to add
+            completed: Completed reservations to add
+            revenue: Revenue to add
+            occupied_hours: Occupied hours to add
+        """
+        self.increment_many({(lot_id, usage_date): {
+            'bookings': bookings,
+            'completed': completed,
+            'revenue': revenue,
+            'occupied_hours': occupied_hours
+        }})
+
+    def increment_many(self, changes: Dict[Tuple[int, date], Dict[str, float]]) -> None:
+        """
+        Add to the counters of several (lot, day) rows in the current transaction
+
+        Where the dialect has an upsert, all rows go in one executemany.
+
+        Args:
+            changes: (lot_id, usage_date) -> counters to add (missing ones add 0)
+        """
+        params = [{'lot_id': lot_id, 'usage_date': usage_date,
+                   **{name: amounts.get(name, 0) for name in self.COUNTERS}}
+                  for (lot_id, usage_date), amounts in changes.items()]
+        if not params:
+            return
+        insert_fn = self._UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert_fn is not None:
+            statement = insert_fn(DailyLotUsage)
+            statement = statement.on_conflict_do_update(
+                index_elements=[DailyLotUsage.lot_id, DailyLotUsage.usage_date],
+                set_={name: getattr(DailyLotUsage, name) + statement.excluded[name] for name in self.COUNTERS}
+            )
+            self.session.execute(statement, params)
+            return
+
+        for row in params:
+            updated = self.session.execute(
+                update(DailyLotUsage)
+                .where(DailyLotUsage.lot_id == row['lot_id'], DailyLotUsage.usage_date == row['usage_date'])
+                .values({name: getattr(DailyLotUsage, name) + row[name] for name in self.COUNTERS})
+            ).rowcount
+            if not updated:
+                self.session.add(DailyLotUsage(**row))
+
+    def sum_by_lot(self, start: Optional[date] = None,
+                   end: Optional[date] = None) -> List[Tuple[int, str, int, int, float, float]]:
+        """
+        Total each lot's usage over a date range
+
+        Args:
+            start: Optional inclusive first day
+            end: Optional exclusive last day
+
+        Returns:
+            List of (lot_id, prime_location, bookings, completed, revenue,
+            occupied_hours) for lots with usage in the range
+        """
+        query = self.session.query(
+            Lot.lot_id, Lot.prime_location,
+            func.sum(DailyLotUsage.bookings), func.sum(DailyLotUsage.completed),
+            func.sum(DailyLotUsage.revenue), func.sum(DailyLotUsage.occupied_hours)
+        ).join(Lot, Lot.lot_id == DailyLotUsage.lot_id)
+        if start is not None:
+            query = query.filter(DailyLotUsage.usage_date >= start)
+        if end is not None:
+            query = query.filter(DailyLotUsage.usage_date < end)
+        return query.group_by(Lot.lot_id).all()
+
+    @staticmethod
+    def _usage_of(rows: Iterable[Tuple[int, Optional[datetime], Optional[datetime], float]]
+                  ) -> Iterator[Tuple[int, date, Dict[str, float]]]:
+        """
+        What each reservation adds to the rollup, as the live path counts it
+
+        A booking counts on the day it was parked (the leaving day if it
+        never was); a completion counts on the leaving day.
+
+        Args:
+            rows: (lot_id, parking_timestamp, leaving_timestamp, revenue)
+
+        Yields:
+            (lot_id, day, counters to add)
+        """
+        for lot_id, parked, left, revenue in rows:
+            booked = parked or left
+            if booked is not None:
+                yield lot_id, booked.date(), {'bookings': 1}
+            if left is not None:
+                hours = (left - parked).total_seconds() / 3600 if parked else 0
+                yield lot_id, left.date(), {'completed': 1, 'revenue': revenue, 'occupied_hours': hours}
+
+    def remove_user(self, user_id: int) -> None:
+        """
+        Take a user's reservations out of the rollup in the current transaction
+
+        Call before deleting the user: their reservations go with them, and
+        a later rebuild would not count them either.
+
+        Args:
+            user_id: User ID
+        """
+        rows = self.session.query(
+            Spot.lot_id, Reservation.parking_timestamp, Reservation.leaving_timestamp, Reservation.revenue
+        ).join(Spot, Spot.spot_id == Reservation.spot_id).filter(Reservation.user_id == user_id)
+
+        totals: Dict[Tuple[int, date], Dict[str, float]] = {}
+        for lot_id, day, amounts in self._usage_of(rows):
+            counters = totals.setdefault((lot_id, day), dict.fromkeys(self.COUNTERS, 0))
+            for name, value in amounts.items():
+                counters[name] -= value
+        self.increment_many(totals)
+        # Days left with nothing on them are dropped, as rebuild never writes them
+        if totals:
+            self.session.execute(
+                delete(DailyLotUsage)
+                .where(tuple_(DailyLotUsage.lot_id, DailyLotUsage.usage_date).in_(list(totals)),
+                       DailyLotUsage.bookings == 0, DailyLotUsage.completed == 0)
+            )
+
+    def rebuild(self, start: Optional[date] = None, end: Optional[date] = None,
+                batch_size: int = 1000) -> int:
+        """
+        Recompute the rollup from reservations for a date range
+
+        Existing rows in the range are replaced. Reservations are streamed, so
+        memory stays bounded by the number of (lot, day) pairs. Bookings are
+        dated by parking time since reservations do not store when they were
+        made; reservations never occupied are dated by their leaving time and
+        active ones that were never occupied are skipped. Revenue is
+        Reservation.revenue, as in the live path.
+
+        Args:
+            start: Optional inclusive first day
+            end: Optional exclusive last day
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Number of rollup rows written
+        """
+        def in_range(day: date) -> bool:
+            return (start is None or day >= start) and (end is None or day < end)
+
+        def within(column):
+            conditions = [column != None]
+            if start is not None:
+                conditions.append(column >= datetime.combine(start, datetime.min.time()))
+            if end is not None:
+                conditions.append(column < datetime.combine(end, datetime.min.time()))
+            return and_(*conditions)
+
+        cleanup = delete(DailyLotUsage)
+        if start is not None:
+            cleanup = cleanup.where(DailyLotUsage.usage_date >= start)
+        if end is not None:
+            cleanup = cleanup.where(DailyLotUsage.usage_date < end)
+        self.session.execute(cleanup)
+
+        rows = self.session.query(
+            Spot.lot_id, Reservation.parking_timestamp,
+            Reservation.leaving_timestamp, Reservation.revenue
+        ).join(Spot, Spot.spot_id == Reservation.spot_id) \
+            .filter(or_(within(Reservation.parking_timestamp), within(Reservation.leaving_timestamp))) \
+            .yield_per(batch_size)
+
+        totals: Dict[Tuple[int, date], Dict[str, float]] = {}
+        for lot_id, day, amounts in self._usage_of(rows):
+            if not in_range(day):
+                continue
+            counters = totals.setdefault((lot_id, day), dict.fromkeys(self.COUNTERS, 0))
+            for name, value in amounts.items():
+                counters[name] += value
+
+        return self.bulk_create(
+            {'lot_id': lot_id, 'usage_date': day, **counters}
+            for (lot_id, day), counters in totals.items()
+        )
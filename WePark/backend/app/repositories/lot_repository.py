@@ -4,9 +4,12 @@ Lot Repository - Parking Lot Data Access
 Handles database operations for parking lots
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.orm import selectinload
 from .base_repository import BaseRepository
 from ..models.lot import Lot
+from ..models.spot import Spot
 
 
 class LotRepository(BaseRepository[Lot]):
@@ -78,7 +81,7 @@ class LotRepository(BaseRepository[Lot]):
     
     def get_lot_with_spots(self, lot_id: int) -> Optional[Lot]:
         """
-        Get lot with all its spots loaded
+        Get lot with all its spots eagerly loaded in one extra query
         
         Args:
             lot_id: Lot ID
@@ -86,7 +89,25 @@ class LotRepository(BaseRepository[Lot]):
         Returns:
             Lot instance with spots or None
         """
-        return Lot.query.filter_by(lot_id=lot_id).first()
+        return Lot.query.options(selectinload(Lot.spots)).filter_by(lot_id=lot_id).first()
+    
+    def get_lot_for_delete(self, lot_id: int) -> Optional[Lot]:
+        """
+        Get lot with everything its delete cascades to loaded up front
+        
+        Without this, deleting the lot lazy-loads each spot's reservations
+        one query per spot.
+        
+        Args:
+            lot_id: Lot ID
+            
+        Returns:
+            Lot instance or None
+        """
+        return Lot.query.options(
+            selectinload(Lot.spots).selectinload(Spot.reservation),
+            selectinload(Lot.usage)
+        ).filter_by(lot_id=lot_id).first()
     
     def can_delete_lot(self, lot: Lot) -> bool:
         """
@@ -102,3 +123,17 @@ class LotRepository(BaseRepository[Lot]):
             if spot.status is False:
                 return False
         return True
+    
+    def count_spots_by_lot(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Count available and occupied spots of every lot in one GROUP BY
+        
+        Returns:
+            Dictionary of lot_id -> (available, occupied)
+        """
+        rows = self.session.query(
+            Spot.lot_id,
+            func.sum(case((Spot.status == True, 1), else_=0)),
+            func.sum(case((Spot.status == False, 1), else_=0))
+        ).group_by(Spot.lot_id).all()
+        return {lot_id: (int(available or 0), int(occupied or 0)) for lot_id, available, occupied in rows}
@@ -4,9 +4,11 @@ Notification Repository - Notification Data Access
 Handles database operations for notifications
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
 from .base_repository import BaseRepository
 from ..models.notification import Notification
+from ..models.user import User
 
 
 class NotificationRepository(BaseRepository[Notification]):
@@ -15,29 +17,36 @@ class NotificationRepository(BaseRepository[Notification]):
     def __init__(self):
         super().__init__(Notification)
     
-    def find_by_user(self, user_id: int) -> List[Notification]:
+    def find_by_user(self, user_id: int, limit: Optional[int] = None,
+                     after: Optional[int] = None) -> List[Notification]:
         """
-        Get all notifications for a user
+        Get all notifications for a user, newest first
         
         Args:
             user_id: User ID
+            limit: Optional page size
+            after: Optional notification ID of the last row of the previous page
             
         Returns:
             List of user's notifications
         """
-        return Notification.query.filter_by(user_id=user_id).order_by(Notification.notification_id.desc()).all()
+        query = Notification.query.filter_by(user_id=user_id)
+        return self.paginate(query, limit=limit, after=after, descending=True).all()
     
-    def find_unread_by_user(self, user_id: int) -> List[Notification]:
+    def find_unread_by_user(self, user_id: int, limit: Optional[int] = None,
+                            after: Optional[int] = None) -> List[Notification]:
         """
         Get unread notifications for a user (returns all since no is_read field)
         
         Args:
             user_id: User ID
+            limit: Optional page size
+            after: Optional notification ID of the last row of the previous page
             
         Returns:
             List of notifications
         """
-        return Notification.query.filter_by(user_id=user_id).order_by(Notification.notification_id.desc()).all()
+        return self.find_by_user(user_id, limit=limit, after=after)
     
     def mark_as_read(self, notification: Notification) -> Notification:
         """
@@ -83,3 +92,33 @@ class NotificationRepository(BaseRepository[Notification]):
             Notification instance or None
         """
         return Notification.query.filter_by(notification_id=notification_id).first()
+    
+    def bulk_create_returning_ids(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert notifications in one executemany and return their IDs
+        
+        Args:
+            rows: List of field:value dictionaries
+            
+        Returns:
+            Notification IDs, in the order of rows
+        """
+        if not rows:
+            return []
+        statement = insert(Notification).returning(Notification.notification_id, sort_by_parameter_order=True)
+        return list(self.session.scalars(statement, rows))
+    
+    def find_email_batch(self, notification_ids: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Get what is needed to email a batch of notifications, in one query
+        
+        Args:
+            notification_ids: Notification IDs
+            
+        Returns:
+            List of (recipient email, title, body)
+        """
+        return self.session.query(User.email, Notification.title, Notification.body) \
+            .join(User, User.user_id == Notification.user_id) \
+            .filter(Notification.notification_id.in_(notification_ids)) \
+            .order_by(Notification.notification_id).all()
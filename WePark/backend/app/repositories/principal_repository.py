@@ -0,0 +1,70 @@
+# WePark/backend/app/repositories/principal_repository.py
+"""
+Principal Repository - Login Identity Data Access
+Looks up admins and users together for authentication
+"""
+
+from typing import List, NamedTuple
+from sqlalchemy import literal, or_, select, union_all, update
+from sqlalchemy.orm import Session
+from .. import db
+from ..models.admin import Admin
+from ..models.user import User
+
+
+class Principal(NamedTuple):
+    """Login identity of an admin or a user"""
+    role: str
+    id: int
+    username: str
+    password: str
+
+
+class PrincipalRepository:
+    """Repository resolving login identities across the admin and users tables"""
+
+    def __init__(self):
+        self.session: Session = db.session
+
+    def find_by_username_or_email(self, identifier: str) -> List[Principal]:
+        """
+        Find every admin and user whose username or email matches, in one query
+
+        Both tables have unique indexes on username and email, so each side
+        of the UNION ALL is resolved through an index.
+
+        Args:
+            identifier: Username or email
+
+        Returns:
+            Matching principals, admins first
+        """
+        admins = select(
+            literal("admin").label("role"), Admin.admin_id.label("id"), Admin.username, Admin.password,
+            literal(0).label("priority")
+        ).where(or_(Admin.username == identifier, Admin.email == identifier))
+        users = select(
+            literal("user").label("role"), User.user_id.label("id"), User.username, User.password,
+            literal(1).label("priority")
+        ).where(or_(User.username == identifier, User.email == identifier))
+        query = union_all(admins, users).order_by("priority")
+        return [Principal(*row[:4]) for row in self.session.execute(query)]
+
+    def update_password(self, principal: Principal, password_hash: str) -> None:
+        """
+        Replace the stored password hash of an admin or user (no commit)
+        
+        Args:
+            principal: Principal returned by find_by_username_or_email
+            password_hash: New password hash
+        """
+        model, key = (Admin, Admin.admin_id) if principal.role == "admin" else (User, User.user_id)
+        self.session.execute(update(model).where(key == principal.id).values(password=password_hash))
+
+    def commit(self) -> None:
+        """Commit the current transaction"""
+        self.session.commit()
+
+    def rollback(self) -> None:
+        """Rollback the current transaction"""
+        self.session.rollback()
@@ -4,10 +4,15 @@ Reservation Repository - Booking Data Access
 Handles database operations for parking reservations
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import case, func
+from sqlalchemy.orm import joinedload
 from .base_repository import BaseRepository
 from ..models.reservation import Reservation
+from ..models.spot import Spot
+from ..models.lot import Lot
+from ..models.user import User
 
 
 class ReservationRepository(BaseRepository[Reservation]):
@@ -16,29 +21,39 @@ class ReservationRepository(BaseRepository[Reservation]):
     def __init__(self):
         super().__init__(Reservation)
     
-    def find_by_user(self, user_id: int) -> List[Reservation]:
+    def find_by_user(self, user_id: int, limit: Optional[int] = None,
+                     after: Optional[int] = None) -> List[Reservation]:
         """
         Get all reservations for a user
         
         Args:
             user_id: User ID
+            limit: Optional page size
+            after: Optional reservation ID of the last row of the previous page
             
         Returns:
-            List of user's reservations
+            List of user's reservations, with spot and lot loaded
         """
-        return Reservation.query.filter_by(user_id=user_id).all()
+        query = Reservation.query.options(joinedload(Reservation.spot).joinedload(Spot.lot)) \
+            .filter_by(user_id=user_id)
+        return self.paginate(query, limit=limit, after=after).all()
     
-    def find_active_by_user(self, user_id: int) -> List[Reservation]:
+    def find_active_by_user(self, user_id: int, limit: Optional[int] = None,
+                            after: Optional[int] = None) -> List[Reservation]:
         """
         Get active reservations for a user
         
         Args:
             user_id: User ID
+            limit: Optional page size
+            after: Optional reservation ID of the last row of the previous page
             
         Returns:
-            List of active reservations
+            List of active reservations, with spot and lot loaded
         """
-        return Reservation.query.filter_by(user_id=user_id, leaving_timestamp=None).all()
+        query = Reservation.query.options(joinedload(Reservation.spot).joinedload(Spot.lot)) \
+            .filter_by(user_id=user_id, leaving_timestamp=None)
+        return self.paginate(query, limit=limit, after=after).all()
     
     def find_by_spot(self, spot_id: int) -> List[Reservation]:
         """
@@ -137,14 +152,186 @@ class ReservationRepository(BaseRepository[Reservation]):
         """
         return Reservation.query.filter_by(user_id=user_id, leaving_timestamp=None).count()
 
-    def find_by_payment_status(self, is_paid: bool) -> List[Reservation]:
+    def find_by_payment_status(self, is_paid: bool, limit: Optional[int] = None,
+                               after: Optional[int] = None) -> List[Reservation]:
         """
         Find reservations by payment status
         
         Args:
             is_paid: Payment status
+            limit: Optional page size
+            after: Optional reservation ID of the last row of the previous page
             
         Returns:
             List of reservations
         """
-        return Reservation.query.filter_by(payment_status=is_paid).all()
+        query = Reservation.query.filter_by(payment_status=is_paid)
+        return self.paginate(query, limit=limit, after=after).all()
+    
+    def find_all_with_users(self, is_paid: Optional[bool] = None, limit: Optional[int] = None,
+                            after: Optional[int] = None) -> List[Reservation]:
+        """
+        Get reservations with their users loaded in the same query
+        
+        Args:
+            is_paid: Optional payment status filter
+            limit: Optional page size
+            after: Optional reservation ID of the last row of the previous page
+            
+        Returns:
+            List of reservations
+        """
+        query = Reservation.query.options(joinedload(Reservation.user))
+        if is_paid is not None:
+            query = query.filter_by(payment_status=is_paid)
+        return self.paginate(query, limit=limit, after=after).all()
+    
+    def count_by_lot(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                     user_id: Optional[int] = None) -> List[Tuple[int, str, int]]:
+        """
+        Count reservations per lot in one GROUP BY over reservations/spots/lots
+        
+        The booking time is the parking time, or the leaving time for
+        reservations released without parking, as in the usage rollup.
+        
+        Args:
+            start: Optional inclusive lower bound on the booking time
+            end: Optional exclusive upper bound on the booking time
+            user_id: Optional user to restrict the counts to
+            
+        Returns:
+            List of (lot_id, prime_location, reservation count) for lots
+            with at least one reservation
+        """
+        query = self.session.query(Lot.lot_id, Lot.prime_location, func.count(Reservation.reservation_id)) \
+            .select_from(Reservation) \
+            .join(Spot, Spot.spot_id == Reservation.spot_id) \
+            .join(Lot, Lot.lot_id == Spot.lot_id)
+        if user_id is not None:
+            query = query.filter(Reservation.user_id == user_id)
+        booked = func.coalesce(Reservation.parking_timestamp, Reservation.leaving_timestamp)
+        if start is not None:
+            query = query.filter(booked >= start)
+        if end is not None:
+            query = query.filter(booked < end)
+        return query.group_by(Lot.lot_id).all()
+    
+    def summarize_user(self, user_id: int, month_bounds: List[Tuple[datetime, datetime]]) -> Dict[str, Any]:
+        """
+        Aggregate a user's reservations in a single query
+        
+        Costs are read through Reservation.revenue, which converts legacy
+        paise amounts to rupees.
+        
+        Args:
+            user_id: User ID
+            month_bounds: (start, end) parking_timestamp ranges to count separately
+            
+        Returns:
+            Dictionary with total, completed, total_cost and month_counts
+            (one count per entry of month_bounds)
+        """
+        cost = Reservation.revenue
+        month_columns = [
+            func.sum(case((Reservation.parking_timestamp >= start, case((Reservation.parking_timestamp < end, 1),
+                                                                        else_=0)), else_=0))
+            for start, end in month_bounds
+        ]
+        row = self.session.query(
+            func.count(Reservation.reservation_id),
+            func.count(Reservation.leaving_timestamp),
+            func.sum(case((Reservation.leaving_timestamp != None, cost), else_=0)),
+            *month_columns
+        ).filter(Reservation.user_id == user_id).one()
+        
+        total, completed, total_cost, *month_counts = row
+        return {
+            'total': total,
+            'completed': completed,
+            'total_cost': total_cost or 0,
+            'month_counts': [count or 0 for count in month_counts]
+        }
+    
+    def iter_usage_rows(self, user_id: int, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream a user's reservations joined with their spot and lot
+        
+        Only the exported columns are selected and rows are fetched
+        batch_size at a time, so no ORM objects or lazy loads are involved.
+        
+        Args:
+            user_id: User ID
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            Iterator of (reservation_id, lot_id, spot_id, prime_location,
+            parking_cost, parking_timestamp) in reservation ID order
+        """
+        return self.session.query(
+            Reservation.reservation_id, Lot.lot_id, Spot.spot_id, Lot.prime_location,
+            Reservation.parking_cost, Reservation.parking_timestamp
+        ).join(Spot, Spot.spot_id == Reservation.spot_id) \
+            .join(Lot, Lot.lot_id == Spot.lot_id) \
+            .filter(Reservation.user_id == user_id) \
+            .order_by(Reservation.reservation_id) \
+            .yield_per(batch_size)
+    
+    def iter_export_rows(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                         lot_id: Optional[int] = None, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream reservations across all users joined with user, spot and lot
+        
+        Runs on a server-side cursor (stream_results) where the driver has
+        one, fetching batch_size rows at a time so memory stays constant.
+        
+        Args:
+            start: Optional inclusive lower bound on parking_timestamp
+            end: Optional exclusive upper bound on parking_timestamp
+            lot_id: Optional lot to restrict the export to
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            Iterator of (reservation_id, user_id, username, email, lot_id,
+            prime_location, spot_id, vehicle_number, parking_timestamp,
+            leaving_timestamp, parking_cost, payment_status) in reservation
+            ID order
+        """
+        query = self.session.query(
+            Reservation.reservation_id, User.user_id, User.username, User.email,
+            Lot.lot_id, Lot.prime_location, Spot.spot_id, Reservation.vehicle_number,
+            Reservation.parking_timestamp, Reservation.leaving_timestamp,
+            Reservation.parking_cost, Reservation.payment_status
+        ).join(User, User.user_id == Reservation.user_id) \
+            .join(Spot, Spot.spot_id == Reservation.spot_id) \
+            .join(Lot, Lot.lot_id == Spot.lot_id)
+        if start is not None:
+            query = query.filter(Reservation.parking_timestamp >= start)
+        if end is not None:
+            query = query.filter(Reservation.parking_timestamp < end)
+        if lot_id is not None:
+            query = query.filter(Spot.lot_id == lot_id)
+        return query.order_by(Reservation.reservation_id) \
+            .execution_options(stream_results=True) \
+            .yield_per(batch_size)
+    
+    def usage_by_location(self, since: datetime, first_user_id: int,
+                          last_user_id: int) -> List[Tuple[int, str, int, float]]:
+        """
+        Count and cost each user's reservations per location in one GROUP BY
+        
+        Args:
+            since: Inclusive lower bound on parking_timestamp
+            first_user_id: First user ID of the range
+            last_user_id: Last user ID of the range (inclusive)
+            
+        Returns:
+            List of (user_id, prime_location, reservation count, total cost)
+        """
+        return self.session.query(
+            Reservation.user_id, Lot.prime_location,
+            func.count(Reservation.reservation_id), func.coalesce(func.sum(Reservation.parking_cost), 0)
+        ).join(Spot, Spot.spot_id == Reservation.spot_id) \
+            .join(Lot, Lot.lot_id == Spot.lot_id) \
+            .filter(Reservation.user_id.between(first_user_id, last_user_id),
+                    Reservation.parking_timestamp >= since) \
+            .group_by(Reservation.user_id, Lot.prime_location).all()
@@ -0,0 +1,184 @@
+# WePark/backend/app/repositories/spot_availability_index.py
+"""
+Spot Availability Index - In-Memory Free Spot Bitmaps
+Keeps one bitset of free spots per lot so allocation needs no table scan
+"""
+
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from .. import db
+from ..models.spot import Spot
+
+
+_PENDING_KEY = "spot_index_pending"
+
+
+class _LotBitmap:
+    """Sorted spot ids of one lot plus a bitset (bit i set = spot i free)"""
+
+    __slots__ = ("spot_ids", "bits", "free")
+
+    def __init__(self, rows: Iterable[Tuple[int, bool]]):
+        self.spot_ids = array("q")
+        self.bits = 0
+        self.free = 0
+        for position, (spot_id, status) in enumerate(rows):
+            self.spot_ids.append(spot_id)
+            if status is not False:
+                self.bits |= 1 << position
+                self.free += 1
+
+    def position(self, spot_id: int) -> Optional[int]:
+        position = bisect_left(self.spot_ids, spot_id)
+        if position < len(self.spot_ids) and self.spot_ids[position] == spot_id:
+            return position
+        return None
+
+    def set_status(self, spot_id: int, available: bool) -> None:
+        position = self.position(spot_id)
+        if position is None:
+            return
+        mask = 1 << position
+        if available and not self.bits & mask:
+            self.bits |= mask
+            self.free += 1
+        elif not available and self.bits & mask:
+            self.bits &= ~mask
+            self.free -= 1
+
+    def first_free(self) -> Optional[int]:
+        if not self.bits:
+            return None
+        return self.spot_ids[(self.bits & -self.bits).bit_length() - 1]
+
+
+class SpotAvailabilityIndex:
+    """
+    Process-local index of free spots per lot
+
+    Status changes made through SpotRepository are staged on the session and
+    applied only once the transaction commits, so a rolled back booking never
+    leaks into the index. Other processes may still change spots behind this
+    index's back, so callers treat a free spot as a hint that the database
+    confirms, and fall back to the database when a lot looks full.
+    """
+
+    def __init__(self):
+        self._lots: Dict[int, _LotBitmap] = {}
+        self._lock = threading.Lock()
+
+    def rebuild(self) -> None:
+        """Reload every lot from the spots table (requires an app context)"""
+        rows = db.session.query(Spot.lot_id, Spot.spot_id, Spot.status) \
+            .order_by(Spot.lot_id, Spot.spot_id).all()
+        grouped: Dict[int, List[Tuple[int, bool]]] = {}
+        for lot_id, spot_id, status in rows:
+            grouped.setdefault(lot_id, []).append((spot_id, status))
+        lots = {lot_id: _LotBitmap(spots) for lot_id, spots in grouped.items()}
+        with self._lock:
+            self._lots = lots
+
+    def reload_lot(self, lot_id: int) -> None:
+        """
+        Reload a single lot from the database
+
+        Args:
+            lot_id: Lot ID
+        """
+        rows = db.session.query(Spot.spot_id, Spot.status) \
+            .filter(Spot.lot_id == lot_id).order_by(Spot.spot_id).all()
+        with self._lock:
+            if rows:
+                self._lots[lot_id] = _LotBitmap(rows)
+            else:
+                self._lots.pop(lot_id, None)
+
+    def forget_lot(self, lot_id: int) -> None:
+        """
+        Drop a lot so it is reloaded on next use
+
+        Args:
+            lot_id: Lot ID
+        """
+        with self._lock:
+            self._lots.pop(lot_id, None)
+
+    def _bitmap(self, lot_id: int) -> Optional[_LotBitmap]:
+        bitmap = self._lots.get(lot_id)
+        if bitmap is None:
+            self.reload_lot(lot_id)
+            bitmap = self._lots.get(lot_id)
+        return bitmap
+
+    def find_free_spot(self, lot_id: int) -> Optional[int]:
+        """
+        Get the lowest free spot ID of a lot
+
+        Args:
+            lot_id: Lot ID
+
+        Returns:
+            Spot ID or None if the lot has no free spot
+        """
+        bitmap = self._bitmap(lot_id)
+        if bitmap is None:
+            return None
+        with self._lock:
+            return bitmap.first_free()
+
+    def free_count(self, lot_id: int) -> int:
+        """
+        Count free spots of a lot
+
+        Args:
+            lot_id: Lot ID
+
+        Returns:
+            Number of free spots
+        """
+        bitmap = self._bitmap(lot_id)
+        return bitmap.free if bitmap else 0
+
+    def set_status(self, lot_id: int, spot_id: int, available: bool) -> None:
+        """
+        Record a committed spot status change
+
+        Args:
+            lot_id: Lot ID
+            spot_id: Spot ID
+            available: True if the spot is now free
+        """
+        with self._lock:
+            bitmap = self._lots.get(lot_id)
+            if bitmap is not None:
+                bitmap.set_status(spot_id, available)
+
+    def stage(self, session, lot_id: int, spot_id: int, available: bool) -> None:
+        """
+        Stage a status change to be applied when the session commits
+
+        Args:
+            session: Session the change was made in
+            lot_id: Lot ID
+            spot_id: Spot ID
+            available: True if the spot becomes free
+        """
+        session.info.setdefault(_PENDING_KEY, []).append((lot_id, spot_id, available))
+
+
+spot_availability_index = SpotAvailabilityIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    for lot_id, spot_id, available in session.info.pop(_PENDING_KEY, ()):
+        spot_availability_index.set_status(lot_id, spot_id, available)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
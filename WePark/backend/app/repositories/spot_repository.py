@@ -5,7 +5,10 @@ Handles database operations for parking spots
 """
 
 from typing import List, Optional
+from sqlalchemy import update
 from .base_repository import BaseRepository
+from .spot_availability_index import spot_availability_index
+from ..models.lot import Lot
 from ..models.spot import Spot
 
 
@@ -15,6 +18,21 @@ class SpotRepository(BaseRepository[Spot]):
     def __init__(self):
         super().__init__(Spot)
     
+    def create_for_lot(self, lot_id: int, no_of_spots: int, chunk_size: int = 1000) -> int:
+        """
+        Bulk insert the available spots of a new lot
+        
+        Args:
+            lot_id: Lot ID
+            no_of_spots: Number of spots to create
+            chunk_size: Number of rows sent per executemany
+            
+        Returns:
+            Number of spots created
+        """
+        rows = ({'lot_id': lot_id, 'status': True} for _ in range(no_of_spots))
+        return self.bulk_create(rows, chunk_size=chunk_size)
+    
     def find_by_lot(self, lot_id: int) -> List[Spot]:
         """
         Get all spots for a specific lot
@@ -51,6 +69,18 @@ class SpotRepository(BaseRepository[Spot]):
         """
         return Spot.query.filter_by(lot_id=lot_id, status=False).all()
     
+    def find_first_available(self, lot_id: int) -> Optional[Spot]:
+        """
+        Get the first available spot of a lot straight from the database
+        
+        Args:
+            lot_id: Lot ID
+            
+        Returns:
+            Spot instance or None
+        """
+        return Spot.query.filter_by(lot_id=lot_id, status=True).first()
+    
     def get_spot_by_id(self, spot_id: int) -> Optional[Spot]:
         """
         Get spot by ID
@@ -86,7 +116,36 @@ class SpotRepository(BaseRepository[Spot]):
         Returns:
             Updated spot
         """
+        if spot.status is not False:
+            self._shift_lot_counts(spot.lot_id, -1)
         spot.status = False
+        spot_availability_index.stage(self.session, spot.lot_id, spot.spot_id, False)
+        return spot
+    
+    def claim_spot(self, spot_id: int) -> Optional[Spot]:
+        """
+        Atomically mark a spot as occupied if it is still available
+        
+        Issues a single conditional UPDATE so that of two concurrent
+        transactions only one can take the spot.
+        
+        Args:
+            spot_id: Spot ID
+            
+        Returns:
+            Claimed spot, or None if it does not exist or is already occupied
+        """
+        result = self.session.execute(
+            update(Spot)
+            .where(Spot.spot_id == spot_id, Spot.status == True)
+            .values(status=False)
+        )
+        if result.rowcount != 1:
+            return None
+        
+        spot = self.get_spot_by_id(spot_id)
+        self._shift_lot_counts(spot.lot_id, -1)
+        spot_availability_index.stage(self.session, spot.lot_id, spot.spot_id, False)
         return spot
     
     def mark_as_available(self, spot: Spot) -> Spot:
@@ -99,9 +158,29 @@ class SpotRepository(BaseRepository[Spot]):
         Returns:
             Updated spot
         """
+        if spot.status is not True:
+            self._shift_lot_counts(spot.lot_id, 1)
         spot.status = True
+        spot_availability_index.stage(self.session, spot.lot_id, spot.spot_id, True)
         return spot
     
+    def _shift_lot_counts(self, lot_id: int, available_delta: int) -> None:
+        """
+        Move spots between the lot's available and occupied counters
+        
+        Args:
+            lot_id: Lot ID
+            available_delta: +1 when a spot frees up, -1 when one is taken
+        """
+        self.session.execute(
+            update(Lot)
+            .where(Lot.lot_id == lot_id)
+            .values(
+                available_count=Lot.available_count + available_delta,
+                occupied_count=Lot.occupied_count - available_delta
+            )
+        )
+    
     def count_available_spots(self, lot_id: int) -> int:
         """
         Count available spots in a lot
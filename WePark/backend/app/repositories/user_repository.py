@@ -4,7 +4,7 @@ User Repository - User Data Access
 Handles database operations for users
 """
 
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 from .base_repository import BaseRepository
 from ..models.user import User
 
@@ -51,6 +51,72 @@ class UserRepository(BaseRepository[User]):
         """
         return User.query.filter((User.username == identifier) | (User.email == identifier)).first()
     
+    def find_identity(self, user_id: int) -> Optional[Tuple[int, str, str]]:
+        """
+        Find the columns identifying a user, without loading the full row
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            (user_id, username, email) or None
+        """
+        return self.session.query(User.user_id, User.username, User.email) \
+            .filter(User.user_id == user_id).first()
+    
+    def iter_id_ranges(self, chunk_size: int) -> Iterator[Tuple[int, int]]:
+        """
+        Split all user IDs into consecutive ranges of at most chunk_size users
+        
+        Args:
+            chunk_size: Users per range
+            
+        Returns:
+            Iterator of (first user ID, last user ID), both inclusive
+        """
+        first = last = None
+        count = 0
+        for user_id, in self.session.query(User.user_id).order_by(User.user_id).yield_per(10000):
+            if first is None:
+                first = user_id
+            last = user_id
+            count += 1
+            if count == chunk_size:
+                yield first, last
+                first, count = None, 0
+        if first is not None:
+            yield first, last
+    
+    def find_in_id_range(self, first_user_id: int, last_user_id: int) -> List[User]:
+        """
+        Get users whose ID falls in a range
+        
+        Args:
+            first_user_id: First user ID
+            last_user_id: Last user ID (inclusive)
+            
+        Returns:
+            List of users ordered by ID
+        """
+        return User.query.filter(User.user_id.between(first_user_id, last_user_id)) \
+            .order_by(User.user_id).all()
+    
+    def find_by_pincode(self, pincode: int, limit: Optional[int] = None,
+                        after: Optional[int] = None) -> List[User]:
+        """
+        Find users living in a pincode
+        
+        Args:
+            pincode: Pincode to search for
+            limit: Optional page size
+            after: Optional user ID of the last row of the previous page
+            
+        Returns:
+            List of users
+        """
+        query = User.query.filter_by(pincode=pincode)
+        return self.paginate(query, limit=limit, after=after).all()
+    
     def username_exists(self, username: str) -> bool:
         """
         Check if username already exists
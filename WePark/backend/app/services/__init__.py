@@ -11,6 +11,9 @@ from .reservation_service import ReservationService
 from .user_service import UserService
 from .payment_service import PaymentService
 from .notification_service import NotificationService
+from .stats_service import StatsService
+from .export_service import ExportService
+from .seed_service import SeedService
 
 __all__ = [
     'AuthService',
@@ -20,4 +23,7 @@ __all__ = [
     'UserService',
     'PaymentService',
     'NotificationService',
+    'StatsService',
+    'ExportService',
+    'SeedService',
 ]
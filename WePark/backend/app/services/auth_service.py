@@ -5,11 +5,16 @@ Handles user/admin authentication, registration, and authorization
 """
 
 from typing import Optional, Dict, Any
+from flask import current_app
 from flask_jwt_extended import create_access_token
 from ..repositories.user_repository import UserRepository
 from ..repositories.admin_repository import AdminRepository
+from ..repositories.principal_repository import Principal, PrincipalRepository
 from ..models.user import User
 from ..models.admin import Admin
+from ..utils.cache_helpers import forget_login_misses, login_miss_key
+from ..utils.passwords import PasswordPoolBusy, hash_password, needs_rehash, verify_password
+from .. import cache
 
 
 class AuthService:
@@ -18,6 +23,7 @@ class AuthService:
     def __init__(self):
         self.user_repo = UserRepository()
         self.admin_repo = AdminRepository()
+        self.principal_repo = PrincipalRepository()
     
     
     def register_user(self, username: str, email: str, password: str, 
@@ -50,12 +56,16 @@ class AuthService:
             
             self.user_repo.session.add(user)
             self.user_repo.commit()
+            forget_login_misses(username, email)
             
             return {
                 'success': True,
                 'message': 'User registered successfully!',
                 'user_id': user.user_id
             }
+        except PasswordPoolBusy:
+            self.user_repo.rollback()
+            raise
         except Exception as e:
             # Rollback on any database error
             self.user_repo.rollback()
@@ -65,91 +75,105 @@ class AuthService:
                 'error': str(e)
             }
     
-    def login_user(self, username: str, password: str) -> Dict[str, Any]:
+    def register_admin(self, username: str, email: str, password: str) -> Dict[str, Any]:
         """
-        Authenticate a user
+        Create an admin account
         
         Args:
-            username: Username or Email
+            username: Admin username
+            email: Admin email
             password: Plain text password
             
         Returns:
-            Result dictionary with access token
+            Result dictionary with admin_id
         """
-        user = self.user_repo.find_by_username_or_email(username)
-        
-        if not user:
+        try:
+            if self.admin_repo.username_exists(username) or self.admin_repo.email_exists(email):
+                return {
+                    'success': False,
+                    'message': 'Admin already exists!'
+                }
+            
+            admin = Admin(username=username, email=email)
+            admin.hash_password(password)
+            
+            self.admin_repo.session.add(admin)
+            self.admin_repo.commit()
+            forget_login_misses(username, email)
+            
             return {
-                'success': False,
-                'message': 'Invalid username or password'
+                'success': True,
+                'message': 'Admin created successfully!',
+                'admin_id': admin.admin_id
             }
-        
-        if not user.check_password(password):
+        except Exception as e:
+            self.admin_repo.rollback()
             return {
                 'success': False,
-                'message': 'Invalid username or password'
-            }
-        
-        # Create access token
-        access_token = create_access_token(
-            identity=user.username,
-            additional_claims={
-                'role': 'user',
-                'id': user.user_id
+                'message': 'Something went wrong!',
+                'error': str(e)
             }
-        )
-        
-        return {
-            'success': True,
-            'message': 'Login successful',
-            'access_token': access_token,
-            'role': 'user',
-            'user_id': user.user_id,
-            'username': user.username
-        }
     
-    def login_admin(self, username: str, password: str) -> Dict[str, Any]:
+    def login(self, identifier: str, password: str) -> Dict[str, Any]:
         """
-        Authenticate an admin
+        Authenticate an admin or a user with a single lookup
+        
+        Admins take precedence when both match. Identifiers matching nobody
+        are remembered for LOGIN_NEGATIVE_CACHE_TTL seconds so repeated
+        attempts skip the query.
         
         Args:
-            username: Admin username or Email
+            identifier: Username or email (already lower-cased)
             password: Plain text password
             
         Returns:
-            Result dictionary with access token
+            Result dictionary with access token and role
+            
+        Raises:
+            PasswordPoolBusy: If the password hashing queue is full
         """
-        admin = self.admin_repo.find_by_username_or_email(username)
-        
-        if not admin:
-            return {
-                'success': False,
-                'message': 'Invalid username or password'
-            }
-        
-        if not admin.check_password(password):
-            return {
-                'success': False,
-                'message': 'Invalid username or password'
-            }
-        
-        # Create access token
-        access_token = create_access_token(
-            identity=admin.username,
-            additional_claims={
-                'role': 'admin',
-                'id': admin.admin_id
-            }
-        )
-        
-        return {
-            'success': True,
-            'message': 'Login successful',
-            'access_token': access_token,
-            'role': 'admin',
-            'admin_id': admin.admin_id,
-            'username': admin.username
+        failure = {
+            'success': False,
+            'message': 'Invalid username or password'
         }
+        miss_key = login_miss_key(identifier)
+        if cache.get(miss_key):
+            return failure
+        
+        principals = self.principal_repo.find_by_username_or_email(identifier)
+        if not principals:
+            cache.set(miss_key, True, timeout=current_app.config['LOGIN_NEGATIVE_CACHE_TTL'])
+            return failure
+        
+        for principal in principals:
+            if verify_password(principal.password, password):
+                if needs_rehash(principal.password):
+                    self._rehash(principal, password)
+                access_token = create_access_token(
+                    identity=principal.username,
+                    additional_claims={
+                        'role': principal.role,
+                        'id': principal.id
+                    }
+                )
+                return {
+                    'success': True,
+                    'message': 'Login successful',
+                    'access_token': access_token,
+                    'role': principal.role,
+                    f'{principal.role}_id': principal.id,
+                    'username': principal.username
+                }
+        return failure
+    
+    def _rehash(self, principal: Principal, password: str) -> None:
+        """Upgrade a verified password's stored hash; a failure leaves the old one"""
+        try:
+            self.principal_repo.update_password(principal, hash_password(password))
+            self.principal_repo.commit()
+        except Exception as e:
+            self.principal_repo.rollback()
+            current_app.logger.warning("Password rehash failed for %s %s: %s", principal.role, principal.id, e)
     
     def verify_user_credentials(self, username: str, password: str) -> bool:
         """
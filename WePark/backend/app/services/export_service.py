@@ -0,0 +1,164 @@
+# WePark/backend/app/services/export_service.py
+"""
+Export Service - Reservation Export Business Logic
+Streams reservation exports as CSV or NDJSON chunks with bounded memory
+"""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+import zlib
+from datetime import datetime
+from typing import IO, Any, Iterable, Iterator, List, Optional, Sequence
+from flask import current_app
+from ..repositories.reservation_repository import ReservationRepository
+
+
+class ExportService:
+    """Service for reservation exports"""
+
+    USAGE_HEADERS = ["reservation_id", "lot_id", "spot_id", "prime_location", "parking_cost", "parking_timestamp"]
+
+    RESERVATION_HEADERS = ["reservation_id", "user_id", "username", "email", "lot_id", "prime_location",
+                           "spot_id", "vehicle_number", "parking_timestamp", "leaving_timestamp",
+                           "parking_cost", "payment_status"]
+
+    # Format -> (file extension, uncompressed content type)
+    FORMATS = {
+        "csv": ("csv", "text/csv"),
+        "ndjson": ("ndjson", "application/x-ndjson")
+    }
+
+    def __init__(self):
+        self.reservation_repo = ReservationRepository()
+
+    def iter_user_usage_csv(self, user_id: int) -> Iterator[str]:
+        """
+        Generate a user's usage CSV, one chunk of rows at a time
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Iterator of CSV text chunks, the header row first
+        """
+        batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+        rows = self.reservation_repo.iter_usage_rows(user_id, batch_size=batch_size)
+        return self.iter_csv(self.USAGE_HEADERS, rows, batch_size)
+
+    def iter_reservations(self, export_format: str, start: Optional[datetime] = None,
+                          end: Optional[datetime] = None, lot_id: Optional[int] = None) -> Iterator[str]:
+        """
+        Generate an admin export of reservations across all users
+
+        Args:
+            export_format: 'csv' or 'ndjson'
+            start: Optional inclusive lower bound on parking time
+            end: Optional exclusive upper bound on parking time
+            lot_id: Optional lot to restrict the export to
+
+        Returns:
+            Iterator of text chunks
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(f"format must be one of {', '.join(self.FORMATS)}")
+
+        batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+        rows = self.reservation_repo.iter_export_rows(start=start, end=end, lot_id=lot_id,
+                                                      batch_size=batch_size)
+        if export_format == "ndjson":
+            return self.iter_ndjson(self.RESERVATION_HEADERS, rows, batch_size)
+        return self.iter_csv(self.RESERVATION_HEADERS, rows, batch_size)
+
+    def iter_csv(self, headers: List[str], rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[str]:
+        """
+        Encode rows as CSV, yielding a text chunk every batch_size rows
+
+        Args:
+            headers: Header row
+            rows: Iterable of row value sequences
+            batch_size: Rows per yielded chunk
+
+        Returns:
+            Iterator of CSV text chunks
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(headers)
+        pending = 0
+        for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending >= batch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        yield buffer.getvalue()
+
+    def iter_ndjson(self, headers: List[str], rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[str]:
+        """
+        Encode rows as one JSON object per line, yielding every batch_size rows
+
+        Args:
+            headers: Object keys, in row value order
+            rows: Iterable of row value sequences
+            batch_size: Rows per yielded chunk
+
+        Returns:
+            Iterator of NDJSON text chunks
+        """
+        lines: List[str] = []
+        for row in rows:
+            record = {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in zip(headers, row)
+            }
+            lines.append(json.dumps(record))
+            if len(lines) >= batch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    def iter_gzip(self, chunks: Iterable[str]) -> Iterator[bytes]:
+        """
+        Gzip text chunks on the fly for a streamed response
+
+        Args:
+            chunks: Iterable of text chunks
+
+        Returns:
+            Iterator of gzip member bytes
+        """
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode("utf-8"))
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def spool_gzip(self, chunks: Iterable[str]) -> IO[bytes]:
+        """
+        Gzip text chunks into a spooled temporary file
+
+        The file stays in memory up to EXPORT_SPOOL_MAX_BYTES of compressed
+        output and rolls over to disk beyond that.
+
+        Args:
+            chunks: Iterable of text chunks
+
+        Returns:
+            Temporary file positioned at the start (caller closes it)
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=current_app.config["EXPORT_SPOOL_MAX_BYTES"])
+        with gzip.GzipFile(fileobj=spool, mode="wb") as compressed:
+            for chunk in chunks:
+                compressed.write(chunk.encode("utf-8"))
+        spool.seek(0)
+        return spool
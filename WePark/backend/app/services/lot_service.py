@@ -7,6 +7,7 @@ Handles all business operations related to parking lots
 from typing import List, Optional, Dict, Any
 from ..repositories.lot_repository import LotRepository
 from ..repositories.spot_repository import SpotRepository
+from ..repositories.spot_availability_index import spot_availability_index
 from .. import db
 
 
@@ -27,15 +28,17 @@ class LotService:
                 price_per_hour=price_per_hour,
                 address=address,
                 pincode=pincode,
-                no_of_spots=no_of_spots
+                no_of_spots=no_of_spots,
+                available_count=no_of_spots,
+                occupied_count=0
             )
             self.lot_repo.flush()
             
             # Step 2: Generate individual spots for this lot
-            for _ in range(no_of_spots):
-                self.spot_repo.create(lot_id=lot.lot_id)
+            self.spot_repo.create_for_lot(lot.lot_id, int(no_of_spots))
             
             self.lot_repo.commit()
+            spot_availability_index.reload_lot(lot.lot_id)
             
             return {
                 'success': True,
@@ -60,7 +63,7 @@ class LotService:
         Returns:
             Lot details dictionary or None
         """
-        lot = self.lot_repo.get_by_id(lot_id)
+        lot = self.lot_repo.get_lot_with_spots(lot_id)
         if not lot:
             return None
         
@@ -72,16 +75,19 @@ class LotService:
         """
         Get all lots with optional filters
         
+        Lots are returned as summaries with spot counts only; use
+        get_lot_by_id for the full spot list of a lot.
+        
         Args:
             name: Optional location name filter
             pincode: Optional pincode filter
             address: Optional address filter
             
         Returns:
-            List of lot details
+            List of lot summaries
         """
         lots = self.lot_repo.search_lots(name=name, pincode=pincode, address=address)
-        return [self._format_lot_details(lot) for lot in lots]
+        return [self._format_lot_summary(lot) for lot in lots]
     
     def update_lot(self, lot_id: int, **kwargs) -> Dict[str, Any]:
         """
@@ -133,7 +139,7 @@ class LotService:
             Result dictionary
         """
         try:
-            lot = self.lot_repo.get_by_id(lot_id)
+            lot = self.lot_repo.get_lot_for_delete(lot_id)
             if not lot:
                 return {
                     'success': False,
@@ -146,12 +152,15 @@ class LotService:
                     'message': 'This Parking Lot cannot be deleted. One or more spots are occupied!'
                 }
             
+            spot_ids = [spot.spot_id for spot in lot.spots]
             self.lot_repo.delete(lot)
             self.lot_repo.commit()
+            spot_availability_index.forget_lot(lot_id)
             
             return {
                 'success': True,
-                'message': 'Parking lot deleted successfully!'
+                'message': 'Parking lot deleted successfully!',
+                'spot_ids': spot_ids
             }
         except Exception as e:
             self.lot_repo.rollback()
@@ -161,15 +170,43 @@ class LotService:
                 'error': str(e)
             }
     
-    def _format_lot_details(self, lot) -> Dict[str, Any]:
+    def repair_spot_counts(self, dry_run: bool = False) -> List[Dict[str, Any]]:
         """
-        Format lot object to dictionary
+        Recompute every lot's spot counters from the spots table
+        
+        Args:
+            dry_run: If True, only report drift without fixing it
+            
+        Returns:
+            List of lots whose stored counters had drifted
+        """
+        counts = self.lot_repo.count_spots_by_lot()
+        drifted = []
+        for lot in self.lot_repo.get_all():
+            available, occupied = counts.get(lot.lot_id, (0, 0))
+            if (lot.available_count, lot.occupied_count) == (available, occupied):
+                continue
+            drifted.append({
+                'lot_id': lot.lot_id,
+                'stored': {'available': lot.available_count, 'occupied': lot.occupied_count},
+                'actual': {'available': available, 'occupied': occupied}
+            })
+            if not dry_run:
+                self.lot_repo.update(lot, available_count=available, occupied_count=occupied)
+        
+        if not dry_run:
+            self.lot_repo.commit()
+        return drifted
+    
+    def _format_lot_summary(self, lot) -> Dict[str, Any]:
+        """
+        Format lot object to dictionary without its spots
         
         Args:
             lot: Lot model instance
             
         Returns:
-            Formatted lot dictionary
+            Formatted lot dictionary with spot counts
         """
         return {
             'lot_id': lot.lot_id,
@@ -178,6 +215,22 @@ class LotService:
             'address': lot.address,
             'pincode': lot.pincode,
             'no_of_spots': lot.no_of_spots,
+            'available_count': lot.available_count,
+            'occupied_count': lot.occupied_count
+        }
+    
+    def _format_lot_details(self, lot) -> Dict[str, Any]:
+        """
+        Format lot object to dictionary including every spot
+        
+        Args:
+            lot: Lot model instance
+            
+        Returns:
+            Formatted lot dictionary
+        """
+        return {
+            **self._format_lot_summary(lot),
             'spots': [{
                 'spot_id': spot.spot_id,
                 'status': spot.status
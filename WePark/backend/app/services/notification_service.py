@@ -47,21 +47,24 @@ class NotificationService:
                 'error': str(e)
             }
     
-    def get_user_notifications(self, user_id: int, unread_only: bool = False) -> List[Dict[str, Any]]:
+    def get_user_notifications(self, user_id: int, unread_only: bool = False,
+                               limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get notifications for a user
+        Get notifications for a user, newest first
         
         Args:
             user_id: User ID
             unread_only: If True, return only unread notifications
+            limit: Optional page size
+            after: Optional notification ID of the last row of the previous page
             
         Returns:
             List of notification details
         """
         if unread_only:
-            notifications = self.notification_repo.find_unread_by_user(user_id)
+            notifications = self.notification_repo.find_unread_by_user(user_id, limit=limit, after=after)
         else:
-            notifications = self.notification_repo.find_by_user(user_id)
+            notifications = self.notification_repo.find_by_user(user_id, limit=limit, after=after)
         
         return [self._format_notification_details(n) for n in notifications]
     
@@ -11,18 +11,24 @@ from ..repositories.spot_repository import SpotRepository
 from ..repositories.lot_repository import LotRepository
 from ..repositories.notification_repository import NotificationRepository
 from ..repositories.user_repository import UserRepository
+from ..repositories.daily_lot_usage_repository import DailyLotUsageRepository
+from ..repositories.spot_availability_index import spot_availability_index
 from .. import db
 
 
 class ReservationService:
     """Service for reservation operations"""
     
+    # Bookings retried when the in-memory index hands out a stale spot
+    ALLOCATION_ATTEMPTS = 3
+    
     def __init__(self):
         self.reservation_repo = ReservationRepository()
         self.spot_repo = SpotRepository()
         self.lot_repo = LotRepository()
         self.notification_repo = NotificationRepository()
         self.user_repo = UserRepository()
+        self.usage_repo = DailyLotUsageRepository()
     
     def create_reservation(self, user_id: int, spot_id: int, vehicle_number: str = "Unknown") -> Dict[str, Any]:
         """
@@ -37,15 +43,16 @@ class ReservationService:
             Result dictionary
         """
         try:
-            # Check if spot exists and is available
-            spot = self.spot_repo.get_spot_by_id(spot_id)
+            # Claim the spot first; the conditional UPDATE is the only check
+            # that holds up against concurrent bookings
+            spot = self.spot_repo.claim_spot(spot_id)
             if not spot:
-                return {
-                    'success': False,
-                    'message': 'Spot not found'
-                }
-            
-            if spot.status is False:
+                self.reservation_repo.rollback()
+                if not self.spot_repo.get_spot_by_id(spot_id):
+                    return {
+                        'success': False,
+                        'message': 'Spot not found'
+                    }
                 return {
                     'success': False,
                     'message': 'Spot is already occupied'
@@ -58,9 +65,6 @@ class ReservationService:
                 vehicle_number=vehicle_number
             )
             
-            # Mark spot as occupied
-            self.spot_repo.mark_as_occupied(spot)
-            
             # Get lot details for notification
             lot = self.lot_repo.get_by_id(spot.lot_id)
             
@@ -77,7 +81,9 @@ class ReservationService:
             return {
                 'success': True,
                 'message': 'Spot booked successfully!',
-                'reservation_id': reservation.reservation_id
+                'reservation_id': reservation.reservation_id,
+                'spot_id': spot.spot_id,
+                'lot_id': spot.lot_id
             }
         except Exception as e:
             self.reservation_repo.rollback()
@@ -87,6 +93,90 @@ class ReservationService:
                 'error': str(e)
             }
     
+    def create_reservation_in_lot(self, user_id: int, lot_id: int, vehicle_number: str = "Unknown") -> Dict[str, Any]:
+        """
+        Book the first free spot of a lot
+        
+        Args:
+            user_id: User ID
+            lot_id: Lot ID
+            vehicle_number: Vehicle registration number
+            
+        Returns:
+            Result dictionary
+        """
+        result = {
+            'success': False,
+            'message': 'No available spots in this parking lot'
+        }
+        for _ in range(self.ALLOCATION_ATTEMPTS):
+            spot_id = spot_availability_index.find_free_spot(lot_id)
+            if spot_id is None:
+                # The index can miss releases made by other worker processes
+                spot = self.spot_repo.find_first_available(lot_id)
+                if not spot:
+                    return {
+                        'success': False,
+                        'message': 'No available spots in this parking lot'
+                    }
+                spot_id = spot.spot_id
+                spot_availability_index.reload_lot(lot_id)
+            
+            result = self.create_reservation(user_id, spot_id, vehicle_number)
+            if result['success']:
+                return result
+            
+            # Spot was taken elsewhere; resync this lot before retrying
+            spot_availability_index.reload_lot(lot_id)
+        
+        return result
+    
+    def occupy_reservation(self, reservation_id: int) -> Dict[str, Any]:
+        """
+        Mark a reservation as parked
+        
+        The booking is counted in the lot's usage for the day it was parked,
+        the same date the rollup backfill reads from the reservation row.
+        
+        Args:
+            reservation_id: Reservation ID
+            
+        Returns:
+            Result dictionary with the parking time
+        """
+        try:
+            reservation = self.reservation_repo.get_reservation_by_id(reservation_id)
+            if not reservation:
+                return {
+                    'success': False,
+                    'message': 'Reservation not found'
+                }
+            
+            if reservation.parking_timestamp is not None:
+                return {
+                    'success': False,
+                    'message': 'Spot already occupied'
+                }
+            
+            reservation.parking_timestamp = datetime.now()
+            spot = self.spot_repo.get_spot_by_id(reservation.spot_id)
+            self.usage_repo.increment(spot.lot_id, reservation.parking_timestamp.date(), bookings=1)
+            self.reservation_repo.commit()
+            
+            return {
+                'success': True,
+                'message': 'Spot occupied successfully',
+                'parking_time': reservation.parking_timestamp,
+                'user_id': reservation.user_id
+            }
+        except Exception as e:
+            self.reservation_repo.rollback()
+            return {
+                'success': False,
+                'message': 'Something went wrong!',
+                'error': str(e)
+            }
+    
     def complete_reservation(self, reservation_id: int) -> Dict[str, Any]:
         """
         Complete a reservation (release spot)
@@ -122,9 +212,19 @@ class ReservationService:
             )
             # Set parking_cost on reservation
             reservation.parking_cost = total_amount
+            reservation.cost_in_rupees = True
 
             # Mark reservation as completed
             self.reservation_repo.mark_as_completed(reservation)
+            
+            # Roll the completion into the lot's usage for the day it ended;
+            # a booking never parked is counted on that day too
+            left = reservation.leaving_timestamp
+            parked = reservation.parking_timestamp
+            self.usage_repo.increment(
+                lot.lot_id, left.date(), bookings=0 if parked else 1, completed=1, revenue=reservation.revenue,
+                occupied_hours=(left - parked).total_seconds() / 3600 if parked else 0
+            )
 
             # Mark spot as available
             self.spot_repo.mark_as_available(spot)
@@ -135,7 +235,10 @@ class ReservationService:
                 'success': True,
                 'message': 'Reservation completed successfully',
                 'total_amount': total_amount,
-                'reservation_id': reservation_id
+                'reservation_id': reservation_id,
+                'user_id': reservation.user_id,
+                'spot_id': spot.spot_id,
+                'lot_id': spot.lot_id
             }
         except Exception as e:
             self.reservation_repo.rollback()
@@ -145,21 +248,24 @@ class ReservationService:
                 'error': str(e)
             }
     
-    def get_user_reservations(self, user_id: int, active_only: bool = False) -> List[Dict[str, Any]]:
+    def get_user_reservations(self, user_id: int, active_only: bool = False,
+                              limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get reservations for a user
         
         Args:
             user_id: User ID
             active_only: If True, return only active reservations
+            limit: Optional page size
+            after: Optional reservation ID of the last row of the previous page
             
         Returns:
             List of reservation details
         """
         if active_only:
-            reservations = self.reservation_repo.find_active_by_user(user_id)
+            reservations = self.reservation_repo.find_active_by_user(user_id, limit=limit, after=after)
         else:
-            reservations = self.reservation_repo.find_by_user(user_id)
+            reservations = self.reservation_repo.find_by_user(user_id, limit=limit, after=after)
         
         return [self._format_reservation_details(r) for r in reservations]
     
@@ -0,0 +1,272 @@
+# WePark/backend/app/services/seed_service.py
+"""
+Seed Service - Synthetic Data Generation
+Fills a database with lots, spots, users and years of reservation history
+for reproducing production-scale behaviour locally
+"""
+
+import math
+import random
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from ..repositories.lot_repository import LotRepository
+from ..repositories.spot_repository import SpotRepository
+from ..repositories.user_repository import UserRepository
+from ..repositories.reservation_repository import ReservationRepository
+from ..repositories.daily_lot_usage_repository import DailyLotUsageRepository
+from ..repositories.spot_availability_index import spot_availability_index
+from ..utils.passwords import hash_password
+
+
+# Relative arrival rate per hour of day: morning and evening peaks
+HOURLY_ARRIVALS = (1, 1, 1, 1, 1, 2, 4, 8, 12, 11, 9, 8, 8, 8, 7, 7, 8, 10, 11, 9, 6, 4, 2, 1)
+WEEKEND_ARRIVALS = 0.6
+# Parking durations are log-normal around a median of 1.5 hours
+MEDIAN_HOURS = 1.5
+DURATION_SIGMA = 0.75
+MIN_HOURS = 0.25
+MAX_HOURS = 12.0
+# Share of bookings made at a lot in the user's own pincode
+HOME_PINCODE_SHARE = 0.8
+UNPAID_SHARE = 0.03
+FIRST_PINCODE = 600001
+
+
+class SeedService:
+    """Service for generating synthetic data in bulk"""
+    
+    def __init__(self, rng: Optional[random.Random] = None,
+                 progress: Optional[Callable[[str, int], None]] = None):
+        """
+        Args:
+            rng: Random generator (seed it for repeatable data)
+            progress: Optional callback called with (table, rows inserted so far)
+        """
+        self.rng = rng or random.Random()
+        self.progress = progress
+        self.lot_repo = LotRepository()
+        self.spot_repo = SpotRepository()
+        self.user_repo = UserRepository()
+        self.reservation_repo = ReservationRepository()
+        self.usage_repo = DailyLotUsageRepository()
+    
+    def seed(self, lots: int, spots_per_lot: int, users: int, reservations: int,
+             years: float = 2.0, pincodes: int = 20, password: str = "password123",
+             chunk_size: int = 10_000) -> Dict[str, Any]:
+        """
+        Append generated lots, spots, users and reservation history
+        
+        Rows are inserted with one executemany per chunk and committed per
+        chunk, so memory stays flat and an interrupted run keeps what it
+        wrote. Generated rows take explicit IDs after the current maximum,
+        so seeding an existing database adds to it. Every reservation is
+        completed before now, so spots are left free, and a spot never holds
+        two reservations at once (an arrival goes to another spot, or another
+        lot, when its pick is taken). The daily usage rollup
+        (over the generated date range) and the spot availability index are
+        rebuilt at the end.
+        
+        Pincodes and user activity are skewed (a few busy areas and frequent
+        parkers), arrivals follow daily peaks with quieter weekends and
+        durations are log-normal.
+        
+        Args:
+            lots: Number of lots to create
+            spots_per_lot: Spots in each lot
+            users: Number of users to create
+            reservations: Number of past reservations to create
+            years: How far back the history goes
+            pincodes: Number of distinct pincodes
+            password: Password shared by all generated users
+            chunk_size: Rows per executemany and transaction
+        
+        Returns:
+            Result dictionary with the number of rows written per table
+        """
+        if min(lots, spots_per_lot, users, pincodes) < 1 or reservations < 0 or years <= 0:
+            return {
+                'success': False,
+                'message': 'Counts must be positive'
+            }
+        try:
+            pincode_weights = [1 / (rank + 1) for rank in range(pincodes)]
+            lot_rows = self._lots(lots, spots_per_lot, pincode_weights)
+            user_rows = self._users(users, pincode_weights, hash_password(password), chunk_size)
+            # History ends early enough that every generated reservation has
+            # been left by now, even when parked late on the last day
+            end = (datetime.now() - timedelta(hours=MAX_HOURS)).replace(hour=0, minute=0, second=0,
+                                                                          microsecond=0)
+            first_day = end - timedelta(days=max(1, int(365 * years)))
+            written = self._reservations(reservations, first_day, end, lot_rows, user_rows,
+                                         spots_per_lot, chunk_size)
+            usage_rows = self.usage_repo.rebuild(start=first_day.date())
+            self.usage_repo.commit()
+            spot_availability_index.rebuild()
+            
+            return {
+                'success': True,
+                'message': 'Database seeded successfully',
+                'lots': len(lot_rows),
+                'spots': len(lot_rows) * spots_per_lot,
+                'users': len(user_rows),
+                'reservations': written,
+                'usage_rows': usage_rows
+            }
+        except Exception as e:
+            self.reservation_repo.rollback()
+            return {
+                'success': False,
+                'message': 'Something went wrong!',
+                'error': str(e)
+            }
+    
+    def _report(self, table: str, rows: int) -> None:
+        if self.progress:
+            self.progress(table, rows)
+    
+    def _lots(self, count: int, spots_per_lot: int, pincode_weights: List[float]) -> List[Dict[str, Any]]:
+        first_lot = self.lot_repo.last_id() + 1
+        first_spot = self.spot_repo.last_id() + 1
+        pincodes = self.rng.choices(range(FIRST_PINCODE, FIRST_PINCODE + len(pincode_weights)),
+                                    weights=pincode_weights, k=count)
+        rows = [{
+            "lot_id": first_lot + i,
+            "prime_location": f"Seed Lot {first_lot + i}",
+            "price_per_hour": self.rng.randrange(20, 101, 5),
+            "address": f"{first_lot + i} Seed Road",
+            "pincode": pincodes[i],
+            "no_of_spots": spots_per_lot,
+            "available_count": spots_per_lot,
+            "occupied_count": 0,
+        } for i in range(count)]
+        self.lot_repo.bulk_create(rows, commit=True)
+        self._report("lots", count)
+        for i, lot in enumerate(rows):
+            lot["first_spot"] = first_spot + i * spots_per_lot
+        
+        spots = ({"spot_id": lot["first_spot"] + offset, "lot_id": lot["lot_id"], "status": True}
+                 for lot in rows for offset in range(spots_per_lot))
+        self._report("spots", self.spot_repo.bulk_create(spots, chunk_size=50_000, commit=True))
+        return rows
+    
+    def _users(self, count: int, pincode_weights: List[float], password_hash: str,
+               chunk_size: int) -> List[Dict[str, Any]]:
+        first_user = self.user_repo.last_id() + 1
+        pincodes = self.rng.choices(range(FIRST_PINCODE, FIRST_PINCODE + len(pincode_weights)),
+                                    weights=pincode_weights, k=count)
+        rows = []
+        
+        def generate() -> Iterator[Dict[str, Any]]:
+            for i in range(count):
+                user_id = first_user + i
+                rows.append({"user_id": user_id, "pincode": pincodes[i],
+                             "vehicle_number": f"TN{user_id % 100:02d}SD{user_id % 10000:04d}",
+                             # Heavy-tailed booking frequency
+                             "activity": self.rng.paretovariate(1.5)})
+                yield {
+                    "user_id": user_id,
+                    "username": f"seed{user_id}",
+                    "email": f"seed{user_id}@example.com",
+                    "password": password_hash,
+                    "address": f"{user_id} Seed Street",
+                    "pincode": pincodes[i],
+                }
+        
+        self._report("users", self.user_repo.bulk_create(generate(), chunk_size=chunk_size, commit=True))
+        return rows
+    
+    def _daily_arrivals(self, total: int, first_day: datetime, days: int) -> Iterator[int]:
+        """Spread total bookings over days, weekends quieter, in day order"""
+        weights = [WEEKEND_ARRIVALS if (first_day + timedelta(days=d)).weekday() >= 5 else 1.0
+                   for d in range(days)]
+        scale = total / sum(weights)
+        remaining = total
+        for weight in weights[:-1]:
+            expected = weight * scale
+            count = min(remaining, int(expected) + (self.rng.random() < expected % 1))
+            remaining -= count
+            yield count
+        yield remaining
+    
+    def _reservations(self, count: int, first_day: datetime, end: datetime, lots: List[Dict[str, Any]],
+                      users: List[Dict[str, Any]], spots_per_lot: int, chunk_size: int) -> int:
+        rng = self.rng
+        random_, lognormvariate = rng.random, rng.lognormvariate
+        lots_by_pincode: Dict[int, List[Dict[str, Any]]] = {}
+        for lot in lots:
+            lots_by_pincode.setdefault(lot["pincode"], []).append(lot)
+        user_weights = list(accumulate(user["activity"] for user in users))
+        hour_weights = list(accumulate(HOURLY_ARRIVALS))
+        mu = math.log(MEDIAN_HOURS)
+        days = (end - first_day).days
+        # Seconds since first_day at which each spot of each lot is next free
+        free_at = {lot["lot_id"]: [0.0] * spots_per_lot for lot in lots}
+        
+        def free_spot(lot: Dict[str, Any], at: float) -> Optional[int]:
+            """Random spot of the lot that is free at `at`, probing onwards from it"""
+            spots = free_at[lot["lot_id"]]
+            first = int(random_() * spots_per_lot)
+            for offset in range(spots_per_lot):
+                index = (first + offset) % spots_per_lot
+                if spots[index] <= at:
+                    return index
+            return None
+        
+        def generate() -> Iterator[Dict[str, Any]]:
+            for day, arrivals in enumerate(self._daily_arrivals(count, first_day, days)):
+                if not arrivals:
+                    continue
+                midnight = first_day + timedelta(days=day)
+                hours = rng.choices(range(24), cum_weights=hour_weights, k=arrivals)
+                # Sorting keeps reservation IDs in arrival order, as in production
+                starts = sorted(hour * 3600 + rng.randrange(3600) for hour in hours)
+                for user, start in zip(rng.choices(users, cum_weights=user_weights, k=arrivals), starts):
+                    nearby = lots_by_pincode.get(user["pincode"])
+                    lot = rng.choice(nearby) if nearby and random_() < HOME_PINCODE_SHARE \
+                        else rng.choice(lots)
+                    at = day * 86400 + start
+                    index = free_spot(lot, at)
+                    if index is None:
+                        # Every spot of the pick is taken; try the others
+                        for lot in rng.sample(lots, len(lots)):
+                            index = free_spot(lot, at)
+                            if index is not None:
+                                break
+                        else:
+                            raise ValueError(f"Not enough spots for {arrivals} arrivals on "
+                                             f"{midnight.date()}; add lots or spots per lot")
+                    duration = min(MAX_HOURS, max(MIN_HOURS, lognormvariate(mu, DURATION_SIGMA)))
+                    free_at[lot["lot_id"]][index] = at + duration * 3600
+                    parked = midnight + timedelta(seconds=start)
+                    yield {
+                        "spot_id": lot["first_spot"] + index,
+                        "user_id": user["user_id"],
+                        "parking_timestamp": parked,
+                        "leaving_timestamp": parked + timedelta(hours=duration),
+                        "parking_cost": round(duration * lot["price_per_hour"], 2),
+                        "vehicle_number": user["vehicle_number"],
+                        "payment_status": random_() >= UNPAID_SHARE,
+                    }
+    
+        # Index maintenance dominates insert time; when the load at least
+        # doubles the table, building the indexes once afterwards is cheaper
+        defer = count > self.reservation_repo.last_id()
+        written = 0
+        with self.reservation_repo.deferred_indexes() if defer else nullcontext():
+            for batch in self._batches(generate(), chunk_size):
+                written += self.reservation_repo.bulk_create(batch, chunk_size=chunk_size, commit=True)
+                self._report("reservations", written)
+        return written
+    
+    @staticmethod
+    def _batches(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -172,8 +172,8 @@ class SpotService:
             }
         
         total_spots = lot.no_of_spots
-        available_count = self.spot_repo.count_available_spots(lot_id)
-        occupied_count = self.spot_repo.count_occupied_spots(lot_id)
+        available_count = lot.available_count
+        occupied_count = lot.occupied_count
         
         return {
             'success': True,
@@ -0,0 +1,94 @@
+# WePark/backend/app/services/stats_service.py
+"""
+Stats Service - Dashboard Statistics Business Logic
+Builds admin and user dashboard figures from aggregate queries
+"""
+
+import calendar
+from typing import Any, Dict, Optional
+from datetime import datetime
+from ..repositories.reservation_repository import ReservationRepository
+from ..repositories.daily_lot_usage_repository import DailyLotUsageRepository
+from ..utils.cache_helpers import remember, user_tag
+from ..utils.datetime_helpers import get_past_months
+
+
+class StatsService:
+    """Service for dashboard statistics"""
+    
+    # Dashboard entries are also invalidated on every booking change of the user
+    USER_STATS_TIMEOUT = 300
+    
+    def __init__(self):
+        self.reservation_repo = ReservationRepository()
+        self.usage_repo = DailyLotUsageRepository()
+    
+    def get_admin_stats(self, start: Optional[datetime] = None,
+                        end: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Count bookings per lot location for the admin dashboard
+        
+        Reads the daily_lot_usage rollup, so any date range costs one row per
+        lot and day rather than a scan of reservation history.
+        
+        Args:
+            start: Optional inclusive lower bound (day of start is included)
+            end: Optional exclusive upper bound (day of end is excluded)
+            
+        Returns:
+            Dictionary of prime_location -> booking count
+        """
+        rows = self.usage_repo.sum_by_lot(start=start.date() if start else None,
+                                          end=end.date() if end else None)
+        reservations_per_lot: Dict[str, int] = {}
+        for _, prime_location, bookings, *_ in rows:
+            # Lots sharing a location name are reported together
+            reservations_per_lot[prime_location] = reservations_per_lot.get(prime_location, 0) + bookings
+        return reservations_per_lot
+    
+    def get_user_stats(self, user_id: int) -> Dict[str, Any]:
+        """
+        Build a user's dashboard, cached until their reservations change
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Dashboard dictionary
+        """
+        return remember(f"stats:user:{user_id}", [user_tag(user_id)], self.USER_STATS_TIMEOUT,
+                        lambda: self._compute_user_stats(user_id))
+    
+    def _compute_user_stats(self, user_id: int) -> Dict[str, Any]:
+        """
+        Build a user's dashboard from two aggregate queries
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Dashboard dictionary
+        """
+        months = get_past_months(k=4)
+        month_bounds = [
+            (datetime(year, month, 1), datetime(year + month // 12, month % 12 + 1, 1))
+            for year, month in months
+        ]
+        summary = self.reservation_repo.summarize_user(user_id, month_bounds)
+        
+        reservations_per_lot: Dict[str, int] = {}
+        for _, prime_location, count in self.reservation_repo.count_by_lot(user_id=user_id):
+            reservations_per_lot[prime_location] = reservations_per_lot.get(prime_location, 0) + count
+        most_visited_lot = max(reservations_per_lot, key=reservations_per_lot.get) if reservations_per_lot else None
+        
+        return {
+            "total_reservations": summary['total'],
+            "total_amount": summary['total_cost'],
+            "total_bookings": summary['completed'],
+            "most_visited_lot": most_visited_lot,
+            "barchart": {
+                calendar.month_name[month]: count
+                for (_, month), count in zip(months, summary['month_counts'])
+            },
+            "piechart": reservations_per_lot
+        }
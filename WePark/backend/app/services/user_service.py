@@ -7,6 +7,10 @@ Handles user profile and user-related operations
 from typing import List, Dict, Any, Optional
 from ..repositories.user_repository import UserRepository
 from ..repositories.admin_repository import AdminRepository
+from ..repositories.daily_lot_usage_repository import DailyLotUsageRepository
+from ..utils.cache_helpers import forget_login_misses
+from ..utils.current_user import forget_current_user
+from ..utils.passwords import PasswordPoolBusy
 
 
 class UserService:
@@ -15,6 +19,7 @@ class UserService:
     def __init__(self):
         self.user_repo = UserRepository()
         self.admin_repo = AdminRepository()
+        self.usage_repo = DailyLotUsageRepository()
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -32,14 +37,18 @@ class UserService:
         
         return self._format_user_details(user)
     
-    def get_all_users(self) -> List[Dict[str, Any]]:
+    def get_all_users(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all users (admin operation)
         
+        Args:
+            limit: Optional page size
+            after: Optional user ID of the last row of the previous page
+            
         Returns:
             List of user details
         """
-        users = self.user_repo.get_all()
+        users = self.user_repo.get_all(limit=limit, after=after)
         return [self._format_user_details(user) for user in users]
     
     def update_user(self, user_id: int, **kwargs) -> Dict[str, Any]:
@@ -75,6 +84,8 @@ class UserService:
             
             self.user_repo.update(user, **update_data)
             self.user_repo.commit()
+            forget_login_misses(update_data.get('email'))
+            forget_current_user(user_id)
             
             return {
                 'success': True,
@@ -106,8 +117,11 @@ class UserService:
                     'message': 'User not found'
                 }
             
+            # Their reservations are deleted with them; keep the rollup in step
+            self.usage_repo.remove_user(user_id)
             self.user_repo.delete(user)
             self.user_repo.commit()
+            forget_current_user(user_id)
             
             return {
                 'success': True,
@@ -163,6 +177,9 @@ class UserService:
                 'success': True,
                 'message': 'Password changed successfully'
             }
+        except PasswordPoolBusy:
+            self.user_repo.rollback()
+            raise
         except Exception as e:
             self.user_repo.rollback()
             return {
@@ -0,0 +1,238 @@
+# WePark/backend/app/utils/cache_helpers.py
+"""
+Cache Helper Functions
+Provides tag-versioned response caching with targeted invalidation
+"""
+
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+from flask import request
+from .. import cache
+
+
+# Bumped whenever lot membership of search/list results can change
+LOTS_TAG = "lots"
+
+# Process-local hit/miss counters for tagged cache entries
+cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def lot_tag(lot_id: int) -> str:
+    """Tag covering a lot's detail entry and every listing containing it"""
+    return f"lot:{lot_id}"
+
+
+def spot_tag(spot_id: int) -> str:
+    """Tag covering a single spot's detail entry"""
+    return f"spot:{spot_id}"
+
+
+def user_tag(user_id: int) -> str:
+    """Tag covering entries derived from a user's reservations"""
+    return f"user:{user_id}"
+
+
+def login_miss_key(identifier: str) -> str:
+    """Key marking a login identifier that matched no admin or user"""
+    return f"login:miss:{identifier}"
+
+
+def forget_login_misses(*identifiers: str) -> None:
+    """
+    Drop negative login entries for identifiers that now exist
+
+    Args:
+        *identifiers: Usernames or emails just registered or changed
+    """
+    keys = [login_miss_key(identifier.lower()) for identifier in identifiers if identifier]
+    if keys:
+        cache.delete_many(*keys)
+
+
+def _version_key(tag: str) -> str:
+    return f"tagver:{tag}"
+
+
+def get_tag_versions(tags: Iterable[str]) -> Dict[str, str]:
+    """
+    Get the current version token of each tag, creating missing ones
+
+    Args:
+        tags: Tags to look up
+
+    Returns:
+        Dictionary of tag -> version token
+    """
+    tags = list(dict.fromkeys(tags))
+    if not tags:
+        return {}
+
+    values = cache.get_many(*[_version_key(tag) for tag in tags])
+    versions = {}
+    for tag, value in zip(tags, values):
+        if value is None:
+            value = uuid.uuid4().hex
+            cache.set(_version_key(tag), value, timeout=0)
+        versions[tag] = value
+    return versions
+
+
+def _is_fresh(versions: Dict[str, str]) -> bool:
+    if not versions:
+        return True
+    tags = list(versions)
+    current = cache.get_many(*[_version_key(tag) for tag in tags])
+    return all(versions[tag] == value for tag, value in zip(tags, current))
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate every cached entry carrying any of the given tags
+
+    Args:
+        *tags: Tags to invalidate
+    """
+    if tags:
+        cache.set_many({_version_key(tag): uuid.uuid4().hex for tag in tags}, timeout=0)
+
+
+def invalidate_spot(lot_id: int, spot_id: int) -> None:
+    """
+    Invalidate entries affected by a spot status change
+
+    Args:
+        lot_id: Lot the spot belongs to
+        spot_id: Spot ID
+    """
+    invalidate_tags(lot_tag(lot_id), spot_tag(spot_id))
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Invalidate entries derived from a user's reservations
+
+    Args:
+        user_id: User ID
+    """
+    invalidate_tags(user_tag(user_id))
+
+
+def invalidate_lot(lot_id: Optional[int] = None, spot_ids: Iterable[int] = ()) -> None:
+    """
+    Invalidate entries affected by a lot being created, updated or deleted
+
+    Args:
+        lot_id: Optional lot ID (None for a lot that was never cached)
+        spot_ids: Spots of the lot whose entries must also go
+    """
+    tags = [LOTS_TAG]
+    if lot_id is not None:
+        tags.append(lot_tag(lot_id))
+    tags.extend(spot_tag(spot_id) for spot_id in spot_ids)
+    invalidate_tags(*tags)
+
+
+def _lookup(key: str) -> Any:
+    entry = cache.get(key)
+    if entry is not None and _is_fresh(entry["versions"]):
+        cache_stats["hits"] += 1
+        return entry
+    cache_stats["misses"] += 1
+    return None
+
+
+def remember(key: str, tags: List[str], timeout: int, compute: Callable[[], Any]) -> Any:
+    """
+    Return a cached value, computing and caching it under tags on a miss
+
+    Args:
+        key: Cache key
+        tags: Tags the value depends on
+        timeout: Cache timeout in seconds
+        compute: Callable producing the value
+
+    Returns:
+        Cached or freshly computed value
+    """
+    entry = _lookup(key)
+    if entry is not None:
+        return entry["value"]
+
+    versions = get_tag_versions(tags)
+    value = compute()
+    cache.set(key, {"versions": versions, "value": value}, timeout=timeout)
+    return value
+
+
+def _seen_tags_key(key: str) -> str:
+    return f"seentags:{key}"
+
+
+def _request_cache_key() -> str:
+    query = urlencode(sorted(request.args.items(multi=True)))
+    return f"view:{request.path}?{query}"
+
+
+def tagged_cached(timeout: int,
+                  key_tags: Optional[Callable[..., List[str]]] = None,
+                  data_tags: Optional[Callable[[Any], List[str]]] = None) -> Callable:
+    """
+    Decorator caching a resource method's successful response under tags
+
+    An entry stores the version of each of its tags and is served only while
+    none of them have been invalidated, so a write only evicts the entries
+    that actually depend on the lot or spot it touched.
+
+    Every stored version is read before the view runs: a write committing
+    while the view queries then leaves the entry stale, never fresh. Data
+    tags are only known afterwards, so the tags a key returned last time
+    are remembered and read up front; a response carrying a tag that was
+    not read up front is returned but not cached.
+
+    Args:
+        timeout: Cache timeout in seconds
+        key_tags: Optional callable receiving the view kwargs, returning tags
+                  known before the view runs
+        data_tags: Optional callable receiving the response data, returning
+                   tags derived from what the view returned
+
+    Returns:
+        Decorator function
+
+    Usage:
+        @jwt_required()
+        @tagged_cached(timeout=60, key_tags=lambda lot_id=None: [lot_tag(lot_id)])
+        def get(self, lot_id):
+            pass
+    """
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _request_cache_key()
+            entry = _lookup(key)
+            if entry is not None:
+                return entry["value"]
+
+            tags = key_tags(**kwargs) if key_tags else []
+            seen = (cache.get(_seen_tags_key(key)) or []) if data_tags else []
+            versions = get_tag_versions(tags + seen)
+            response = fn(*args, **kwargs)
+
+            data, status = response[:2] if isinstance(response, tuple) else (response, 200)
+            if status != 200:
+                return response
+            if data_tags:
+                found = list(dict.fromkeys(data_tags(data)))
+                if found != seen:
+                    cache.set(_seen_tags_key(key), found, timeout=0)
+                if any(tag not in versions for tag in found):
+                    # A write to that tag may have landed after the query
+                    return response
+                versions = {tag: versions[tag] for tag in dict.fromkeys(tags + found)}
+            cache.set(key, {"versions": versions, "value": response}, timeout=timeout)
+            return response
+
+        return wrapper
+    return decorator
@@ -1,18 +1,16 @@
 from celery import Celery
 from celery.schedules import crontab
-from flask import current_app
 
 celery = Celery("WePark Async Jobs", include="app.utils")
 
 def init_celery(app):
     class ContextTask(celery.Task):
         def __call__(self, *args, **kwargs):
-            with current_app.app_context():
+            with app.app_context():
                 return self.run(*args, **kwargs)
             
     celery.conf.update(broker_url=app.config["CELERY_BROKER_URL"], result_backend=app.config["CELERY_RESULT_BACKEND"])
     celery.Task = ContextTask
-    app.app_context().push()
 
     celery.conf.timezone = 'Asia/Kolkata'
 
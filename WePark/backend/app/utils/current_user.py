@@ -0,0 +1,131 @@
+# WePark/backend/app/utils/current_user.py
+"""
+Current User Loader
+Resolves the signed-in user from the JWT id claim once per request, with
+an optional process-local TTL cache across read requests
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+from flask import current_app, request
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from ..repositories.user_repository import UserRepository
+
+
+class CurrentUser(NamedTuple):
+    """Identifying columns of the signed-in user"""
+    user_id: int
+    username: str
+    email: str
+
+
+class _TTLCache:
+    """Small thread-safe LRU whose entries also expire after a fixed time"""
+
+    def __init__(self):
+        self._entries: "OrderedDict[int, Tuple[float, CurrentUser]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int, ttl: float) -> Optional[CurrentUser]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: int, value: CurrentUser, max_size: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: int) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_users = _TTLCache()
+
+# WSGI environ key holding the request's answer (g can outlive a request
+# when an app context is pushed around several test requests)
+_ENVIRON_KEY = "wepark.current_user"
+
+# Marks "looked up, no such user", distinct from "not looked up yet"
+_MISSING = object()
+
+# Only these may answer from the cache; writes always read the row
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _load(user_id: int) -> Optional[CurrentUser]:
+    ttl = current_app.config["CURRENT_USER_CACHE_TTL"]
+    if ttl > 0 and request.method in _READ_METHODS:
+        user = _users.get(user_id, ttl)
+        if user is not None:
+            return user
+    row = UserRepository().find_identity(user_id)
+    if row is None:
+        _users.discard(user_id)
+        return None
+    user = CurrentUser(*row)
+    if ttl > 0:
+        _users.set(user_id, user, current_app.config["CURRENT_USER_CACHE_SIZE"])
+    return user
+
+
+def get_current_user() -> Optional[CurrentUser]:
+    """
+    Get the user the request's access token belongs to
+
+    Reads the id claim set at login instead of looking the username up,
+    and remembers the answer for the rest of the request; that is still
+    one primary-key query per request. With
+    CURRENT_USER_CACHE_TTL > 0 the row is also kept in a per-process LRU
+    that only read requests answer from; edits and deletes made by another
+    process show up on reads once the entry expires, and on writes at once,
+    so a deleted user can never book.
+    Must be called under @jwt_required().
+
+    Returns:
+        CurrentUser, or None for admins, deleted users and tokens whose
+        username no longer matches the account
+    """
+    cached = request.environ.get(_ENVIRON_KEY)
+    if cached is not None:
+        return None if cached is _MISSING else cached
+
+    claims = get_jwt()
+    user = None
+    if claims.get("role") == "user" and claims.get("id") is not None:
+        user = _load(claims["id"])
+        # A renamed account invalidates tokens issued under the old name
+        if user is not None and user.username != get_jwt_identity():
+            user = None
+    request.environ[_ENVIRON_KEY] = _MISSING if user is None else user
+    return user
+
+
+def forget_current_user(user_id: int) -> None:
+    """
+    Drop a user from this process's cache after an update or delete
+
+    Args:
+        user_id: User ID
+    """
+    _users.discard(user_id)
+
+
+def clear_current_user_cache() -> None:
+    """Empty this process's cache"""
+    _users.clear()
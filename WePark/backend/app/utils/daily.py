@@ -1,23 +1,50 @@
 from .helper import get_ist_time
 from .celery import celery
-from ..models import Lot,User, Notification
+from celery import group
+from ..models import Lot
+from ..repositories.user_repository import UserRepository
+from ..repositories.notification_repository import NotificationRepository
 from datetime import timedelta
-from .email import email_sender
-from flask import render_template, current_app
-from .. import db
+from .email import build_message, batch_email_sender
+from .email_templates import Field, PrerenderedTemplate
+from flask import current_app
 
 @celery.task
 def daily_remainder():
     time_range = get_ist_time() - timedelta(hours=24)
     new_lots = Lot.query.filter(Lot.created_at >= time_range).all()
+    chunk_size = current_app.config['NOTIFICATION_CHUNK_SIZE']
+    url = f"{current_app.config['FRONTEND_URL']}/dashboard/available_lots"
+    title = "New Lot in your Area"
+    user_repo = UserRepository()
+    notification_repo = NotificationRepository()
+    email_chunks = []
     for lot in new_lots:
-        users = User.query.filter_by(pincode=lot.pincode).all()
-        for user in users:
-            title = "New Lot in your Area"
-            template = render_template("daily_remainder.html", user=user, lot=lot, url=f"{current_app.config['FRONTEND_URL']}/dashboard/available_lots")
-            notification = Notification(user_id=user.user_id, title=title, body=template)
-            db.session.add(notification)
-            db.session.commit()
-            email_sender(user.email, title, template, is_html=True)
-            
-        
\ No newline at end of file
+        # Everything but the greeting is the same for every user of this lot
+        page = PrerenderedTemplate("daily_remainder.html", lot=lot, url=url, user=Field("user"))
+        after = None
+        while True:
+            users = user_repo.find_by_pincode(lot.pincode, limit=chunk_size, after=after)
+            if not users:
+                break
+            after = users[-1].user_id
+            rows = [{
+                "user_id": user.user_id,
+                "title": title,
+                "body": page.render(user=user)
+            } for user in users]
+            # One executemany and one commit per chunk of users
+            email_chunks.append(notification_repo.bulk_create_returning_ids(rows))
+            notification_repo.commit()
+    
+    if email_chunks:
+        # Each subtask emails one chunk, reading the bodies back from the notifications
+        group(send_notification_emails.s(ids) for ids in email_chunks).apply_async()
+    return {"lots": len(new_lots), "notifications": sum(len(ids) for ids in email_chunks)}
+
+@celery.task
+def send_notification_emails(notification_ids):
+    notification_repo = NotificationRepository()
+    messages = (build_message(email, title, body, is_html=True)
+                for email, title, body in notification_repo.find_email_batch(notification_ids))
+    return batch_email_sender(messages)
@@ -5,7 +5,7 @@ Provides timezone-aware datetime operations
 """
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import pytz
 
 
@@ -115,3 +115,21 @@ def calculate_duration_hours(start_time: datetime, end_time: datetime) -> float:
     duration_seconds = (end_time - start_time).total_seconds()
     duration_hours = duration_seconds / 3600
     return round(duration_hours, 2)
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a YYYY-MM-DD query parameter
+    
+    Args:
+        value: Date string or None
+        
+    Returns:
+        Naive datetime at midnight, or None if no value was given
+        
+    Raises:
+        ValueError: If the value is not a valid YYYY-MM-DD date
+    """
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%d")
@@ -4,11 +4,32 @@ Custom Decorators for Authorization and Access Control
 Provides decorators for JWT-based role checking
 """
 
+import logging
+import random
 from functools import wraps
+from flask import current_app, request
 from flask_jwt_extended import get_jwt
 from typing import Callable, Any
 
 
+logger = logging.getLogger(__name__)
+
+
+def _log_role_check(required_role: str, claims: dict, allowed: bool) -> None:
+    """
+    Log a role check as key=value pairs, never the token itself
+    
+    Denials are always logged; passes only for AUTH_LOG_SAMPLE_RATE of calls.
+    """
+    if allowed and random.random() >= current_app.config.get("AUTH_LOG_SAMPLE_RATE", 0.0):
+        return
+    logger.log(
+        logging.INFO if allowed else logging.WARNING,
+        "event=role_check allowed=%s required=%s role=%s id=%s endpoint=%s",
+        allowed, required_role, claims.get('role'), claims.get('id'), request.endpoint
+    )
+
+
 def role_required(required_role: str) -> Callable:
     """
     Decorator to enforce role-based access control
@@ -29,17 +50,13 @@ def role_required(required_role: str) -> Callable:
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             decoded_data = get_jwt()
-            
-            print(f"[DEBUG] role_required: checking for role '{required_role}'")
-            print(f"[DEBUG] JWT data: {decoded_data}")
-            
             user_role = decoded_data.get('role')
+            allowed = user_role == required_role
+            _log_role_check(required_role, decoded_data, allowed)
             
-            if user_role != required_role:
-                print(f"[DEBUG] Role mismatch! Expected '{required_role}', got '{user_role}'")
+            if not allowed:
                 return {'message': 'Forbidden, access denied!'}, 403
             
-            print(f"[DEBUG] Role check passed!")
             return fn(*args, **kwargs)
         
         return wrapper
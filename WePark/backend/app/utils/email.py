@@ -1,22 +1,97 @@
+import smtplib
+import time
 from flask import current_app
 from flask_mail import Message
 from .. import mail
     
 
-def email_sender(to_email, subject, body, is_html=False):
+def build_message(to_email, subject, body, is_html=False):
     sender = (current_app.config['MAIL_NAME'], current_app.config['MAIL_USERNAME'])
     msg = Message(subject, sender=sender, recipients=[to_email])
     if is_html:
         msg.html = body 
     else:
         msg.body = body
-    mail.send(msg) 
+    return msg
+
+
+def email_sender(to_email, subject, body, is_html=False):
+    mail.send(build_message(to_email, subject, body, is_html=is_html))
+
+
+# Rejections of a single message; the connection itself is still usable
+_MESSAGE_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+# "Service not available, closing transmission channel"
+_SMTP_CLOSING = 421
+
+
+def _close_quietly(connection):
+    if connection is not None and connection.host is not None:
+        try:
+            connection.host.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.host.close()
+
+
+def batch_email_sender(messages, max_per_connection=None, retries=None):
+    """
+    Send many messages over a few reused SMTP connections
+    
+    A connection is opened once and reused for up to max_per_connection
+    messages. If it drops, the sender reconnects and retries the message up
+    to `retries` times with a short backoff. A message the server rejects
+    is recorded as failed without being retried.
     
-def csv_email_sender(to_email, subject, body, csv_attachment):
+    Args:
+        messages: Iterable of flask_mail Message (see build_message)
+        max_per_connection: Messages per connection (MAIL_MAX_PER_CONNECTION)
+        retries: Reconnect attempts per message (MAIL_SEND_RETRIES)
+        
+    Returns:
+        Dictionary with sent count and failed recipient lists
+    """
+    config = current_app.config
+    max_per_connection = max_per_connection or config['MAIL_MAX_PER_CONNECTION']
+    retries = config['MAIL_SEND_RETRIES'] if retries is None else retries
+    backoff = config['MAIL_RETRY_BACKOFF']
+    
+    connection, on_connection, sent, failed = None, 0, 0, []
+    try:
+        for message in messages:
+            for attempt in range(retries + 1):
+                try:
+                    if connection is None or on_connection >= max_per_connection:
+                        _close_quietly(connection)
+                        connection, on_connection = None, 0
+                        connection = mail.connect().__enter__()
+                    connection.send(message)
+                    on_connection += 1
+                    sent += 1
+                    break
+                except (smtplib.SMTPException, OSError) as error:
+                    if isinstance(error, _MESSAGE_ERRORS) and getattr(error, 'smtp_code', None) != _SMTP_CLOSING:
+                        failed.append(message.recipients)
+                        break
+                    # Dropped or closing connection: start over on a fresh one
+                    _close_quietly(connection)
+                    connection = None
+                    if attempt == retries:
+                        failed.append(message.recipients)
+                    else:
+                        time.sleep(backoff * 2 ** attempt)
+    finally:
+        _close_quietly(connection)
+    
+    return {'sent': sent, 'failed': failed}
+
+
+def csv_email_sender(to_email, subject, body, csv_attachment,
+                     filename="reservation_records.csv", content_type="text/csv"):
     sender = (current_app.config['MAIL_NAME'], current_app.config['MAIL_USERNAME'])
     msg = Message(subject, sender=sender, recipients=[to_email])
     msg.html = body
-    msg.attach("reservation_records.csv", "text/csv", csv_attachment)
+    msg.attach(filename, content_type, csv_attachment)
     mail.send(msg)
 
 
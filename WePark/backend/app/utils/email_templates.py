@@ -0,0 +1,95 @@
+# WePark/backend/app/utils/email_templates.py
+"""
+Email Template Helpers
+Caches compiled templates per worker and pre-renders the shared part of
+bulk emails so each recipient only costs a string join
+"""
+
+from typing import Any, Dict, List
+from flask import current_app
+from jinja2 import Template
+from markupsafe import escape
+
+
+# Marks where a per-recipient field lands in a pre-rendered page
+_SENTINEL = "\x00"
+
+_compiled: Dict[str, Template] = {}
+
+
+def get_compiled_template(name: str) -> Template:
+    """
+    Get a compiled template, loading it once per worker process
+
+    Skips the per-render lookup and reload check of render_template;
+    restart the worker to pick up template edits.
+
+    Args:
+        name: Template file name
+
+    Returns:
+        Compiled Jinja template
+    """
+    template = _compiled.get(name)
+    if template is None:
+        template = _compiled[name] = current_app.jinja_env.get_template(name)
+    return template
+
+
+class Field:
+    """
+    Placeholder for a per-recipient value while pre-rendering
+
+    Attribute access yields nested placeholders, so `{{ user.username }}`
+    works with `user=Field("user")`.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __getattr__(self, attr: str) -> "Field":
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return Field(f"{self._path}.{attr}")
+
+    def __html__(self) -> str:
+        return f"{_SENTINEL}{self._path}{_SENTINEL}"
+
+    __str__ = __html__
+
+
+class PrerenderedTemplate:
+    """
+    A template rendered once with shared values and Field placeholders
+
+    Per-recipient fields must be printed as plain `{{ field }}` expressions;
+    filters, tests or conditionals on them would act on the placeholder.
+
+    Usage:
+        page = PrerenderedTemplate("daily_remainder.html", lot=lot, url=url, user=Field("user"))
+        body = page.render(user=user)
+    """
+
+    def __init__(self, name: str, **context: Any):
+        rendered = get_compiled_template(name).render(**context)
+        # Even positions are literal HTML, odd ones are field paths
+        self._parts: List[str] = rendered.split(_SENTINEL)
+
+    def render(self, **fields: Any) -> str:
+        """
+        Fill in the per-recipient fields
+
+        Args:
+            **fields: Values for the Field placeholders, by top-level name
+
+        Returns:
+            Rendered HTML, escaped as the template would have escaped it
+        """
+        parts = self._parts[:]
+        for index in range(1, len(parts), 2):
+            name, *attrs = parts[index].split(".")
+            value = fields[name]
+            for attr in attrs:
+                value = getattr(value, attr)
+            parts[index] = str(escape(value))
+        return "".join(parts)
@@ -0,0 +1,202 @@
+# WePark/backend/app/utils/metrics.py
+"""
+Request Metrics
+Records per-endpoint latency, status codes and SQL statement counts/time
+and renders them, with the tagged cache hit/miss counters, in the
+Prometheus text exposition format
+
+Counters live in the process, so each worker serves its own numbers;
+scrape every worker, or run one per container. The endpoint is closed to
+the public: scrapers send METRICS_TOKEN as a bearer token, admins can use
+their session.
+"""
+
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from flask import Flask, Response, current_app, has_request_context, request
+from flask_jwt_extended import jwt_required
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .cache_helpers import cache_stats
+from .decorators import admin_required
+
+
+# Upper bounds in seconds, Prometheus client defaults
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Per-request tallies live in the WSGI environ, not g (see current_user)
+_START_KEY = "wepark.metrics.start"
+_SQL_KEY = "wepark.metrics.sql"
+
+# SQL run outside a request (Celery tasks, CLI commands)
+BACKGROUND = "background"
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by label values"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every recorded value"""
+        with self._lock:
+            self.requests: Dict[Tuple[str, str, str], int] = defaultdict(int)
+            self.latency: Dict[Tuple[str, str], List[float]] = {}
+            self.sql_statements: Dict[str, int] = defaultdict(int)
+            self.sql_seconds: Dict[str, float] = defaultdict(float)
+
+    def observe_request(self, endpoint: str, method: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.requests[endpoint, method, str(status)] += 1
+            # Buckets counts, then sum and count
+            histogram = self.latency.get((endpoint, method))
+            if histogram is None:
+                histogram = self.latency[endpoint, method] = [0] * len(LATENCY_BUCKETS) + [0.0, 0]
+            index = bisect_left(LATENCY_BUCKETS, seconds)
+            if index < len(LATENCY_BUCKETS):
+                histogram[index] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+
+    def observe_sql(self, endpoint: str, statements: int, seconds: float) -> None:
+        with self._lock:
+            self.sql_statements[endpoint] += statements
+            self.sql_seconds[endpoint] += seconds
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+        with self._lock:
+            lines += ["# HELP wepark_http_requests_total HTTP responses by endpoint, method and status.",
+                      "# TYPE wepark_http_requests_total counter"]
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'wepark_http_requests_total{{endpoint="{endpoint}",method="{method}",'
+                             f'status="{status}"}} {count}')
+
+            lines += ["# HELP wepark_http_request_duration_seconds Time to build the response, by endpoint.",
+                      "# TYPE wepark_http_request_duration_seconds histogram"]
+            for (endpoint, method), histogram in sorted(self.latency.items()):
+                labels = f'endpoint="{endpoint}",method="{method}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, histogram):
+                    cumulative += count
+                    lines.append(f'wepark_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'wepark_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram[-1]}')
+                lines.append(f"wepark_http_request_duration_seconds_sum{{{labels}}} {histogram[-2]:.6f}")
+                lines.append(f"wepark_http_request_duration_seconds_count{{{labels}}} {histogram[-1]}")
+
+            lines += ["# HELP wepark_sql_statements_total SQL statements executed, by endpoint.",
+                      "# TYPE wepark_sql_statements_total counter"]
+            for endpoint, count in sorted(self.sql_statements.items()):
+                lines.append(f'wepark_sql_statements_total{{endpoint="{endpoint}"}} {count}')
+
+            lines += ["# HELP wepark_sql_seconds_total Time spent executing SQL, by endpoint.",
+                      "# TYPE wepark_sql_seconds_total counter"]
+            for endpoint, seconds in sorted(self.sql_seconds.items()):
+                lines.append(f'wepark_sql_seconds_total{{endpoint="{endpoint}"}} {seconds:.6f}')
+
+        lines += ["# HELP wepark_cache_requests_total Tagged response cache lookups, by result.",
+                  "# TYPE wepark_cache_requests_total counter",
+                  f'wepark_cache_requests_total{{result="hit"}} {cache_stats["hits"]}',
+                  f'wepark_cache_requests_total{{result="miss"}} {cache_stats["misses"]}']
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def _endpoint() -> str:
+    # Route endpoint names keep the label set small (no IDs from the path)
+    return request.endpoint or "unmatched"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("wepark_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["wepark_query_start"].pop()
+    if has_request_context():
+        tally = request.environ.setdefault(_SQL_KEY, [0, 0.0])
+        tally[0] += 1
+        tally[1] += seconds
+    else:
+        metrics.observe_sql(BACKGROUND, 1, seconds)
+
+
+def _handle_error(exception_context) -> None:
+    # after_cursor_execute does not fire for a failed statement
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("wepark_query_start"):
+        connection.info["wepark_query_start"].pop()
+
+
+def _before_request() -> None:
+    request.environ[_START_KEY] = time.perf_counter()
+
+
+def _after_request(response: Response) -> Response:
+    start = request.environ.pop(_START_KEY, None)
+    if start is not None:
+        endpoint = _endpoint()
+        metrics.observe_request(endpoint, request.method, response.status_code, time.perf_counter() - start)
+        statements, seconds = request.environ.pop(_SQL_KEY, (0, 0.0))
+        if statements:
+            metrics.observe_sql(endpoint, statements, seconds)
+    return response
+
+
+def _render() -> Response:
+    return Response(metrics.render(), content_type=CONTENT_TYPE)
+
+
+_admin_render = jwt_required()(admin_required(_render))
+
+
+def metrics_view() -> Response:
+    """
+    Serve the registry in the Prometheus text format
+
+    Requires `Authorization: Bearer <METRICS_TOKEN>` when a token is
+    configured, or else an admin session.
+    """
+    token = current_app.config.get("METRICS_TOKEN")
+    if token:
+        supplied = request.headers.get("Authorization", "").encode()
+        if hmac.compare_digest(supplied, f"Bearer {token}".encode()):
+            return _render()
+    return _admin_render()
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Register the metrics middleware, SQL listeners and /api/metrics
+
+    Latency covers the view up to the response object; streamed bodies
+    (exports) are not included.
+
+    Args:
+        app: Flask application
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.add_url_rule("/api/metrics", "metrics", metrics_view)
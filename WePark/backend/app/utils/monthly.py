@@ -1,35 +1,71 @@
 from .helper import get_ist_time
 from .celery import celery
-from ..models import Lot,User, Notification, Reservation
-from datetime import timedelta
-from .email import email_sender
-from flask import render_template, current_app
-from .. import db
+from celery import group
+from celery.utils.log import get_task_logger
+from ..repositories.reservation_repository import ReservationRepository
+from ..repositories.user_repository import UserRepository
+from datetime import datetime, timedelta
+from .email import build_message, batch_email_sender
+from .email_templates import Field, PrerenderedTemplate
+from flask import current_app
 import calendar
+import time
+
+logger = get_task_logger(__name__)
 
 @celery.task
 def monthly_remainder():
-    time_range = get_ist_time().replace(tzinfo=None) - timedelta(days=30)
-    month_name = calendar.month_name[time_range.month]
-    users = User.query.all()
+    since = get_ist_time().replace(tzinfo=None) - timedelta(days=30)
+    chunk_size = current_app.config['NOTIFICATION_CHUNK_SIZE']
+    ranges = list(UserRepository().iter_id_ranges(chunk_size))
+    if not ranges:
+        return {"chunks": 0}
+    # Each worker reports one user-id range; the ranges are independent
+    result = group(
+        send_monthly_reports.s(first, last, since.isoformat(), index, len(ranges))
+        for index, (first, last) in enumerate(ranges, start=1)
+    ).apply_async()
+    logger.info("monthly_remainder: dispatched %d chunk(s) of up to %d users", len(ranges), chunk_size)
+    return {"chunks": len(ranges), "group_id": result.id}
+
+@celery.task(bind=True)
+def send_monthly_reports(self, first_user_id, last_user_id, since, chunk_index=1, chunk_count=1):
+    started = time.perf_counter()
+    since = datetime.fromisoformat(since)
+    month_name = calendar.month_name[since.month]
     title = "Monthly report - WePark"
-    for user in users:
-        user_reservations = user.reservations
-        reservation_list = []
-        lot_counts = {}
-        monthly_cost = 0
-        for reservation in user_reservations:
-            if reservation.parking_timestamp and reservation.parking_timestamp >= time_range:
-                reservation_list.append(reservation)
-                monthly_cost += reservation.parking_cost or 0
-                lot = reservation.spot.lot.prime_location
-                if lot in lot_counts:
-                    lot_counts[lot] += 1
-                else:
-                    lot_counts[lot] = 1
-        most_visited_lot = max(lot_counts, key=lot_counts.get) if lot_counts else None
-        total_reservation = len(reservation_list)
-        template = render_template("monthly_report.html",user=user,report_month=month_name, monthly_cost=monthly_cost, most_visited_lot=most_visited_lot,total_reservation=total_reservation)
-        email_sender(user.email, title, template, is_html=True)
-        
-        
\ No newline at end of file
+    
+    # One grouped query for the whole chunk: (user, location) -> count, cost
+    usage = {}
+    for user_id, prime_location, count, cost in ReservationRepository().usage_by_location(
+            since, first_user_id, last_user_id):
+        usage.setdefault(user_id, {})[prime_location] = (count, cost)
+    
+    users = UserRepository().find_in_id_range(first_user_id, last_user_id)
+    if not self.request.is_eager:
+        self.update_state(state="PROGRESS", meta={"chunk": chunk_index, "of": chunk_count, "users": len(users)})
+    
+    page = PrerenderedTemplate(
+        "monthly_report.html", report_month=month_name, user=Field("user"),
+        monthly_cost=Field("monthly_cost"), most_visited_lot=Field("most_visited_lot"),
+        total_reservation=Field("total_reservation")
+    )
+    
+    def messages():
+        for user in users:
+            lot_usage = usage.get(user.user_id, {})
+            most_visited_lot = max(lot_usage, key=lambda location: lot_usage[location][0]) if lot_usage else None
+            template = page.render(
+                user=user,
+                monthly_cost=sum(cost for _, cost in lot_usage.values()),
+                most_visited_lot=most_visited_lot,
+                total_reservation=sum(count for count, _ in lot_usage.values())
+            )
+            yield build_message(user.email, title, template, is_html=True)
+    
+    result = batch_email_sender(messages())
+    seconds = round(time.perf_counter() - started, 3)
+    logger.info("monthly_remainder chunk %d/%d (users %d-%d): %d sent, %d failed in %.3fs",
+                chunk_index, chunk_count, first_user_id, last_user_id,
+                result['sent'], len(result['failed']), seconds)
+    return {"chunk": chunk_index, "users": len(users), "seconds": seconds, **result}
@@ -0,0 +1,57 @@
+# WePark/backend/app/utils/pagination.py
+"""
+Pagination Utility Functions
+Parses keyset pagination query parameters and builds the next-page cursor
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from flask import current_app, request
+
+
+def get_page_args() -> Tuple[Optional[int], Optional[int]]:
+    """
+    Read `limit` and `after` from the query string
+
+    Pagination is opt-in: without `limit` the whole list is returned, as
+    existing clients expect. An empty `limit` (`?limit=`) asks for a page
+    of API_PAGE_SIZE_DEFAULT.
+
+    Returns:
+        Tuple of (limit, after); limit is capped at API_PAGE_SIZE_MAX
+
+    Raises:
+        ValueError: If limit or after is not a positive integer
+    """
+    limit = request.args.get('limit')
+    after = request.args.get('after')
+
+    if limit == '':
+        limit = current_app.config['API_PAGE_SIZE_DEFAULT']
+    elif limit is not None:
+        if not limit.isdigit() or int(limit) < 1:
+            raise ValueError('limit must be a positive integer')
+        limit = min(int(limit), current_app.config['API_PAGE_SIZE_MAX'])
+
+    if after is not None:
+        if not after.isdigit():
+            raise ValueError('after must be a positive integer')
+        after = int(after)
+
+    return limit, after
+
+
+def next_cursor_headers(items: List[Dict[str, Any]], id_key: str, limit: Optional[int]) -> Dict[str, str]:
+    """
+    Build the X-Next-Cursor header for a page of results
+
+    Args:
+        items: Serialized page
+        id_key: Key holding each item's primary key
+        limit: Page size the items were fetched with
+
+    Returns:
+        Headers dictionary (empty when this is the last page)
+    """
+    if limit is None or len(items) < limit:
+        return {}
+    return {'X-Next-Cursor': str(items[-1][id_key])}
@@ -0,0 +1,127 @@
+# WePark/backend/app/utils/passwords.py
+"""
+Password Hashing Utilities
+Runs password hashing and verification in a bounded process pool so a
+burst of logins cannot pin every request thread on key stretching
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the hashing pool already has its maximum of queued jobs"""
+
+
+_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_pid, _slots
+    workers = current_app.config["PASSWORD_POOL_WORKERS"]
+    if workers <= 0:
+        return None
+    with _lock:
+        # A forked worker must not reuse its parent's pool
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _slots = threading.BoundedSemaphore(workers + current_app.config["PASSWORD_POOL_QUEUE_LIMIT"])
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _run(fn: Callable[..., Any], *args: Any) -> Any:
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise PasswordPoolBusy("Password hashing queue is full")
+    try:
+        future = pool.submit(fn, *args)
+    except Exception:
+        slots.release()
+        raise
+    # The slot frees when the job finishes, even if this caller gave up on it
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=current_app.config["PASSWORD_POOL_TIMEOUT"])
+    except FuturesTimeout:
+        future.cancel()
+        raise PasswordPoolBusy("Password hashing timed out in the queue")
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password with the configured PASSWORD_HASH_METHOD
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Werkzeug password hash
+
+    Raises:
+        PasswordPoolBusy: If the pool's queue is full
+    """
+    return _run(generate_password_hash, password, current_app.config["PASSWORD_HASH_METHOD"])
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """
+    Check a password against a stored hash
+
+    Args:
+        password_hash: Stored werkzeug hash
+        password: Plain text password
+
+    Returns:
+        True if the password matches
+
+    Raises:
+        PasswordPoolBusy: If the pool's queue is full
+    """
+    return _run(check_password_hash, password_hash, password)
+
+
+@lru_cache(maxsize=8)
+def _stored_method(method: str) -> str:
+    """
+    The method prefix werkzeug stores for a configured method
+
+    Short forms such as "scrypt" or "pbkdf2:sha256" are stored with every
+    parameter filled in ("scrypt:32768:8:1"), so hash once to find out.
+    """
+    return generate_password_hash("", method).split("$", 1)[0]
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether a hash was made with other parameters than configured
+
+    Args:
+        password_hash: Stored werkzeug hash ("method$salt$hash")
+
+    Returns:
+        True if the hash should be replaced on the next successful login
+    """
+    return password_hash.split("$", 1)[0] != _stored_method(current_app.config["PASSWORD_HASH_METHOD"])
+
+
+def shutdown_pool() -> None:
+    """Stop the pool; the next hash starts a new one from the current config"""
+    global _pool, _pool_pid, _slots
+    with _lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown(wait=True)
+        _pool, _pool_pid, _slots = None, None, None
@@ -0,0 +1,105 @@
+# WePark/backend/app/utils/query_budget.py
+"""
+Query Budgets
+Counts the SQL statements each request issues and, when enabled (as in
+TestingConfig), raises if an endpoint exceeds the budget declared on its
+Resource method or repeats one parametrized SELECT too often (N+1)
+"""
+
+from collections import Counter
+from typing import Callable, Optional
+from flask import Flask, Response, current_app, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+_STATEMENTS_KEY = "wepark.query_budget.statements"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a request issues more SQL than its endpoint allows"""
+
+
+def query_budget(max_statements: Optional[int] = None, max_repeats: Optional[int] = None) -> Callable:
+    """
+    Declare how much SQL a Resource method may issue per request
+
+    Only sets attributes, so it costs nothing outside test mode and may
+    sit anywhere in a stack of functools.wraps decorators.
+
+    Args:
+        max_statements: Most statements one request may run (None: unlimited)
+        max_repeats: Most runs of one SELECT text per request
+                     (None: QUERY_REPEAT_LIMIT)
+
+    Returns:
+        Decorator function
+
+    Usage:
+        @jwt_required()
+        @query_budget(max_statements=4)
+        def get(self):
+            pass
+    """
+    def decorator(fn: Callable) -> Callable:
+        fn.query_budget = (max_statements, max_repeats)
+        return fn
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        statements = request.environ.get(_STATEMENTS_KEY)
+        if statements is not None:
+            statements.append(statement)
+
+
+def _before_request() -> None:
+    request.environ[_STATEMENTS_KEY] = []
+
+
+def _declared_budget():
+    view = current_app.view_functions.get(request.endpoint)
+    # Flask-RESTful views dispatch to a method of their Resource class
+    view_class = getattr(view, "view_class", None)
+    method = getattr(view_class, request.method.lower(), None) if view_class else view
+    return getattr(method, "query_budget", (None, None))
+
+
+def _after_request(response: Response) -> Response:
+    statements = request.environ.pop(_STATEMENTS_KEY, None)
+    if not statements:
+        return response
+    max_statements, max_repeats = _declared_budget()
+    if max_repeats is None:
+        max_repeats = current_app.config["QUERY_REPEAT_LIMIT"]
+    where = f"{request.method} {request.path} ({request.endpoint})"
+
+    if max_statements is not None and len(statements) > max_statements:
+        raise QueryBudgetExceeded(
+            f"{where} ran {len(statements)} statements, budget is {max_statements}"
+        )
+    selects = Counter(s for s in statements if s.lstrip()[:6].upper() == "SELECT")
+    if selects:
+        statement, runs = selects.most_common(1)[0]
+        if runs > max_repeats:
+            raise QueryBudgetExceeded(
+                f"{where} ran the same SELECT {runs} times (limit {max_repeats}), "
+                f"likely an N+1 lazy load:\n{statement}"
+            )
+    return response
+
+
+def init_query_budgets(app: Flask) -> None:
+    """
+    Enforce query budgets when QUERY_BUDGETS_ENABLED is set
+
+    Args:
+        app: Flask application
+    """
+    if not app.config.get("QUERY_BUDGETS_ENABLED", False):
+        return
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
@@ -1,31 +1,29 @@
-from ..models import Reservation
+from datetime import datetime
+from ..services.export_service import ExportService
 from .celery import celery
-import csv
-import io
 from flask import render_template
 from .email import csv_email_sender
 
 @celery.task
 def export_user_usage_csv(user_id,email):
-    output = io.StringIO()
-    headers = ["reservation_id","lot_id", "spot_id", "prime_location", "parking_cost", "parking_timestamp"]
-    csv_writer = csv.DictWriter(output, fieldnames=headers)
-    csv_writer.writeheader()
-    reservations = Reservation.query.filter_by(user_id=user_id).all()
-    for reservation in reservations:
-        csv_writer.writerow({
-            "reservation_id": reservation.reservation_id,
-            "lot_id": reservation.spot.lot.lot_id,
-            "spot_id": reservation.spot.spot_id,
-            "prime_location": reservation.spot.lot.prime_location,
-            "parking_cost": reservation.parking_cost,
-            "parking_timestamp":reservation.parking_timestamp
-        })
-            
-    csv_file = output.getvalue()
-    output.close()
-    body = render_template("csv_export.html")
-    csv_email_sender(email,"Your CSV is ready!",body,csv_file)
-    
-    
-    
\ No newline at end of file
+    export_service = ExportService()
+    # Rows are streamed and compressed as they arrive; only the gzip output
+    # is held, spilling to disk once it outgrows EXPORT_SPOOL_MAX_BYTES
+    with export_service.spool_gzip(export_service.iter_user_usage_csv(user_id)) as csv_file:
+        body = render_template("csv_export.html")
+        csv_email_sender(email, "Your CSV is ready!", body, csv_file.read(),
+                         filename="reservation_records.csv.gz", content_type="application/gzip")
+
+@celery.task
+def export_reservations(email, export_format="csv", start=None, end=None, lot_id=None):
+    # start/end arrive as ISO strings since task arguments are JSON encoded
+    start = datetime.fromisoformat(start) if start else None
+    end = datetime.fromisoformat(end) if end else None
+    export_service = ExportService()
+    chunks = export_service.iter_reservations(export_format, start=start, end=end, lot_id=lot_id)
+    extension, _ = ExportService.FORMATS[export_format]
+    with export_service.spool_gzip(chunks) as export_file:
+        body = render_template("reservations_export.html", export_format=export_format,
+                               start=start, end=end, lot_id=lot_id)
+        csv_email_sender(email, "Your reservation export is ready!", body, export_file.read(),
+                         filename=f"reservations.{extension}.gz", content_type="application/gzip")
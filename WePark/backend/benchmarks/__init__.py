@@ -0,0 +1,5 @@
+# WePark/backend/benchmarks/__init__.py
+"""
+Benchmarks - Performance measurement scripts
+Run from WePark/backend, e.g. `python -m benchmarks.cache_hit_ratio`
+"""
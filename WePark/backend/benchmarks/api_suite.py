@@ -0,0 +1,279 @@
+# WePark/backend/benchmarks/api_suite.py
+"""
+API Benchmark Suite
+Seeds a file-backed SQLite database at each dataset size and measures
+latency percentiles and throughput of the main API calls through the
+Flask test client, writing a JSON report that can be diffed between runs
+
+Each size runs in its own process (app_creator can only run once per
+process). Scenarios:
+    login          POST /api/login for a random seeded user
+    lot_list       GET /api/lot (response cache warm)
+    lot_search     GET /api/lot?name=... (response cache cleared)
+    book           POST /api/reservation with a lot_id
+    occupy         PUT /api/reservation/<id>
+    release_pay    POST /api/reservation with reservation_id and payment_id
+    admin_stats    GET /api/stats as admin (response cache cleared)
+    user_stats     GET /api/stats as a seeded user (response cache cleared)
+    notifications  GET /api/notification as a seeded user
+
+The report also carries the cold-start time of the real entry point
+(import, build the app, first request) from benchmarks.startup.
+
+Usage:
+    python -m benchmarks.api_suite --sizes 1000 100000 1000000 --output report.json
+    python -m benchmarks.api_suite --sizes 1000 --compare report.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from werkzeug.security import generate_password_hash
+from app import cache
+from app.repositories import DailyLotUsageRepository, NotificationRepository, ReservationRepository, UserRepository
+from app.services.lot_service import LotService
+from .common import create_bench_app, admin_client, check
+from .startup import measure as measure_startup
+
+
+SCENARIOS = ("login", "lot_list", "lot_search", "book", "occupy", "release_pay",
+             "admin_stats", "user_stats", "notifications")
+
+PASSWORD = "password123"
+LOTS = 20
+SPOTS_PER_LOT = 50
+NOTIFICATIONS_PER_USER = 5
+BOOKING_USERS = 10
+WARMUP = 5
+
+
+def dataset_shape(reservations: int) -> Dict[str, int]:
+    """Users grow with the reservation count, about 100 reservations each"""
+    return {
+        "reservations": reservations,
+        "users": min(10_000, max(50, reservations // 100)),
+        "lots": LOTS,
+        "spots": LOTS * SPOTS_PER_LOT,
+    }
+
+
+def seed(shape: Dict[str, int], password_hash: str, rng: random.Random) -> None:
+    for i in range(LOTS):
+        LotService().create_lot(prime_location=f"Suite Lot {i}", price_per_hour=20 + i,
+                                address=f"{i} Suite Road", pincode=600001 + i % 5,
+                                no_of_spots=SPOTS_PER_LOT)
+    users = UserRepository()
+    users.bulk_create(({
+        "username": f"member{i}",
+        "email": f"member{i}@example.com",
+        "password": password_hash,
+        "address": "Suite Street",
+        "pincode": 600001 + i % 5,
+    } for i in range(shape["users"])), chunk_size=5000)
+    NotificationRepository().bulk_create(({
+        "user_id": 1 + i // NOTIFICATIONS_PER_USER,
+        "title": "New Lot in your Area",
+        "body": "<p>A new lot opened near you.</p>",
+    } for i in range(shape["users"] * NOTIFICATIONS_PER_USER)), chunk_size=5000)
+
+    # Completed, paid history over the last two years
+    end = datetime.now().replace(microsecond=0)
+    span = int(timedelta(days=730).total_seconds())
+
+    def history():
+        for i in range(shape["reservations"]):
+            parked = end - timedelta(seconds=rng.randrange(span))
+            hours = rng.uniform(0.5, 6.0)
+            spot_id = rng.randrange(shape["spots"]) + 1
+            yield {
+                "user_id": rng.randrange(shape["users"]) + 1,
+                "spot_id": spot_id,
+                "parking_timestamp": parked,
+                "leaving_timestamp": parked + timedelta(hours=hours),
+                "parking_cost": round(hours * (20 + (spot_id - 1) // SPOTS_PER_LOT), 2),
+                "vehicle_number": f"TN{i:08d}",
+                "payment_status": True,
+            }
+
+    reservations = ReservationRepository()
+    reservations.bulk_create(history(), chunk_size=10_000)
+    reservations.commit()
+    usage = DailyLotUsageRepository()
+    usage.rebuild()
+    usage.commit()
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Percentiles, mean and sequential throughput of latency samples"""
+    cuts = statistics.quantiles(samples_ms, n=100, method="inclusive")
+    return {
+        "n": len(samples_ms),
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "mean_ms": round(statistics.fmean(samples_ms), 3),
+        "throughput_rps": round(1000 * len(samples_ms) / sum(samples_ms), 1),
+    }
+
+
+def timed_call(samples: List[float], fn, *args, **kwargs):
+    start = time.perf_counter()
+    response = fn(*args, **kwargs)
+    samples.append((time.perf_counter() - start) * 1000)
+    return response
+
+
+def login(app, username: str):
+    client = app.test_client()
+    check(client.post("/api/login", json={"user_or_mail": username, "password": PASSWORD}))
+    return client
+
+
+def run_size(reservations: int, iterations: int, seed_value: int) -> Dict[str, Any]:
+    """Seed one dataset and run every scenario against it"""
+    rng = random.Random(seed_value)
+    shape = dataset_shape(reservations)
+    with tempfile.TemporaryDirectory(prefix="wepark-suite-") as tmp:
+        app, _ = create_bench_app(os.path.join(tmp, "suite.db"))
+        password_hash = generate_password_hash(PASSWORD, method=app.config["PASSWORD_HASH_METHOD"])
+        started = time.perf_counter()
+        with app.app_context():
+            seed(shape, password_hash, rng)
+        seed_seconds = time.perf_counter() - started
+
+        admin = admin_client(app)
+        member = login(app, "member0")
+        bookers = [login(app, f"member{i}") for i in range(1, BOOKING_USERS + 1)]
+        anonymous = app.test_client()
+        samples: Dict[str, List[float]] = {name: [] for name in SCENARIOS}
+
+        for i in range(WARMUP + iterations):
+            # Warm-up rounds run everything but are not recorded
+            record = {name: samples[name] if i >= WARMUP else [] for name in SCENARIOS}
+            username = f"member{rng.randrange(shape['users'])}"
+            check(timed_call(record["login"], anonymous.post, "/api/login",
+                             json={"user_or_mail": username, "password": PASSWORD}))
+            check(timed_call(record["lot_list"], admin.get, "/api/lot"))
+            cache.clear()
+            check(timed_call(record["lot_search"], member.get, f"/api/lot?name=Suite Lot {rng.randrange(LOTS)}"))
+
+            booker = bookers[i % len(bookers)]
+            booked = check(timed_call(record["book"], booker.post, "/api/reservation",
+                                      json={"lot_id": rng.randrange(LOTS) + 1, "vehicle_number": "TN01AB1234"}))
+            check(timed_call(record["occupy"], booker.put, f"/api/reservation/{booked['reservation_id']}"))
+            check(timed_call(record["release_pay"], booker.post, "/api/reservation",
+                             json={"reservation_id": booked["reservation_id"], "payment_id": f"MOCK_{i}"}))
+
+            cache.clear()
+            check(timed_call(record["admin_stats"], admin.get, "/api/stats"))
+            cache.clear()
+            check(timed_call(record["user_stats"], member.get, "/api/stats"))
+            check(timed_call(record["notifications"], member.get, "/api/notification"))
+
+    return {
+        "dataset": shape,
+        "seed_seconds": round(seed_seconds, 2),
+        "scenarios": {name: summarize(values) for name, values in samples.items()},
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(report: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Print p50/p95 changes against an earlier report, for sizes in both"""
+    before = previous.get("startup")
+    if before:
+        now = report["startup"]
+        print(f"\nstartup vs {previous.get('environment', {}).get('commit')}: "
+              f"total {before['total_ms']:.0f} -> {now['total_ms']:.0f} ms, "
+              f"SQL statements {before['sql_statements']} -> {now['sql_statements']}")
+    for size, result in report["results"].items():
+        before = previous.get("results", {}).get(size)
+        if not before:
+            continue
+        print(f"\n{size} reservations vs {previous.get('environment', {}).get('commit')}:")
+        for name, now in result["scenarios"].items():
+            old = before["scenarios"].get(name)
+            if old:
+                change = (now["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 if old["p95_ms"] else 0.0
+                print(f"  {name:<14} p50 {old['p50_ms']:8.2f} -> {now['p50_ms']:8.2f} ms   "
+                      f"p95 {old['p95_ms']:8.2f} -> {now['p95_ms']:8.2f} ms ({change:+.0f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000],
+                        help="reservation counts to seed")
+    parser.add_argument("--iterations", type=int, default=200, help="timed calls per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--compare", help="earlier report to compare against")
+    parser.add_argument("--startup-runs", type=int, default=5, help="cold starts to take the median of")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        with open(args.result, "w") as handle:
+            json.dump(run_size(args.single, args.iterations, args.seed), handle)
+        return
+
+    report = {
+        "environment": environment(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "results": {},
+        "startup": measure_startup(args.startup_runs),
+    }
+    startup = report["startup"]
+    print(f"startup: import {startup['import_ms']:.0f} ms, create_app {startup['create_app_ms']:.0f} ms, "
+          f"first request {startup['first_request_ms']:.0f} ms, {startup['sql_statements']} SQL statements")
+    for size in args.sizes:
+        with tempfile.NamedTemporaryFile(suffix=".json") as result:
+            subprocess.run([sys.executable, "-m", "benchmarks.api_suite", "--single", str(size),
+                            "--iterations", str(args.iterations), "--seed", str(args.seed),
+                            "--result", result.name], check=True, stdout=subprocess.DEVNULL)
+            with open(result.name) as handle:
+                report["results"][str(size)] = json.load(handle)
+        outcome = report["results"][str(size)]
+        print(f"{size:>9} reservations (seeded in {outcome['seed_seconds']:.1f}s)")
+        for name, stats in outcome["scenarios"].items():
+            print(f"  {name:<14} p50 {stats['p50_ms']:8.2f}  p95 {stats['p95_ms']:8.2f}  "
+                  f"p99 {stats['p99_ms']:8.2f} ms  {stats['throughput_rps']:8.1f} req/s")
+
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    print(f"report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            compare(report, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# WePark/backend/benchmarks/booking_stress.py
+"""
+Booking Concurrency Stress Benchmark
+Hammers one lot from many threads and checks that no spot is double-booked
+
+Usage:
+    python -m benchmarks.booking_stress --threads 16 --spots 50 --attempts 200 --hold 2
+
+Each thread occupies what it books and keeps its last --hold bookings, so
+threads x hold spots are held at any time (including at the end of the
+run) while the rest of the lot churns; keep that below --spots.
+"""
+
+import argparse
+import random
+import threading
+from datetime import datetime
+from collections import Counter, deque
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import aliased
+from app import db
+from app.models import Reservation
+from app.services.lot_service import LotService
+from .common import create_bench_app, admin_client, user_client, check, timed
+
+
+class HeldSpots:
+    """Spots currently booked by the workers, used to catch double allocation"""
+
+    def __init__(self):
+        self.spots = set()
+        self.doubles = 0
+        self.lock = threading.Lock()
+
+    def take(self, spot_id, recount=True):
+        with self.lock:
+            if recount and spot_id in self.spots:
+                self.doubles += 1
+            self.spots.add(spot_id)
+
+    def drop(self, spot_id):
+        with self.lock:
+            self.spots.discard(spot_id)
+
+
+def worker(client, spot_ids, lot_id, attempts, hold, seed, outcomes, held, barrier):
+    rng = random.Random(seed)
+    holding = deque()
+    barrier.wait()
+    for _ in range(attempts):
+        if rng.random() < 0.5:
+            response = client.post(f"/api/reservation/spot/{rng.choice(spot_ids)}", json={})
+        else:
+            response = client.post("/api/reservation", json={"lot_id": lot_id})
+        if response.status_code == 200:
+            outcomes["booked"] += 1
+            result = response.get_json()
+            held.take(result["spot_id"])
+            occupied = client.put(f"/api/reservation/{result['reservation_id']}")
+            outcomes["occupied" if occupied.status_code == 200 else "occupy_failed"] += 1
+            holding.append((result["reservation_id"], result["spot_id"]))
+        elif "Something went wrong" in response.get_data(as_text=True):
+            outcomes["errors"] += 1
+        else:
+            outcomes["rejected"] += 1
+
+        # Keep the last few bookings so spots stay held across other threads'
+        # attempts (and are still held when the run ends); release the rest
+        while len(holding) > hold:
+            reservation_id, spot_id = holding.popleft()
+            # Dropped before the release is sent: the spot stays occupied in
+            # the database until the release commits, so nobody can legally
+            # book it first. Dropping after the 200 would race with a thread
+            # that booked the freed spot in between
+            held.drop(spot_id)
+            released = client.post("/api/reservation", json={"reservation_id": reservation_id})
+            if released.status_code == 200:
+                outcomes["released"] += 1
+            else:
+                outcomes["release_failed"] += 1
+                held.take(spot_id, recount=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--spots", type=int, default=50)
+    parser.add_argument("--attempts", type=int, default=200, help="booking attempts per thread")
+    parser.add_argument("--hold", type=int, default=2, help="bookings each thread keeps before releasing")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    admin = admin_client(app)
+    check(admin.post("/api/lot", json={
+        "prime_location": "Stress Lot",
+        "price_per_hour": 20,
+        "address": "1 Stress Road",
+        "pincode": 600001,
+        "no_of_spots": args.spots,
+    }), 201)
+    lot_id = check(admin.get("/api/lot"))[0]["lot_id"]
+    lot = check(admin.get(f"/api/lot/{lot_id}"))
+    spot_ids = [spot["spot_id"] for spot in lot["spots"]]
+
+    clients = [user_client(app, f"stress_{i}") for i in range(args.threads)]
+    per_thread = [Counter() for _ in clients]
+    held = HeldSpots()
+    barrier = threading.Barrier(len(clients))
+    threads = [
+        threading.Thread(target=worker, args=(client, spot_ids, lot["lot_id"], args.attempts, args.hold,
+                                              args.seed + i, per_thread[i], held, barrier))
+        for i, client in enumerate(clients)
+    ]
+
+    with timed() as elapsed:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    outcomes = sum(per_thread, Counter())
+    with app.app_context():
+        # Two reservations overlapping on one spot means a double allocation
+        active_per_spot = db.session.query(Reservation.spot_id, func.count()) \
+            .filter(Reservation.leaving_timestamp == None) \
+            .group_by(Reservation.spot_id).having(func.count() > 1).all()
+        # ... as do two [parking, leaving) intervals on one spot that overlap
+        # (an active reservation is open-ended)
+        other = aliased(Reservation)
+        never = datetime.max
+        overlapping = db.session.query(func.count()).select_from(Reservation).join(other, and_(
+            other.spot_id == Reservation.spot_id,
+            other.reservation_id > Reservation.reservation_id,
+            other.parking_timestamp < func.coalesce(Reservation.leaving_timestamp, never),
+            Reservation.parking_timestamp < func.coalesce(other.leaving_timestamp, never),
+        )).scalar()
+        active = db.session.query(Reservation.spot_id).filter(Reservation.leaving_timestamp == None).all()
+        total = db.session.query(func.count(Reservation.reservation_id)).scalar()
+        drifted = LotService().repair_spot_counts(dry_run=True)
+
+    print(f"threads={args.threads} spots={args.spots} attempts/thread={args.attempts}")
+    print(f"booked={outcomes['booked']} occupied={outcomes['occupied']} released={outcomes['released']} "
+          f"rejected={outcomes['rejected']} errors={outcomes['errors']} "
+          f"occupy_failed={outcomes['occupy_failed']} release_failed={outcomes['release_failed']} rows={total}")
+    print(f"bookings/sec: {outcomes['booked'] / elapsed['seconds']:.1f} ({elapsed['seconds']:.2f}s)")
+    print(f"held at end: {len(active)} active reservations, {len(held.spots)} spots tracked")
+    print(f"double allocations: {held.doubles} in flight, {len(active_per_spot)} spots with several "
+          f"active reservations, {overlapping} overlapping intervals")
+    print(f"lots with drifted counters: {len(drifted)}")
+    mismatch = sorted(spot_id for spot_id, in active) != sorted(held.spots)
+    if held.doubles or active_per_spot or overlapping or mismatch or drifted:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
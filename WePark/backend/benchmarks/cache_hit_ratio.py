@@ -0,0 +1,81 @@
+# WePark/backend/benchmarks/cache_hit_ratio.py
+"""
+Cache Hit Ratio Benchmark
+Compares wiping the whole cache on every write with tag-versioned invalidation
+
+Usage:
+    python -m benchmarks.cache_hit_ratio --lots 50 --ops 5000 --write-ratio 0.1
+"""
+
+import argparse
+import random
+
+from app import cache
+from app.utils.cache_helpers import cache_stats
+from .common import create_bench_app, admin_client, user_client, check, timed
+
+
+def run_workload(reader, booker, lot_ids, pincodes, ops, write_ratio, clear_all, seed):
+    rng = random.Random(seed)
+    cache.clear()
+    cache_stats["hits"] = cache_stats["misses"] = 0
+    active = []
+
+    for _ in range(ops):
+        if rng.random() < write_ratio:
+            if active and rng.random() < 0.5:
+                reservation_id = active.pop(rng.randrange(len(active)))
+                check(booker.post("/api/reservation", json={"reservation_id": reservation_id}))
+            else:
+                result = booker.post("/api/reservation", json={"lot_id": rng.choice(lot_ids)})
+                if result.status_code == 200:
+                    active.append(result.get_json()["reservation_id"])
+            if clear_all:
+                cache.clear()
+            continue
+
+        roll = rng.random()
+        if roll < 0.7:
+            check(reader.get(f"/api/lot/{rng.choice(lot_ids)}"))
+        elif roll < 0.9:
+            check(reader.get("/api/lot"))
+        else:
+            check(reader.get(f"/api/lot?pincode={rng.choice(pincodes)}"))
+
+    total = cache_stats["hits"] + cache_stats["misses"]
+    return cache_stats["hits"] / total if total else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lots", type=int, default=50)
+    parser.add_argument("--spots", type=int, default=20)
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    admin = admin_client(app)
+    pincodes = [600000 + i % 10 for i in range(args.lots)]
+    for i, pincode in enumerate(pincodes):
+        check(admin.post("/api/lot", json={
+            "prime_location": f"Lot {i}",
+            "price_per_hour": 20,
+            "address": f"{i} Bench Road",
+            "pincode": pincode,
+            "no_of_spots": args.spots,
+        }), 201)
+    lot_ids = [lot["lot_id"] for lot in check(admin.get("/api/lot"))]
+    booker = user_client(app, "bench_booker")
+
+    for label, clear_all in (("clear-all", True), ("targeted", False)):
+        with timed() as elapsed:
+            ratio = run_workload(admin, booker, lot_ids, sorted(set(pincodes)),
+                                 args.ops, args.write_ratio, clear_all, args.seed)
+        print(f"{label:>10}: hit ratio {ratio:6.1%}  "
+              f"({cache_stats['hits']} hits / {cache_stats['misses']} misses, {elapsed['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
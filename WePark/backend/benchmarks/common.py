@@ -0,0 +1,107 @@
+# WePark/backend/benchmarks/common.py
+"""
+Benchmark Helpers
+Builds a throwaway application instance and shared fixtures for benchmarks
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from app import app_creator, db
+from app.config import TestingConfig
+
+
+ADMIN_CREDENTIALS = {"user_or_mail": "admin", "password": "admin123"}
+
+
+def create_bench_app(db_path: Optional[str] = None) -> Tuple[Any, Any]:
+    """
+    Create the application on a file-backed SQLite database, with its
+    tables and the default admin created as `flask init-db` and
+    `flask create-admin` would
+
+    Args:
+        db_path: Optional database file path (a temp file is used if omitted)
+
+    Returns:
+        Tuple of (app, celery)
+    """
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="wepark-bench-"), "bench.db")
+
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        JWT_ACCESS_TOKEN_EXPIRES = TestingConfig.JWT_ACCESS_TOKEN_EXPIRES * 100
+
+    app, celery = app_creator(BenchConfig)
+    runner = app.test_cli_runner()
+    for command in ("init-db", "create-admin"):
+        result = runner.invoke(args=[command])
+        assert result.exit_code == 0, result.output
+    return app, celery
+
+
+def admin_client(app) -> Any:
+    """Return a test client logged in as the seeded admin"""
+    client = app.test_client()
+    check(client.post("/api/login", json=ADMIN_CREDENTIALS))
+    return client
+
+
+def user_client(app, username: str, password: str = "password123",
+                pincode: str = "600001") -> Any:
+    """Sign up (if needed) and log in a user, returning its test client"""
+    client = app.test_client()
+    client.post("/api/signup", json={
+        "email": f"{username}@example.com",
+        "username": username,
+        "password": password,
+        "confirm_password": password,
+        "address": "Benchmark Street",
+        "pincode": pincode,
+    })
+    check(client.post("/api/login", json={"user_or_mail": username, "password": password}))
+    return client
+
+
+def check(response, status: int = 200) -> Dict[str, Any]:
+    """Assert the response status and return its JSON body"""
+    if response.status_code != status:
+        raise AssertionError(f"{response.status_code}: {response.get_data(as_text=True)[:300]}")
+    return response.get_json()
+
+
+@contextmanager
+def timed() -> Iterator[Dict[str, float]]:
+    """Context manager recording elapsed seconds under the 'seconds' key"""
+    result = {"seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
+
+
+@contextmanager
+def captured_statements(selects_only: bool = False) -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Context manager collecting (statement, parameters) sent to the database
+
+    Args:
+        selects_only: If True, only SELECT statements are collected
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not selects_only or statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
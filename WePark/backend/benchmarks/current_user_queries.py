@@ -0,0 +1,93 @@
+# WePark/backend/benchmarks/current_user_queries.py
+"""
+Current User Lookup Check
+Counts SQL statements per authenticated user call in the configured
+(default) setup, where every call still runs one primary-key user lookup,
+and optionally with the opt-in current-user cache, which skips it on
+reads. Checks that deletes are seen straight away: by reads in the process
+that made them, and by writes even when another process did
+
+Usage:
+    python -m benchmarks.current_user_queries --calls 500
+    python -m benchmarks.current_user_queries --calls 500 --cache-ttl 30
+"""
+
+import argparse
+
+from app import cache, db
+from app.models import User
+from app.utils.current_user import clear_current_user_cache
+from .common import create_bench_app, admin_client, user_client, check, captured_statements, timed
+
+
+ENDPOINTS = ("/api/reservation", "/api/notification", "/api/stats")
+
+
+def measure(app, client, label, calls, results):
+    clear_current_user_cache()
+    check(client.get(ENDPOINTS[0]))  # Warm up
+    for endpoint in ENDPOINTS:
+        cache.clear()
+        with app.app_context(), captured_statements(selects_only=True) as statements, timed() as elapsed:
+            for _ in range(calls):
+                check(client.get(endpoint))
+        lookups = sum("FROM users" in statement and "users.user_id =" in statement
+                      for statement, _ in statements)
+        results[label, endpoint] = (len(statements), lookups)
+        print(f"{label:>10} {endpoint:<18}: {len(statements) / calls:5.2f} selects/call "
+              f"({lookups / calls:.2f} user lookups), "
+              f"{calls / elapsed['seconds']:6,.0f} calls/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--cache-ttl", type=int, default=0,
+                        help="also measure the opt-in cache with this TTL (off by default, as in production)")
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    client = user_client(app, "regular")
+    configured = app.config["CURRENT_USER_CACHE_TTL"]
+
+    results = {}
+    default = f"default {configured}s" if configured else "default"
+    measure(app, client, default, args.calls, results)
+    if not configured:
+        # The id-claim lookup replaced the username lookup; it did not remove it
+        for endpoint in ENDPOINTS:
+            assert results[default, endpoint][1] == args.calls, (endpoint, results[default, endpoint])
+        print("default configuration: one primary-key user lookup per call (the cache is opt-in)")
+
+    if args.cache_ttl > 0:
+        opt_in = f"cache {args.cache_ttl}s"
+        app.config["CURRENT_USER_CACHE_TTL"] = args.cache_ttl
+        measure(app, client, opt_in, args.calls, results)
+        for endpoint in ENDPOINTS:
+            assert results[opt_in, endpoint][0] < results[default, endpoint][0], endpoint
+        print(f"CURRENT_USER_CACHE_TTL={args.cache_ttl} skips the lookup on reads only; "
+              f"the default configuration does not get this")
+
+    # Deleting the user in this process evicts any cached entry
+    admin = admin_client(app)
+    with app.app_context():
+        user_id = User.query.filter_by(username="regular").one().user_id
+    check(admin.delete(f"/api/user/{user_id}"))
+    check(client.get("/api/notification"), 404)
+    print("deleted user gets 404")
+
+    # A delete made by another process leaves this process's entry behind;
+    # reads may serve it until it expires, but booking must not
+    other = user_client(app, "elsewhere")
+    check(other.get("/api/notification"))
+    with app.app_context():
+        user = User.query.filter_by(username="elsewhere").one()
+        db.session.delete(user)
+        db.session.commit()
+    refused = check(other.post("/api/reservation", json={"lot_id": 1}), 404)
+    assert refused["message"] == "User not found", refused
+    print("user deleted by another process cannot book")
+
+
+if __name__ == "__main__":
+    main()
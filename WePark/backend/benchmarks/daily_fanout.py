@@ -0,0 +1,86 @@
+# WePark/backend/benchmarks/daily_fanout.py
+"""
+Daily Reminder Fan-out Benchmark
+Compares one commit and one send per (lot, user) pair with the chunked
+daily_remainder for a new lot in a dense pincode
+
+Email delivery is suppressed under TestingConfig, so this measures the
+database and rendering side; Celery runs eagerly in-process.
+
+Usage:
+    python -m benchmarks.daily_fanout --users 5000
+"""
+
+import argparse
+from datetime import timedelta
+
+from flask import current_app, render_template
+from sqlalchemy import event
+from app import db, mail
+from app.models import Lot, Notification, User
+from app.repositories import UserRepository
+from app.services.lot_service import LotService
+from app.utils.daily import daily_remainder
+from app.utils.email import email_sender
+from app.utils.helper import get_ist_time
+from .common import create_bench_app, timed
+
+
+PINCODE = 600042
+
+
+def legacy_daily_remainder():
+    """The job as it was: a commit and an email per (lot, user) pair"""
+    time_range = get_ist_time() - timedelta(hours=24)
+    for lot in Lot.query.filter(Lot.created_at >= time_range).all():
+        for user in User.query.filter_by(pincode=lot.pincode).all():
+            title = "New Lot in your Area"
+            template = render_template("daily_remainder.html", user=user, lot=lot,
+                                       url=f"{current_app.config['FRONTEND_URL']}/dashboard/available_lots")
+            db.session.add(Notification(user_id=user.user_id, title=title, body=template))
+            db.session.commit()
+            email_sender(user.email, title, template, is_html=True)
+
+
+def run(fn):
+    commits = []
+    listener = lambda session: commits.append(1)
+    event.listen(db.session, "after_commit", listener)
+    try:
+        with mail.record_messages() as outbox, timed() as elapsed:
+            fn()
+    finally:
+        event.remove(db.session, "after_commit", listener)
+    return elapsed["seconds"], len(commits), len(outbox)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    args = parser.parse_args()
+
+    app, celery = create_bench_app()
+    celery.conf.task_always_eager = True
+    with app.app_context():
+        UserRepository().bulk_create(({
+            "username": f"resident{i}",
+            "email": f"resident{i}@example.com",
+            "password": "not-a-login",
+            "address": "Dense Street",
+            "pincode": PINCODE,
+        } for i in range(args.users)), chunk_size=5000)
+        LotService().create_lot(prime_location="Fresh Lot", price_per_hour=30, address="2 Road",
+                                pincode=PINCODE, no_of_spots=10)
+
+        for label, fn in (("per-pair commit", legacy_daily_remainder), ("chunked + group", daily_remainder)):
+            Notification.query.delete()
+            db.session.commit()
+            seconds, commits, sent = run(fn)
+            stored = Notification.query.count()
+            assert stored == sent == args.users, (stored, sent)
+            print(f"{label:>16}: {seconds:6.2f}s, {commits:5} commits, {sent} emails, "
+                  f"{args.users / seconds:,.0f} users/s")
+
+
+if __name__ == "__main__":
+    main()
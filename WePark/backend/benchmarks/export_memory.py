@@ -0,0 +1,103 @@
+# WePark/backend/benchmarks/export_memory.py
+"""
+Usage Export Memory Benchmark
+Compares building a user's CSV from ORM objects in a StringIO with the
+streamed, gzip-spooled export, and checks the download route's output
+
+Usage:
+    python -m benchmarks.export_memory --rows 200000
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Reservation, User
+from app.repositories import ReservationRepository
+from app.services.export_service import ExportService
+from app.services.lot_service import LotService
+from .common import create_bench_app, user_client, timed
+
+
+def seed(user_id, rows):
+    LotService().create_lot(prime_location="Export Lot", price_per_hour=20, address="1 Road",
+                            pincode=600001, no_of_spots=100)
+    start = datetime(2020, 1, 1)
+    repo = ReservationRepository()
+    repo.bulk_create(({
+        "user_id": user_id,
+        "spot_id": 1 + i % 100,
+        "parking_timestamp": start + timedelta(minutes=i),
+        "leaving_timestamp": start + timedelta(minutes=i + 45),
+        "parking_cost": 15.0,
+        "vehicle_number": f"TN{i:08d}",
+        "payment_status": True,
+    } for i in range(rows)), chunk_size=10000)
+    repo.commit()
+
+
+def legacy_export(user_id):
+    """The export as it was: every reservation loaded, lazy spot/lot loads"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=ExportService.USAGE_HEADERS)
+    writer.writeheader()
+    for reservation in Reservation.query.filter_by(user_id=user_id).all():
+        writer.writerow({
+            "reservation_id": reservation.reservation_id,
+            "lot_id": reservation.spot.lot.lot_id,
+            "spot_id": reservation.spot.spot_id,
+            "prime_location": reservation.spot.lot.prime_location,
+            "parking_cost": reservation.parking_cost,
+            "parking_timestamp": reservation.parking_timestamp
+        })
+    return output.getvalue()
+
+
+def streamed_export(user_id):
+    """The export as the task runs it, ending with the attachment bytes"""
+    service = ExportService()
+    with service.spool_gzip(service.iter_user_usage_csv(user_id)) as spool:
+        return spool.read()
+
+
+def measure(fn, user_id):
+    db.session.expunge_all()
+    tracemalloc.start()
+    with timed() as elapsed:
+        output = fn(user_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output, peak / 2**20, elapsed["seconds"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    client = user_client(app, "exporter")
+    with app.app_context():
+        user_id = User.query.filter_by(username="exporter").first().user_id
+        seed(user_id, args.rows)
+
+        outputs = {}
+        for label, fn in (("StringIO + .all()", legacy_export), ("streamed gzip spool", streamed_export)):
+            output, peak_mb, seconds = measure(fn, user_id)
+            print(f"{label:>20}: peak {peak_mb:8.1f} MiB, {seconds:.2f}s, {len(output) / 2**20:.1f} MiB output")
+            outputs[label] = gzip.decompress(output).decode("utf-8") if isinstance(output, bytes) else output
+        assert len(set(outputs.values())) == 1, "streamed export differs from the legacy CSV"
+
+    response = client.get("/api/export/download")
+    assert response.status_code == 200 and response.is_streamed
+    assert response.get_data(as_text=True).replace("\r\n", "\n") == \
+        outputs["StringIO + .all()"].replace("\r\n", "\n")
+    print(f"download route streamed {args.rows} rows matching the legacy CSV")
+
+
+if __name__ == "__main__":
+    main()
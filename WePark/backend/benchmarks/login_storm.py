@@ -0,0 +1,141 @@
+# WePark/backend/benchmarks/login_storm.py
+"""
+Login Storm Benchmark
+Measures booking latency while many threads log in at once, with password
+hashing in the request thread and in the process pool
+
+The pool only helps where there are spare cores: hashlib releases the GIL
+while stretching, so on a single core both modes compete for the same CPU.
+Also checks that a hash made with old parameters is upgraded on login.
+
+Usage:
+    python -m benchmarks.login_storm --storm 16 --seconds 10 --workers 2
+"""
+
+import argparse
+import statistics
+import threading
+from collections import Counter
+
+from werkzeug.security import generate_password_hash
+from app.models import User
+from app.repositories import UserRepository
+from app.utils.passwords import hash_password, shutdown_pool
+from .common import create_bench_app, admin_client, user_client, check, captured_statements, timed
+
+
+PASSWORD = "password123"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def storm(client, users, stop, outcomes):
+    i = 0
+    while not stop.is_set():
+        response = client.post("/api/login", json={"user_or_mail": f"crowd{i % users}", "password": PASSWORD})
+        outcomes[response.status_code] += 1
+        i += 1
+
+
+def book_and_release(client, lot_id, stop, latencies):
+    while not stop.is_set():
+        with timed() as elapsed:
+            reservation = check(client.post("/api/reservation", json={"lot_id": lot_id}))
+            check(client.post("/api/reservation", json={"reservation_id": reservation["reservation_id"]}))
+        latencies.append(elapsed["seconds"] * 1000)
+
+
+def run(app, client, lot_id, args, workers, storm_threads):
+    app.config["PASSWORD_POOL_WORKERS"] = workers
+    shutdown_pool()
+    if workers:
+        with app.app_context():
+            hash_password("warm-up")  # Keep process spawn out of the timings
+    stop = threading.Event()
+    latencies, outcomes = [], [Counter() for _ in range(storm_threads)]
+    threads = [threading.Thread(target=storm, args=(app.test_client(), args.users, stop, outcomes[i]))
+               for i in range(storm_threads)]
+    threads.append(threading.Thread(target=book_and_release, args=(client, lot_id, stop, latencies)))
+    for thread in threads:
+        thread.start()
+    stop.wait(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, sum(outcomes, Counter())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--storm", type=int, default=16, help="threads logging in")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=2, help="hashing processes for the pool run")
+    parser.add_argument("--users", type=int, default=200)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    method = app.config["PASSWORD_HASH_METHOD"]
+    with app.app_context():
+        current_hash = generate_password_hash(PASSWORD, method=method)
+        UserRepository().bulk_create(({
+            "username": f"crowd{i}",
+            "email": f"crowd{i}@example.com",
+            "password": current_hash,
+            "address": "Bench",
+            "pincode": 600001,
+        } for i in range(args.users)), chunk_size=1000)
+        # One user still on an older, cheaper hash
+        UserRepository().bulk_create([{
+            "username": "oldtimer",
+            "email": "oldtimer@example.com",
+            "password": generate_password_hash(PASSWORD, method="pbkdf2:sha256:1000"),
+            "address": "Bench",
+            "pincode": 600001,
+        }])
+        UserRepository().commit()
+
+    admin = admin_client(app)
+    check(admin.post("/api/lot", json={
+        "prime_location": "Storm Lot", "price_per_hour": 20, "address": "1 Road",
+        "pincode": 600001, "no_of_spots": 20
+    }), 201)
+    lot_id = check(admin.get("/api/lot"))[0]["lot_id"]
+    booker = user_client(app, "booker")
+
+    print(f"hash method {method}, {args.storm} login threads, {args.seconds:.0f}s per run")
+    for label, workers, storm_threads in (("no storm", 0, 0), ("in-thread", 0, args.storm),
+                                          (f"pool x{args.workers}", args.workers, args.storm)):
+        latencies, outcomes = run(app, booker, lot_id, args, workers, storm_threads)
+        print(f"{label:>10}: booking p50 {statistics.median(latencies):7.1f} ms, "
+              f"p95 {percentile(latencies, 95):7.1f} ms over {len(latencies):5} bookings; "
+              f"logins ok {outcomes[200] / args.seconds:6.1f}/s, 503 {outcomes[503]}")
+
+    # A tiny queue turns the overflow into 503s instead of waiting threads
+    app.config["PASSWORD_POOL_QUEUE_LIMIT"] = 0
+    latencies, outcomes = run(app, booker, lot_id, args, 1, args.storm)
+    print(f"queue limit 0: logins ok {outcomes[200]}, 503 {outcomes[503]}")
+    assert outcomes[503] > 0 and set(outcomes) <= {200, 503}, outcomes
+    shutdown_pool()
+
+    check(app.test_client().post("/api/login", json={"user_or_mail": "oldtimer", "password": PASSWORD}))
+    with app.app_context():
+        stored = User.query.filter_by(username="oldtimer").one().password
+    assert stored.startswith(method + "$"), stored
+    print(f"pbkdf2:sha256:1000 hash upgraded to {method} on login")
+
+    # A short method name is stored in full; hashes made with it are current
+    short = method.split(":", 1)[0]
+    if generate_password_hash(PASSWORD, method=short).startswith(method + "$"):
+        app.config["PASSWORD_HASH_METHOD"] = short
+        with app.app_context(), captured_statements() as statements:
+            check(app.test_client().post("/api/login", json={"user_or_mail": "crowd0", "password": PASSWORD}))
+        updates = [statement for statement, _ in statements if statement.lstrip().upper().startswith("UPDATE")]
+        assert not updates, updates
+        print(f"PASSWORD_HASH_METHOD={short} does not rehash {method} hashes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# WePark/backend/benchmarks/login_throughput.py
+"""
+Login Throughput Benchmark
+Compares the admin-then-user login sequence with the single principal
+lookup: statements per login and logins/sec for users, admins and
+unknown identifiers
+
+Users are seeded with a cheap password hash so the lookup, not PBKDF2,
+is what gets measured.
+
+Usage:
+    python -m benchmarks.login_throughput --users 10000 --logins 2000
+"""
+
+import argparse
+
+from werkzeug.security import generate_password_hash
+from app.repositories import AdminRepository, UserRepository
+from app.services.auth_service import AuthService
+from .common import create_bench_app, check, captured_statements, timed
+
+
+PASSWORD = "password123"
+
+
+def legacy_login(identifier, password):
+    """LoginApi as it was: admin first, then user, one OR query each"""
+    for repo in (AdminRepository(), UserRepository()):
+        principal = repo.find_by_username_or_email(identifier)
+        if principal and principal.check_password(password):
+            return {'success': True}
+    return {'success': False}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--logins", type=int, default=2000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    # Configured too, so logins do not upgrade the cheap hashes
+    app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:1000"
+    cheap_hash = generate_password_hash(PASSWORD, method=app.config["PASSWORD_HASH_METHOD"])
+    with app.test_request_context():
+        UserRepository().bulk_create(({
+            "username": f"member{i}",
+            "email": f"member{i}@example.com",
+            "password": cheap_hash,
+            "address": "Bench",
+            "pincode": 600001,
+        } for i in range(args.users)), chunk_size=5000)
+        UserRepository().commit()
+
+        auth_service = AuthService()
+        workloads = {
+            "user by name": [f"member{i % args.users}" for i in range(args.logins)],
+            "user by email": [f"member{i % args.users}@example.com" for i in range(args.logins)],
+            "unknown": [f"ghost{i % 50}" for i in range(args.logins)],
+        }
+        for label, identifiers in workloads.items():
+            for name, login in (("admin+user", lambda x: legacy_login(x, PASSWORD)),
+                                ("single lookup", lambda x: auth_service.login(x, PASSWORD))):
+                with captured_statements(selects_only=True) as statements, timed() as elapsed:
+                    successes = sum(login(identifier)['success'] for identifier in identifiers)
+                print(f"{label:>14} / {name:<13}: {len(statements) / len(identifiers):4.2f} queries/login, "
+                      f"{len(identifiers) / elapsed['seconds']:8,.0f} logins/s, {successes} ok")
+
+    # End to end, and a signup clears the negative entry for its username
+    client = app.test_client()
+    with timed() as elapsed:
+        for i in range(args.logins):
+            check(client.post("/api/login", json={"user_or_mail": f"member{i % args.users}", "password": PASSWORD}))
+    print(f"POST /api/login: {args.logins / elapsed['seconds']:,.0f} logins/s")
+
+    credentials = {"user_or_mail": "latecomer", "password": PASSWORD}
+    check(client.post("/api/login", json=credentials), 401)
+    check(client.post("/api/signup", json={
+        "email": "latecomer@example.com", "username": "latecomer", "password": PASSWORD,
+        "confirm_password": PASSWORD, "address": "Bench", "pincode": "600001"
+    }))
+    check(client.post("/api/login", json=credentials))
+    print("signup clears the negative cache entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# WePark/backend/benchmarks/lot_creation.py
+"""
+Lot Creation Benchmark
+Times LotService.create_lot against the old one-INSERT-per-spot loop
+
+Usage:
+    python -m benchmarks.lot_creation --counts 100 1000 5000
+"""
+
+import argparse
+
+from app import db
+from app.models import Lot, Spot
+from app.services.lot_service import LotService
+from .common import create_bench_app, timed
+
+
+def create_lot_per_row(no_of_spots):
+    lot = Lot(prime_location="Per Row", price_per_hour=20, address="1 Road",
+              pincode=600001, no_of_spots=no_of_spots)
+    db.session.add(lot)
+    db.session.flush()
+    for _ in range(no_of_spots):
+        db.session.add(Spot(lot_id=lot.lot_id))
+    db.session.commit()
+
+
+def create_lot_bulk(no_of_spots):
+    result = LotService().create_lot(prime_location="Bulk", price_per_hour=20, address="1 Road",
+                                     pincode=600001, no_of_spots=no_of_spots)
+    assert result['success'], result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    with app.app_context():
+        print(f"{'spots':>8} {'per-row (s)':>12} {'bulk (s)':>10} {'speedup':>8}")
+        for count in args.counts:
+            with timed() as per_row:
+                create_lot_per_row(count)
+            with timed() as bulk:
+                create_lot_bulk(count)
+            print(f"{count:>8} {per_row['seconds']:>12.3f} {bulk['seconds']:>10.3f} "
+                  f"{per_row['seconds'] / bulk['seconds']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
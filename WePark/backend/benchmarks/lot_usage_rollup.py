@@ -0,0 +1,144 @@
+# WePark/backend/benchmarks/lot_usage_rollup.py
+"""
+Daily Lot Usage Rollup Check
+Asserts that the incrementally maintained rollup matches a backfill from
+reservations (including a completion costing over 1000 and a deleted user's
+history), then compares admin stats over the rollup with a scan of the raw
+reservation history
+
+Usage:
+    python -m benchmarks.lot_usage_rollup --history 100000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app.models import DailyLotUsage, User
+from app.repositories import DailyLotUsageRepository, ReservationRepository
+from app.services.stats_service import StatsService
+from .common import create_bench_app, admin_client, user_client, check, timed
+
+
+def assert_matches_backfill(what):
+    live = snapshot()
+    repo = DailyLotUsageRepository()
+    repo.rebuild()
+    repo.commit()
+    rebuilt = snapshot()
+    assert live == rebuilt, f"rollup drifted from backfill after {what}:\n{live}\n{rebuilt}"
+    print(f"live rollup matches backfill after {what} over {len(live)} row(s)")
+
+
+def book_and_release(client, lot_id, park_seconds=0.0):
+    booked = check(client.post("/api/reservation", json={"lot_id": lot_id, "vehicle_number": "TN01AB1234"}))
+    check(client.put(f"/api/reservation/{booked['reservation_id']}"))
+    time.sleep(park_seconds)
+    return check(client.post("/api/reservation", json={"reservation_id": booked["reservation_id"]}))
+
+
+def snapshot():
+    return {
+        (row.lot_id, row.usage_date): (row.bookings, row.completed, round(row.revenue, 2),
+                                       round(row.occupied_hours, 4))
+        for row in DailyLotUsage.query.all()
+    }
+
+
+def add_history(count, spot_ids, user_id):
+    start = datetime.now() - timedelta(days=365)
+    repo = ReservationRepository()
+    repo.bulk_create(({
+        "user_id": user_id,
+        "spot_id": spot_ids[i % len(spot_ids)],
+        "parking_timestamp": start + timedelta(minutes=5 * i % 525600),
+        "leaving_timestamp": start + timedelta(minutes=5 * i % 525600 + 90),
+        "parking_cost": 60.0,
+        "vehicle_number": f"TN{i:08d}",
+        "payment_status": True,
+    } for i in range(count)), chunk_size=5000)
+    repo.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, default=100000, help="Historical reservations to backfill")
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    admin = admin_client(app)
+    user = user_client(app, "rollup_user")
+
+    for name in ("North", "South"):
+        check(admin.post("/api/lot", json={
+            "prime_location": name, "price_per_hour": 40, "address": "Rollup Road",
+            "pincode": "600001", "no_of_spots": 10
+        }), 201)
+    lot_ids = [lot["lot_id"] for lot in check(admin.get("/api/lot"))]
+
+    # Live bookings and releases maintain the rollup as they happen
+    for lot_id in lot_ids:
+        for _ in range(4):
+            check(user.post("/api/reservation", json={"lot_id": lot_id, "vehicle_number": "TN01AB1234"}))
+    # Cover every path a booking is counted on: parked then released,
+    # parked and still active, released without parking, never parked
+    reservations = check(user.get("/api/reservation"))
+    for reservation in reservations[:5]:
+        check(user.put(f"/api/reservation/{reservation['reservation_id']}"))
+    for reservation in reservations[3:7]:
+        check(user.post("/api/reservation", json={"reservation_id": reservation["reservation_id"]}))
+
+    with app.app_context():
+        assert_matches_backfill("live bookings")
+
+    # Rupee costs above the legacy paise threshold count in full both ways
+    check(admin.post("/api/lot", json={
+        "prime_location": "Premium", "price_per_hour": 10 ** 9, "address": "Rollup Road",
+        "pincode": "600001", "no_of_spots": 2
+    }), 201)
+    premium = max(lot["lot_id"] for lot in check(admin.get("/api/lot")))
+    charged = book_and_release(user, premium, park_seconds=0.05)["total_amount"]
+    assert charged > 1000, charged
+    with app.app_context():
+        assert_matches_backfill(f"a completion costing {charged:.0f}")
+        revenue = DailyLotUsage.query.filter_by(lot_id=premium).one().revenue
+        assert abs(revenue - charged) < 0.01, (revenue, charged)
+
+    # A deleted user's reservations leave the rollup with them
+    leaving = user_client(app, "rollup_leaver")
+    for lot_id in lot_ids:
+        book_and_release(leaving, lot_id)
+    check(leaving.post("/api/reservation", json={"lot_id": premium, "vehicle_number": "TN01AB1234"}))
+    with app.app_context():
+        leaver_id = User.query.filter_by(username="rollup_leaver").one().user_id
+    check(admin.delete(f"/api/user/{leaver_id}"))
+    with app.app_context():
+        assert_matches_backfill("deleting a user")
+        repo = DailyLotUsageRepository()
+
+        spot_ids = [spot["spot_id"] for spot in check(admin.get(f"/api/lot/{lot_ids[0]}"))["spots"]]
+        add_history(args.history, spot_ids, user_id=1)
+
+        with timed() as backfill:
+            written = repo.rebuild()
+            repo.commit()
+        print(f"backfilled {args.history} reservations into {written} rows in "
+              f"{backfill['seconds'] * 1000:.0f} ms")
+
+        # The API passes midnight bounds, which is all the daily rollup resolves
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        start, end = today - timedelta(days=180), today + timedelta(days=1)
+        stats = StatsService()
+        with timed() as rollup:
+            from_rollup = stats.get_admin_stats(start=start, end=end)
+        with timed() as scan:
+            from_scan = {location: count for _, location, count
+                         in ReservationRepository().count_by_lot(start=start, end=end)}
+        print(f"180-day admin stats: rollup {rollup['seconds'] * 1000:.2f} ms, "
+              f"reservation scan {scan['seconds'] * 1000:.2f} ms")
+        assert from_rollup == from_scan, f"{from_rollup} != {from_scan}"
+        print("rollup and scan agree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# WePark/backend/benchmarks/metrics_overhead.py
+"""
+Metrics Middleware Check
+Drives a mix of admin and user calls, checks the /api/metrics counters
+against what was sent and that only admins and the scrape token can read
+them, and times the same calls with the middleware and SQL listeners
+detached
+
+Usage:
+    python -m benchmarks.metrics_overhead --calls 1000
+"""
+
+import argparse
+import re
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils import metrics as metrics_module
+from app.utils.metrics import metrics
+from .common import create_bench_app, admin_client, user_client, check, timed
+
+
+def scrape(client, **kwargs):
+    response = client.get("/api/metrics", **kwargs)
+    assert response.status_code == 200 and response.content_type.startswith("text/plain")
+    samples = {}
+    for line in response.get_data(as_text=True).splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def drive(admin, user, calls):
+    for i in range(calls):
+        check(admin.get("/api/lot"))
+        check(user.get("/api/reservation"))
+        # role_required("user") on an admin token: a denied, logged call
+        check(admin.get("/api/export"), 403)
+
+
+def detach(app):
+    app.before_request_funcs[None].remove(metrics_module._before_request)
+    app.after_request_funcs[None].remove(metrics_module._after_request)
+    event.remove(Engine, "before_cursor_execute", metrics_module._before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", metrics_module._after_cursor_execute)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    admin = admin_client(app)
+    user = user_client(app, "metered")
+    check(admin.post("/api/lot", json={
+        "prime_location": "Metered Lot", "price_per_hour": 20, "address": "1 Road",
+        "pincode": 600001, "no_of_spots": 10
+    }), 201)
+
+    drive(admin, user, args.calls // 10)  # Warm up
+    metrics.reset()
+    with timed() as measured:
+        drive(admin, user, args.calls)
+    samples = scrape(admin)
+
+    lots = samples['wepark_http_requests_total{endpoint="lotapi",method="GET",status="200"}']
+    denied = samples['wepark_http_requests_total{endpoint="exportapi",method="GET",status="403"}']
+    histogram = samples['wepark_http_request_duration_seconds_count{endpoint="reservationapi",method="GET"}']
+    assert lots == denied == histogram == args.calls, (lots, denied, histogram)
+    statements = samples['wepark_sql_statements_total{endpoint="reservationapi"}']
+    sql_seconds = samples['wepark_sql_seconds_total{endpoint="reservationapi"}']
+    hits = samples['wepark_cache_requests_total{result="hit"}']
+    misses = samples['wepark_cache_requests_total{result="miss"}']
+    print(f"counters match {args.calls} calls per endpoint; "
+          f"reservationapi ran {statements / args.calls:.2f} statements/call, "
+          f"{sql_seconds * 1000 / args.calls:.3f} ms SQL/call")
+    print(f"cache hits {hits:.0f}, misses {misses:.0f}")
+    buckets = [key for key in samples if re.match(r'wepark_http_request_duration_seconds_bucket\{endpoint="lotapi"', key)]
+    print(f"lotapi histogram: {len(buckets)} buckets, +Inf {samples[buckets[-1]]:.0f}")
+
+    app.config["METRICS_TOKEN"] = "scrape-secret"
+    anonymous = app.test_client()
+    assert anonymous.get("/api/metrics").status_code == 401
+    assert anonymous.get("/api/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert user.get("/api/metrics").status_code == 403
+    assert scrape(anonymous, headers={"Authorization": "Bearer scrape-secret"})
+    print("metrics refused to anonymous and user callers, served to the token and admins")
+
+    detach(app)
+    with timed() as bare:
+        drive(admin, user, args.calls)
+    per_call = (measured["seconds"] - bare["seconds"]) / (3 * args.calls) * 1e6
+    print(f"with metrics {measured['seconds']:.2f}s, without {bare['seconds']:.2f}s "
+          f"({per_call:+.0f} us per request)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# WePark/backend/benchmarks/monthly_report.py
+"""
+Monthly Report Benchmark
+Compares the per-user, lazily loaded monthly_remainder with the grouped,
+chunked one: SQL statements, wall time and identical email bodies
+
+Email delivery is suppressed under TestingConfig and Celery runs eagerly
+in-process, so chunks run one after another here.
+
+Usage:
+    python -m benchmarks.monthly_report --users 2000 --per-user 10
+"""
+
+import argparse
+import calendar
+from datetime import timedelta
+
+from flask import render_template
+from app import db, mail
+from app.models import User
+from app.repositories import ReservationRepository, UserRepository
+from app.services.lot_service import LotService
+from app.utils.email import email_sender
+from app.utils.helper import get_ist_time
+from app.utils.monthly import monthly_remainder
+from .common import create_bench_app, captured_statements, timed
+
+
+def legacy_monthly_remainder():
+    """The job as it was: every user, every reservation, lazy spot/lot loads"""
+    time_range = get_ist_time().replace(tzinfo=None) - timedelta(days=30)
+    month_name = calendar.month_name[time_range.month]
+    for user in User.query.all():
+        lot_counts, monthly_cost, total = {}, 0, 0
+        for reservation in user.reservations:
+            if reservation.parking_timestamp and reservation.parking_timestamp >= time_range:
+                total += 1
+                monthly_cost += reservation.parking_cost or 0
+                lot = reservation.spot.lot.prime_location
+                lot_counts[lot] = lot_counts.get(lot, 0) + 1
+        most_visited_lot = max(lot_counts, key=lot_counts.get) if lot_counts else None
+        template = render_template("monthly_report.html", user=user, report_month=month_name,
+                                   monthly_cost=monthly_cost, most_visited_lot=most_visited_lot,
+                                   total_reservation=total)
+        email_sender(user.email, "Monthly report - WePark", template, is_html=True)
+
+
+def seed(users, per_user):
+    UserRepository().bulk_create(({
+        "username": f"commuter{i}",
+        "email": f"commuter{i}@example.com",
+        "password": "not-a-login",
+        "address": "Bench",
+        "pincode": 600001,
+    } for i in range(users)), chunk_size=5000)
+    for name in ("Harbour", "Station"):
+        LotService().create_lot(prime_location=name, price_per_hour=20, address="1 Road",
+                                pincode=600001, no_of_spots=50)
+    now = get_ist_time().replace(tzinfo=None)
+    user_ids = [user_id for user_id, in db.session.query(User.user_id)]
+    # Most of a user's bookings go to one lot so the most visited lot has no ties;
+    # a few are older than the 30-day window
+    ReservationRepository().bulk_create(({
+        "user_id": user_id,
+        "spot_id": 1 + (user_id + j) % 50 + 50 * ((user_id % 2) ^ (j % 5 == 0)),
+        "parking_timestamp": now - timedelta(days=(j * 7) % 45, hours=1),
+        "leaving_timestamp": now - timedelta(days=(j * 7) % 45),
+        "parking_cost": 20.0 + j,
+        "vehicle_number": f"TN{user_id:06d}{j:02d}",
+        "payment_status": True,
+    } for user_id in user_ids if user_id % 7 for j in range(per_user)), chunk_size=10000)
+    db.session.commit()
+
+
+def run(fn):
+    with mail.record_messages() as outbox, captured_statements() as statements, timed() as elapsed:
+        fn()
+    return elapsed["seconds"], len(statements), sorted((m.recipients[0], m.html) for m in outbox)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--per-user", type=int, default=10)
+    args = parser.parse_args()
+
+    app, celery = create_bench_app()
+    celery.conf.task_always_eager = True
+    with app.test_request_context():
+        seed(args.users, args.per_user)
+        results = {}
+        for label, fn in (("per-user lazy", legacy_monthly_remainder), ("grouped chunks", monthly_remainder)):
+            db.session.expunge_all()
+            seconds, statements, emails = run(fn)
+            results[label] = emails
+            print(f"{label:>15}: {seconds:6.2f}s, {statements:6} SQL statements, {len(emails)} emails")
+        assert results["per-user lazy"] == results["grouped chunks"], "report bodies differ"
+        print("every report body matches")
+
+
+if __name__ == "__main__":
+    main()
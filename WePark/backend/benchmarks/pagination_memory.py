@@ -0,0 +1,83 @@
+# WePark/backend/benchmarks/pagination_memory.py
+"""
+Pagination Memory Benchmark
+Compares loading the whole reservations table with walking it by keyset pages
+
+Usage:
+    python -m benchmarks.pagination_memory --rows 1000000 --page-size 1000
+"""
+
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import User
+from app.repositories import ReservationRepository
+from app.services.lot_service import LotService
+from .common import create_bench_app, timed
+
+
+def seed(rows):
+    user = User(username="pager", email="pager@example.com", address="Bench", pincode=600001)
+    user.hash_password("password123")
+    db.session.add(user)
+    LotService().create_lot(prime_location="Pager Lot", price_per_hour=20, address="1 Road",
+                            pincode=600001, no_of_spots=100)
+    start = datetime(2020, 1, 1)
+    repo = ReservationRepository()
+    repo.bulk_create(({
+        "user_id": user.user_id,
+        "spot_id": 1 + i % 100,
+        "parking_timestamp": start + timedelta(minutes=i),
+        "leaving_timestamp": start + timedelta(minutes=i + 45),
+        "parking_cost": 15.0,
+        "vehicle_number": f"TN{i:08d}",
+        "payment_status": True,
+    } for i in range(rows)), chunk_size=10000)
+    repo.commit()
+
+
+def measure(fn):
+    db.session.expunge_all()
+    tracemalloc.start()
+    with timed() as elapsed:
+        count = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / 2**20, elapsed["seconds"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    repo = ReservationRepository()
+    with app.app_context():
+        with timed() as seeding:
+            seed(args.rows)
+        print(f"seeded {args.rows} reservations in {seeding['seconds']:.1f}s")
+
+        def load_all():
+            return len(repo.get_all())
+
+        def walk_pages():
+            count, after = 0, None
+            while True:
+                page = repo.get_all(limit=args.page_size, after=after)
+                if not page:
+                    return count
+                count += len(page)
+                after = page[-1].reservation_id
+                db.session.expunge_all()
+
+        for label, fn in (("get_all()", load_all), (f"pages of {args.page_size}", walk_pages)):
+            count, peak_mb, seconds = measure(fn)
+            print(f"{label:>16}: {count} rows, peak {peak_mb:8.1f} MiB, {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# WePark/backend/benchmarks/query_budgets.py
+"""
+Query Budget Check
+Calls every endpoint at two data sizes with query budgets enforced (as in
+TestingConfig) and the response cache cleared, and prints the statements
+each call ran; a call over its declared budget, or with an N+1 lazy load,
+raises QueryBudgetExceeded
+
+Usage:
+    python -m benchmarks.query_budgets --users 3 30
+"""
+
+import argparse
+
+from app import cache
+from .common import create_bench_app, admin_client, user_client, check, captured_statements
+
+
+LOTS = 3
+
+
+def seed(app, admin, first, count):
+    """Sign up users first..first+count-1, each with paid, unpaid and active bookings"""
+    clients = [user_client(app, f"budget{i}") for i in range(first, first + count)]
+    for client in clients:
+        for lot_id in range(1, LOTS + 1):
+            for paid in (True, False, None):
+                reservation = check(client.post("/api/reservation", json={"lot_id": lot_id}))
+                check(client.put(f"/api/reservation/{reservation['reservation_id']}"))
+                if paid is None:
+                    continue
+                body = {"reservation_id": reservation["reservation_id"]}
+                if paid:
+                    body["payment_id"] = "MOCK_budget"
+                check(client.post("/api/reservation", json=body))
+    return clients[0]
+
+
+def run_calls(app, admin, user):
+    """Call each endpoint once; returns [(statements, label)]"""
+    counts = []
+
+    def call(client, method, url, status=200, **kwargs):
+        cache.clear()
+        with app.app_context(), captured_statements() as statements:
+            response = getattr(client, method)(url, **kwargs)
+        check(response, status)
+        counts.append((len(statements), f"{method.upper()} {url}"))
+        return response
+
+    call(user, "get", "/api/reservation")
+    call(user, "get", "/api/reservation?active=true")
+    call(admin, "get", "/api/reservation")
+    call(admin, "get", "/api/reservation?payment_status=false")
+    call(admin, "get", "/api/reservation?limit=")
+    call(admin, "get", "/api/lot")
+    call(admin, "get", "/api/lot/1")
+    call(user, "get", "/api/spot/1")
+    call(admin, "get", "/api/user")
+    call(user, "get", "/api/user")
+    call(admin, "get", "/api/stats")
+    call(user, "get", "/api/stats")
+    call(user, "get", "/api/notification")
+    call(user, "get", "/api/export/download")
+    call(admin, "get", "/api/export/reservations?format=ndjson")
+
+    reservation = call(user, "post", "/api/reservation", json={"lot_id": 1}).get_json()
+    call(user, "put", f"/api/reservation/{reservation['reservation_id']}")
+    call(user, "post", "/api/reservation", json={"reservation_id": reservation["reservation_id"],
+                                                  "payment_id": "MOCK_budget"})
+    call(admin, "post", "/api/lot", 201, json={"prime_location": "Scratch", "price_per_hour": 20,
+                                               "address": "9 Road", "pincode": 600001, "no_of_spots": 40})
+    scratch = max(lot["lot_id"] for lot in check(admin.get("/api/lot")))
+    call(admin, "put", f"/api/lot/{scratch}", json={"price_per_hour": 25})
+    call(admin, "delete", f"/api/lot/{scratch}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs=2, default=[3, 30], help="small and large user counts")
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    assert app.config["QUERY_BUDGETS_ENABLED"]
+    admin = admin_client(app)
+    for i in range(LOTS):
+        check(admin.post("/api/lot", json={"prime_location": f"Budget Lot {i}", "price_per_hour": 20,
+                                           "address": f"{i} Road", "pincode": 600001,
+                                           "no_of_spots": 3 * max(args.users)}), 201)
+
+    small, large = args.users
+    user = seed(app, admin, 0, small)
+    before = run_calls(app, admin, user)
+    seed(app, admin, small, large - small)
+    after = run_calls(app, admin, user)
+
+    print(f"{'statements':>10} ({small} -> {large} users)")
+    grew = []
+    for (count, label), (count_after, _) in zip(before, after):
+        print(f"{count:>5} {count_after:>4}  {label}")
+        if count_after > count:
+            grew.append(label)
+    assert not grew, f"statement counts grew with data: {grew}"
+    print("every call stayed within its budget and constant in the data size")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# WePark/backend/benchmarks/query_plans.py
+"""
+Query Plan Check
+Runs each hot repository finder, captures its SQL and asserts through
+EXPLAIN QUERY PLAN that SQLite searches an index instead of scanning
+
+Usage:
+    python -m benchmarks.query_plans
+"""
+
+from app import db
+from app.repositories import (
+    ReservationRepository, SpotRepository, UserRepository, NotificationRepository,
+)
+from .common import create_bench_app, captured_statements
+
+
+def full_scans(statement, parameters):
+    rows = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    details = [row[-1] for row in rows]
+    return [detail for detail in details if detail.startswith("SCAN")], details
+
+
+def main():
+    app, _ = create_bench_app()
+    reservations = ReservationRepository()
+    spots = SpotRepository()
+    users = UserRepository()
+    notifications = NotificationRepository()
+
+    finders = {
+        "ReservationRepository.find_by_user": lambda: reservations.find_by_user(1),
+        "ReservationRepository.find_active_by_user": lambda: reservations.find_active_by_user(1),
+        "ReservationRepository.find_by_spot": lambda: reservations.find_by_spot(1),
+        "ReservationRepository.find_active_by_spot": lambda: reservations.find_active_by_spot(1),
+        "ReservationRepository.get_user_history": lambda: reservations.get_user_history(1),
+        "ReservationRepository.count_active_reservations": lambda: reservations.count_active_reservations(1),
+        "ReservationRepository.find_by_payment_status": lambda: reservations.find_by_payment_status(True),
+        "SpotRepository.find_by_lot": lambda: spots.find_by_lot(1),
+        "SpotRepository.find_available_spots": lambda: spots.find_available_spots(1),
+        "SpotRepository.find_occupied_spots": lambda: spots.find_occupied_spots(1),
+        "SpotRepository.find_first_available": lambda: spots.find_first_available(1),
+        "SpotRepository.count_available_spots": lambda: spots.count_available_spots(1),
+        "SpotRepository.count_occupied_spots": lambda: spots.count_occupied_spots(1),
+        "UserRepository.find_by_username": lambda: users.find_by_username("someone"),
+        "UserRepository.find_by_email": lambda: users.find_by_email("someone@example.com"),
+        "UserRepository.find_by_username_or_email": lambda: users.find_by_username_or_email("someone"),
+        "UserRepository.find_by_pincode": lambda: users.find_by_pincode(600001),
+        "NotificationRepository.find_by_user": lambda: notifications.find_by_user(1),
+        "NotificationRepository.count_unread": lambda: notifications.count_unread(1),
+    }
+
+    failures = 0
+    with app.app_context():
+        for name, finder in finders.items():
+            with captured_statements(selects_only=True) as statements:
+                finder()
+            for statement, parameters in statements:
+                scans, details = full_scans(statement, parameters)
+                status = "FAIL" if scans else "ok"
+                failures += bool(scans)
+                print(f"{status:>4}  {name}: {'; '.join(details)}")
+
+    if failures:
+        raise SystemExit(f"{failures} finder(s) scan a full table")
+
+
+if __name__ == "__main__":
+    main()
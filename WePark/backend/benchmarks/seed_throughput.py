@@ -0,0 +1,80 @@
+# WePark/backend/benchmarks/seed_throughput.py
+"""
+Seed Throughput
+Runs the `flask seed` generator on a fresh file-backed database, reports
+rows per minute for each phase and checks the generated data is consistent
+(every reservation completed in the past, no two overlapping on a spot, lot
+counters and the daily usage rollup matching the reservations)
+
+Usage:
+    python -m benchmarks.seed_throughput --reservations 1000000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+from sqlalchemy import func, select
+from app import db
+from app.models import Reservation, DailyLotUsage
+from app.services import LotService, SeedService
+from .common import create_bench_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--lots", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    marks = {}
+    started = time.perf_counter()
+
+    def progress(table, rows):
+        marks[table] = (rows, time.perf_counter() - started)
+
+    with app.app_context():
+        result = SeedService(random.Random(42), progress).seed(
+            lots=args.lots, spots_per_lot=100, users=args.users, reservations=args.reservations,
+            chunk_size=args.chunk_size
+        )
+        total = time.perf_counter() - started
+        assert result["success"], result
+
+        previous = 0.0
+        for table in ("lots", "spots", "users", "reservations"):
+            rows, at = marks[table]
+            seconds = at - previous
+            previous = at
+            rate = rows / seconds * 60 if seconds else float("inf")
+            print(f"{table:>12}: {rows:>9} rows in {seconds:6.2f}s ({rate:>12,.0f} rows/min)")
+        print(f"{'rollup':>12}: {result['usage_rows']:>9} rows in {total - previous:6.2f}s "
+              f"(includes rebuilding reservation indexes)")
+        print(f"{'total':>12}: {args.reservations / total * 60:,.0f} reservations/min end to end")
+
+        assert db.session.query(func.count(Reservation.reservation_id)).scalar() == args.reservations
+        latest = db.session.query(func.max(Reservation.leaving_timestamp)).scalar()
+        assert latest is None or latest <= datetime.now(), latest
+        # A reservation overlaps an earlier one on its spot when it starts
+        # before the latest leaving time among them
+        earlier_leaving = func.max(Reservation.leaving_timestamp).over(
+            partition_by=Reservation.spot_id,
+            order_by=(Reservation.parking_timestamp, Reservation.reservation_id), rows=(None, -1)
+        )
+        ordered = select(Reservation.parking_timestamp.label("parked"),
+                         earlier_leaving.label("earlier_leaving")).subquery()
+        overlaps = db.session.query(func.count()).select_from(ordered) \
+            .filter(ordered.c.parked < ordered.c.earlier_leaving).scalar()
+        assert not overlaps, f"{overlaps} reservation(s) overlap another on the same spot"
+        assert not LotService().repair_spot_counts(dry_run=True), "lot counters drifted"
+        completed = db.session.query(func.coalesce(func.sum(DailyLotUsage.completed), 0)).scalar()
+        assert completed == args.reservations, (completed, args.reservations)
+    print("every reservation is completed in the past, alone on its spot and counted once in the rollup")
+
+
+if __name__ == "__main__":
+    main()
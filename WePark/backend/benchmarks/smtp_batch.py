@@ -0,0 +1,95 @@
+# WePark/backend/benchmarks/smtp_batch.py
+"""
+Batched SMTP Sender Benchmark
+Sends the same recipients through one connection per message (mail.send)
+and through batch_email_sender against a local SMTP stand-in that closes
+the connection (421) every so often
+
+Requires aiosmtpd (pip install aiosmtpd), which the app itself does not use.
+
+Usage:
+    python -m benchmarks.smtp_batch --recipients 10000 --drop-every 2500
+"""
+
+import argparse
+import socket
+
+from app import mail
+from app.utils.email import batch_email_sender, build_message
+from .common import create_bench_app, timed
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:  # pragma: no cover - benchmark-only dependency
+    Controller = None
+
+
+class CountingHandler:
+    """Accepts every message, answering 421 to every drop_every-th one"""
+
+    def __init__(self, drop_every):
+        self.drop_every = drop_every
+        self.received = 0
+        self.seen = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.seen += 1
+        if self.drop_every and self.seen % self.drop_every == 0:
+            return "421 Service closing transmission channel"
+        self.received += 1
+        return "250 OK"
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipients", type=int, default=10_000)
+    parser.add_argument("--drop-every", type=int, default=2500, help="421 every Nth message (0 = never)")
+    parser.add_argument("--max-per-connection", type=int, default=100)
+    args = parser.parse_args()
+    if Controller is None:
+        parser.error("aiosmtpd is required: pip install aiosmtpd")
+
+    handler = CountingHandler(args.drop_every)
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+
+    app, _ = create_bench_app()
+    app.config["MAIL_RETRY_BACKOFF"] = 0.01
+    state = app.extensions["mail"]
+    state.suppress, state.server, state.port = False, controller.hostname, controller.port
+    state.debug = False  # smtplib protocol tracing would dominate the timings
+    try:
+        with app.test_request_context():
+            def messages():
+                return (build_message(f"driver{i}@example.com", "New Lot in your Area",
+                                      "<p>A new lot opened near you.</p>", is_html=True)
+                        for i in range(args.recipients))
+
+            handler.received = handler.seen = 0
+            with timed() as elapsed:
+                for message in messages():
+                    try:
+                        mail.send(message)
+                    except Exception:
+                        pass
+            print(f"   mail.send per message: {handler.received:6} delivered, "
+                  f"{handler.received / elapsed['seconds']:8,.0f} msg/s")
+
+            handler.received = handler.seen = 0
+            with timed() as elapsed:
+                result = batch_email_sender(messages(), max_per_connection=args.max_per_connection)
+            print(f"batch_email_sender ({args.max_per_connection}/conn): {handler.received:6} delivered, "
+                  f"{handler.received / elapsed['seconds']:8,.0f} msg/s, {len(result['failed'])} failed")
+            assert result["sent"] == handler.received == args.recipients, result["sent"]
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
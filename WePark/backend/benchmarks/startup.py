@@ -0,0 +1,95 @@
+# WePark/backend/benchmarks/startup.py
+"""
+Startup Time
+Times a cold start of the real entry point in fresh processes: importing
+`run`, building the app and serving the first request (GET /), and counts
+the SQL statements startup issues (expected: none)
+
+The database URI points at a file that does not exist, so any schema
+introspection or admin lookup at boot would show up as statements.
+
+Usage:
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+
+
+def probe() -> Dict[str, Any]:
+    """Cold start in this process; must run before anything imports app"""
+    started = time.perf_counter()
+    import run
+    imported = time.perf_counter()
+
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    statements = []
+    event.listen(Engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    app = run.create_app()
+    created = time.perf_counter()
+    response = app.test_client().get("/")
+    assert response.status_code == 200, response.status_code
+    finished = time.perf_counter()
+    return {
+        "import_ms": (imported - started) * 1000,
+        "create_app_ms": (created - imported) * 1000,
+        "first_request_ms": (finished - created) * 1000,
+        "total_ms": (finished - started) * 1000,
+        "sql_statements": len(statements),
+    }
+
+
+def measure(runs: int) -> Dict[str, Any]:
+    """
+    Median cold start over several fresh processes
+
+    Returns:
+        Dictionary of median timings in ms, plus the process wall time
+        (interpreter start included) and the most statements seen
+    """
+    samples = []
+    with tempfile.TemporaryDirectory(prefix="wepark-startup-") as tmp:
+        env = dict(os.environ, SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(tmp, 'absent.db')}")
+        for _ in range(runs):
+            started = time.perf_counter()
+            output = subprocess.run([sys.executable, "-m", "benchmarks.startup", "--probe"], env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            sample = json.loads(output.strip().splitlines()[-1])
+            sample["process_ms"] = (time.perf_counter() - started) * 1000
+            samples.append(sample)
+    result = {key: round(statistics.median(sample[key] for sample in samples), 1)
+              for key in samples[0] if key != "sql_statements"}
+    result["sql_statements"] = max(sample["sql_statements"] for sample in samples)
+    result["runs"] = runs
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe()))
+        return
+
+    result = measure(args.runs)
+    print(f"median of {args.runs} cold starts: import {result['import_ms']:.0f} ms, "
+          f"create_app {result['create_app_ms']:.0f} ms, first request {result['first_request_ms']:.0f} ms "
+          f"({result['total_ms']:.0f} ms in process, {result['process_ms']:.0f} ms with interpreter)")
+    print(f"SQL statements during startup: {result['sql_statements']}")
+    assert result["sql_statements"] == 0, "startup touched the database"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# WePark/backend/benchmarks/stats_query_count.py
+"""
+Stats Query Count Check
+Asserts that the user dashboard issues the same number of SQL statements
+however long the user's reservation history is
+
+Usage:
+    python -m benchmarks.stats_query_count --sizes 10 100 1000 10000
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from app import cache
+from app.models import User
+from app.repositories import ReservationRepository
+from app.services.lot_service import LotService
+from .common import create_bench_app, user_client, check, captured_statements, timed
+
+
+def add_history(user_id, count, spot_ids):
+    start = datetime.now() - timedelta(days=120)
+    repo = ReservationRepository()
+    repo.bulk_create(({
+        "user_id": user_id,
+        "spot_id": spot_ids[i % len(spot_ids)],
+        "parking_timestamp": start + timedelta(minutes=7 * i % 172800),
+        "leaving_timestamp": start + timedelta(minutes=7 * i % 172800 + 60),
+        "parking_cost": 40.0,
+        "vehicle_number": f"TN{i:08d}",
+        "payment_status": True,
+    } for i in range(count)), chunk_size=5000)
+    repo.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    with app.app_context():
+        for i in range(3):
+            LotService().create_lot(prime_location=f"Stats Lot {i}", price_per_hour=20,
+                                    address=f"{i} Road", pincode=600001, no_of_spots=10)
+        spot_ids = list(range(1, 31))
+
+    counts = {}
+    for size in args.sizes:
+        username = f"stats_{size}"
+        client = user_client(app, username)
+        with app.app_context():
+            user_id = User.query.filter_by(username=username).one().user_id
+            add_history(user_id, size, spot_ids)
+
+        cache.clear()
+        with app.app_context(), captured_statements() as statements, timed() as elapsed:
+            check(client.get("/api/stats"))
+        counts[size] = len(statements)
+        print(f"{size:>7} reservations: {len(statements)} statements, {elapsed['seconds'] * 1000:.1f} ms")
+
+    if len(set(counts.values())) != 1:
+        raise SystemExit(f"statement count grows with history: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# WePark/backend/benchmarks/template_render.py
+"""
+Email Template Rendering Micro-benchmark
+Renders the daily and monthly emails per recipient with render_template,
+with a cached compiled template, and from a pre-rendered page, checking
+that all three produce the same HTML
+
+Usage:
+    python -m benchmarks.template_render --renders 20000
+"""
+
+import argparse
+from datetime import datetime
+from types import SimpleNamespace
+
+from flask import render_template
+from app.utils.email_templates import Field, PrerenderedTemplate, get_compiled_template
+from .common import create_bench_app, timed
+
+
+def recipients(count):
+    # Usernames with markup prove per-user fields are still escaped
+    return [SimpleNamespace(username=f"driver<{i}>&co", email=f"driver{i}@example.com") for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20_000)
+    args = parser.parse_args()
+
+    app, _ = create_bench_app()
+    users = recipients(args.renders)
+    lot = SimpleNamespace(prime_location="Marina <Beach>", address="1 Road", no_of_spots=40,
+                          created_at=datetime(2025, 5, 1, 9, 30))
+    url = "http://localhost:5173/dashboard/available_lots"
+    monthly = {"report_month": "May", "monthly_cost": 240.5, "most_visited_lot": "Marina",
+               "total_reservation": 7}
+
+    cases = {
+        "daily_remainder.html": (
+            lambda user: render_template("daily_remainder.html", user=user, lot=lot, url=url),
+            lambda user: get_compiled_template("daily_remainder.html").render(user=user, lot=lot, url=url),
+            lambda: PrerenderedTemplate("daily_remainder.html", lot=lot, url=url, user=Field("user")),
+            lambda page, user: page.render(user=user),
+        ),
+        "monthly_report.html": (
+            lambda user: render_template("monthly_report.html", user=user, **monthly),
+            lambda user: get_compiled_template("monthly_report.html").render(user=user, **monthly),
+            lambda: PrerenderedTemplate("monthly_report.html", report_month="May", user=Field("user"),
+                                        monthly_cost=Field("monthly_cost"),
+                                        most_visited_lot=Field("most_visited_lot"),
+                                        total_reservation=Field("total_reservation")),
+            lambda page, user: page.render(user=user, **{k: v for k, v in monthly.items() if k != "report_month"}),
+        ),
+    }
+
+    with app.test_request_context():
+        for name, (flask_render, compiled_render, prerender, fill) in cases.items():
+            outputs = {}
+            with timed() as elapsed:
+                outputs["render_template"] = [flask_render(user) for user in users]
+            rates = {"render_template": args.renders / elapsed["seconds"]}
+            with timed() as elapsed:
+                outputs["compiled"] = [compiled_render(user) for user in users]
+            rates["compiled"] = args.renders / elapsed["seconds"]
+            with timed() as elapsed:
+                page = prerender()
+                outputs["pre-rendered"] = [fill(page, user) for user in users]
+            rates["pre-rendered"] = args.renders / elapsed["seconds"]
+
+            assert outputs["render_template"] == outputs["compiled"] == outputs["pre-rendered"], name
+            print(name)
+            for label, rate in rates.items():
+                print(f"  {label:>15}: {rate:>10,.0f} renders/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,37 @@
 #WePark/backend/run.py
+"""
+Application entry point
+
+Nothing is built at import time. `flask --app run` finds create_app, WSGI
+servers can use `run:create_app()`, and `run.app` / `run.celery` (as in
+`celery -A run.celery worker`) build the app on first access.
+"""
 
 from app import app_creator
 from app.config import Configuration
 
-app, celery = app_creator(Configuration)
+_created = None
+
+
+def create_app():
+    """Build the Flask app once per process and return it"""
+    return _create()[0]
+
+
+def _create():
+    global _created
+    if _created is None:
+        _created = app_creator(Configuration)
+    return _created
+
+
+def __getattr__(name):
+    if name == "app":
+        return _create()[0]
+    if name == "celery":
+        return _create()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    app.run(debug=True,port=1437)
\ No newline at end of file
+    create_app().run(debug=True,port=1437)